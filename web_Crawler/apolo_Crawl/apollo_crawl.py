@@ -1,64 +1,342 @@
-from playwright.sync_api import sync_playwright
-import json, os, time, random
+"""Download Apollo company search pages as gzipped HTML, resumably and in parallel.
 
-def load_cookies(context, cookies_path):
+Usage (from the repository root, with cookies exported from a logged-in session):
+
+    python -m web_Crawler.apolo_Crawl.apollo_crawl --config web_Crawler/config/apollo_config.yaml
+
+Every ``(query, page)`` from APOLLO_QUERIES is one unit of work. APOLLO_CONTEXTS
+cookie-authenticated contexts pull units off a shared queue, spend one token
+of the APOLLO_PAGES_PER_MINUTE budget per page, open the page's URL and wait
+until the result rows differ from whatever the tab showed before. Each page
+is written to ``<APOLLO_OUT_DIR>/<query>/page_0001.html.gz`` and recorded in
+``checkpoint.json``, so a rerun only fetches pages that are still missing.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+from urllib.parse import urlencode
+
+from playwright.async_api import async_playwright
+
+from web_Crawler.crawl_website.browser_service import acquire_browser, launch_profile
+from web_Crawler.crawl_website.wait_engine import WaitEngine
+from web_Crawler.utils.rate_limit import HostThrottle, host_of
+from web_Crawler.utils.utils import load_config, prepare_log
+
+DEFAULT_BASE_URL = "https://app.apollo.io/#/companies"
+
+ROW_SEPARATOR = "\x1e"
+
+# Text of the result rows (header rows excluded); changes whenever a new page has rendered.
+ROW_TEXTS_JS = """
+(rowSelector) => [...document.querySelectorAll(rowSelector)]
+    .filter((row) => !row.querySelector('th, [role="columnheader"]'))
+    .map((row) => row.innerText.trim())
+    .filter(Boolean)
+"""
+
+ROWS_CHANGED_JS = f"""
+([rowSelector, before]) => {{
+    const texts = ({ROW_TEXTS_JS.strip()})(rowSelector);
+    return texts.length > 0 && texts.join("\\x1e") !== before;
+}}
+"""
+
+
+class ApolloAuthError(RuntimeError):
+    """Apollo redirected to its login page; the cookies are missing or expired."""
+
+
+async def load_cookies(context, cookies_path):
     """Load cookies exported from your logged-in Apollo session."""
     with open(cookies_path, "r", encoding="utf-8") as f:
         cookies = json.load(f)
     for cookie in cookies:
         if "sameSite" in cookie and cookie["sameSite"] not in ["Lax", "Strict", "None"]:
             cookie["sameSite"] = "Lax"
-    context.add_cookies(cookies)
+    await context.add_cookies(cookies)
+
+
+def page_url(base_url, params, page_num):
+    """Search URL for one result page; Apollo keeps the query in the hash fragment."""
+    query = urlencode({**(params or {}), "page": page_num}, doseq=True, safe="[]")
+    return f"{base_url}?{query}"
+
+
+def plan_pages(queries):
+    """Expand APOLLO_QUERIES into ``(name, params, page)`` units, query by query."""
+    units = []
+    seen = set()
+    for query in queries or []:
+        name = query["NAME"]
+        if name in seen:
+            raise ValueError(f"Duplicate Apollo query name: {name}")
+        seen.add(name)
+        first, last = query.get("PAGES", [1, 1])
+        units.extend((name, query.get("PARAMS") or {}, page) for page in range(int(first), int(last) + 1))
+    return units
+
+
+def write_gzip_html(path, html):
+    """Compress ``html`` into ``path`` atomically; returns the compressed size in bytes."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+        f.write(html)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def read_gzip_html(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return f.read()
+
 
-def download_apollo_html():
-    save_dir = "apollo_html"
-    os.makedirs(save_dir, exist_ok=True)
+class DownloadCheckpoint:
+    """Saved pages per query in a JSON file that is replaced atomically after every page."""
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        load_cookies(context, "apollo_cookies.json")
+    def __init__(self, path):
+        self.path = path
+        self.pages = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.pages = json.load(f).get("pages", {})
 
-        page = context.new_page()
-        page.goto("https://app.apollo.io/#/companies?organizationLocations[]=Vietnam&page=1&sortAscending=false&sortByField=recommendations_score", timeout=120000)
-        time.sleep(15)  # Wait for React to load
+    def is_done(self, name, page_num, out_dir=None):
+        entry = self.pages.get(name, {}).get(str(page_num))
+        if entry is None:
+            return False
+        # A page whose file was deleted is fetched again.
+        return out_dir is None or os.path.exists(os.path.join(out_dir, entry["file"]))
 
-        for page_num in range(1, 11):
+    def mark(self, name, page_num, file, **details):
+        self.pages.setdefault(name, {})[str(page_num)] = {"file": file, "saved_at": time.time(), **details}
+        self.save()
+
+    def last_page(self, name):
+        """Highest page saved for ``name`` (0 when none)."""
+        return max((int(page) for page in self.pages.get(name, {})), default=0)
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"pages": self.pages}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class ApolloDownloader:
+    """Fetches every planned search page with several contexts under one rate budget."""
+
+    def __init__(
+        self,
+        queries,
+        cookies_path,
+        out_dir,
+        base_url=DEFAULT_BASE_URL,
+        contexts=2,
+        pages_per_minute=6,
+        burst=1,
+        retries=3,
+        headless=False,
+        launch_args=None,
+        service_url=None,
+        timeout_ms=120000,
+        page_timeout_ms=60000,
+        row_selector='[role="row"], table tbody tr',
+        table_selector='[role="table"], table',
+        logger=None,
+    ):
+        self.units = plan_pages(queries)
+        self.cookies_path = cookies_path
+        self.out_dir = out_dir
+        self.base_url = base_url
+        self.contexts = max(1, int(contexts))
+        # The page budget is a ceiling: 429s, 5xx and timeouts lower rate and concurrency below it.
+        self.throttle = HostThrottle(
+            host_of(base_url),
+            rate=(pages_per_minute or 0) / 60.0,
+            burst=burst,
+            concurrency=self.contexts,
+            max_concurrency=self.contexts,
+        )
+        self.retries = max(1, int(retries))
+        self.headless = headless
+        self.launch_args = list(launch_args or [])
+        self.service_url = service_url
+        self.timeout_ms = timeout_ms
+        self.page_timeout_ms = page_timeout_ms
+        self.row_selector = row_selector
+        self.table_selector = table_selector
+        self.logger = logger
+        self.waits = WaitEngine()
+        self.checkpoint = DownloadCheckpoint(os.path.join(out_dir, "checkpoint.json"))
+        self.stats = {"planned": len(self.units), "skipped": 0, "saved": 0, "retries": 0, "failed": 0, "bytes": 0}
+
+    @classmethod
+    def from_config(cls, config, logger=None):
+        save_root = str(config.get("SAVE_ROOT_DIR", "."))
+        profile = launch_profile(config)
+        return cls(
+            config.get("APOLLO_QUERIES", []),
+            cookies_path=os.path.join(save_root, config.get("APOLLO_COOKIES", "apollo_cookies.json")),
+            out_dir=os.path.join(save_root, config.get("APOLLO_OUT_DIR", "apollo_html")),
+            base_url=config.get("APOLLO_BASE_URL", DEFAULT_BASE_URL),
+            contexts=config.get("APOLLO_CONTEXTS", 2),
+            pages_per_minute=config.get("APOLLO_PAGES_PER_MINUTE", 6),
+            burst=config.get("APOLLO_BURST", 1),
+            retries=config.get("APOLLO_RETRIES", 3),
+            headless=profile["headless"],
+            launch_args=profile["args"],
+            service_url=config.get("BROWSER_SERVICE_URL"),
+            timeout_ms=config.get("TIMEOUT", 120000),
+            page_timeout_ms=config.get("APOLLO_PAGE_TIMEOUT_MS", 60000),
+            row_selector=config.get("APOLLO_ROW_SELECTOR", '[role="row"], table tbody tr'),
+            table_selector=config.get("APOLLO_TABLE_SELECTOR", '[role="table"], table'),
+            logger=logger,
+        )
+
+    def _log(self, level, message):
+        if self.logger is not None:
+            getattr(self.logger, level)(message)
+        else:
+            print(message)
+
+    def pending_units(self):
+        """Units not yet in the checkpoint, logging where each query resumes."""
+        pending = [unit for unit in self.units if not self.checkpoint.is_done(unit[0], unit[2], self.out_dir)]
+        self.stats["skipped"] = len(self.units) - len(pending)
+        for name in dict.fromkeys(unit[0] for unit in self.units):
+            last = self.checkpoint.last_page(name)
+            if last:
+                self._log("info", f"♻️ {name}: resuming after saved page {last}")
+        return pending
+
+    def file_for(self, name, page_num):
+        return os.path.join(name, f"page_{page_num:04d}.html.gz")
+
+    async def run(self):
+        """Download every pending page; returns ``stats``."""
+        queue = asyncio.Queue()
+        for unit in self.pending_units():
+            queue.put_nowait((unit, 1))
+        if queue.empty():
+            self._log("info", "✅ Every planned Apollo page is already saved")
+            return self.stats
+
+        started = time.perf_counter()
+        async with async_playwright() as p:
+            browser, mode = await acquire_browser(
+                p, self.service_url, {"headless": self.headless, "args": self.launch_args}
+            )
+            self.stats["browser"] = mode
+            self.stats["startup_seconds"] = round(time.perf_counter() - started, 3)
             try:
-                print(f"\n🔹 Saving page {page_num} ...")
-                # Save HTML
-                html = page.content()
-                print("Read html file content")
-                file_path = os.path.join(save_dir, f"apollo_page_{page_num}.html")
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(html)
-                print(f"✅ Saved {file_path}")
-
-                if page_num < 10:
-                    # Click the "Next" button using the class you provided
-                    next_button = page.query_selector('button[aria-label="Next"], button.zp_NbJqo.zp_hgBYR[aria-label="Next"]')
-                    print(f"➡️ Navigating to page {page_num + 1} ...")
-                    if next_button:
-                        next_button.click()
-                        # Wait for the page number to update in the pagination control
-                        page.wait_for_selector(f'span.zp_CsEot:has-text("{page_num + 1}")', timeout=60000)
-                        # Wait for company list to update (optional: wait for a short time)
-                        time.sleep(5)
+                workers = [
+                    asyncio.create_task(self._worker(browser, queue, slot))
+                    for slot in range(min(self.contexts, queue.qsize()))
+                ]
+                try:
+                    await asyncio.gather(*workers)
+                except BaseException:
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+                    raise
+            finally:
+                await browser.close()
+
+        self.stats["throttle"] = self.throttle.summary()
+        self.stats["seconds"] = round(time.perf_counter() - started, 1)
+        self._log("info", f"🎉 Apollo download done: {self.stats}")
+        return self.stats
+
+    async def _worker(self, browser, queue, slot):
+        """One cookie-authenticated context working through the shared queue."""
+        context = await browser.new_context()
+        context.on("response", self._observe_response)
+        try:
+            await load_cookies(context, self.cookies_path)
+            page = await context.new_page()
+            signature = ""
+            while True:
+                try:
+                    (name, params, page_num), attempt = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    signature = await self._fetch(page, name, params, page_num, signature, first=not signature)
+                except ApolloAuthError:
+                    raise
+                except Exception as e:
+                    if attempt < self.retries:
+                        self.stats["retries"] += 1
+                        self._log("warning", f"⚠️ [{slot}] {name} page {page_num} attempt {attempt} failed: {e}")
+                        queue.put_nowait(((name, params, page_num), attempt + 1))
+                        signature = ""
                     else:
-                        print("❌ Next button not found.")
-                        break
+                        self.stats["failed"] += 1
+                        self._log("error", f"❌ [{slot}] {name} page {page_num} gave up after {attempt} attempts: {e}")
+        finally:
+            await context.close()
+
+    def _observe_response(self, response):
+        """429/5xx from Apollo's own XHR traffic slow the downloader down as well."""
+        if host_of(response.url) == self.throttle.host:
+            self.throttle.observe_status(response.status)
+
+    async def _fetch(self, page, name, params, page_num, before, first=False):
+        """Open one result page, wait for its rows and save it; returns the row signature."""
+        url = page_url(self.base_url, params, page_num)
+        async with self.throttle.request() as ticket:
+            timeout = self.timeout_ms if first else self.page_timeout_ms
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            # Hash-only navigations inside the SPA have no response.
+            ticket.status = response.status if response is not None else None
+            if "/login" in page.url:
+                raise ApolloAuthError(f"Redirected to {page.url}; export fresh cookies to {self.cookies_path}")
+
+            # The SPA swaps rows in place, so wait for them to differ from the previous page's.
+            changed = await self.waits.condition(
+                page, ROWS_CHANGED_JS, [self.row_selector, before], timeout_ms=self.page_timeout_ms, name="apollo_rows"
+            )
+            if not changed:
+                raise TimeoutError(f"No new result rows within {self.page_timeout_ms} ms")
+            await self.waits.dom_quiet(page, self.table_selector, quiet_ms=500, timeout_ms=5000,
+                                       name="apollo_table_settle")
+
+            html = await page.content()
+            row_texts = await page.evaluate(ROW_TEXTS_JS, self.row_selector)
+        file = self.file_for(name, page_num)
+        size = await asyncio.to_thread(write_gzip_html, os.path.join(self.out_dir, file), html)
+        self.checkpoint.mark(name, page_num, file, bytes=size, rows=len(row_texts))
+        self.stats["saved"] += 1
+        self.stats["bytes"] += size
+        self._log("info", f"✅ {name} page {page_num} → {file} ({size / 1024:.0f} KiB)")
+        return ROW_SEPARATOR.join(row_texts)
+
+
+def download_apollo_html(config_path="web_Crawler/config/apollo_config.yaml"):
+    config = load_config(config_path)
+    save_root = str(config.get("SAVE_ROOT_DIR", "."))
+    logger = prepare_log(__name__, log_dir=os.path.join(save_root, "logs_apollo"))
+    downloader = ApolloDownloader.from_config(config, logger=logger)
+    return asyncio.run(downloader.run())
+
 
-                # random delay between pages (to look human)
-                delay = random.uniform(8, 14)
-                print(f"⏳ Waiting {delay:.1f}s before next page...")
-                time.sleep(delay)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default="web_Crawler/config/apollo_config.yaml")
+    args = parser.parse_args(argv)
 
-            except Exception as e:
-                print(f"❌ Error on page {page_num}: {e}")
-                time.sleep(10)
+    if sys.platform.startswith("win"):
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    download_apollo_html(args.config)
 
-        browser.close()
-        print("\n🎉 Done — all 10 pages downloaded.")
 
 if __name__ == "__main__":
-    download_apollo_html()
\ No newline at end of file
+    main()
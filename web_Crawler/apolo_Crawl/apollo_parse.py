@@ -0,0 +1,334 @@
+"""Turn saved Apollo search pages into one deduplicated file of company records.
+
+Usage (from the repository root):
+
+    python -m web_Crawler.apolo_Crawl.apollo_parse --config web_Crawler/config/apollo_config.yaml --workers 8
+
+Every ``*.html.gz`` (and legacy ``apollo_page_N.html``) under APOLLO_OUT_DIR
+is parsed in a process pool. Columns are read from the table header, so a
+reordered or extended Apollo table still maps onto the same fields. Records
+are streamed to ``<APOLLO_PARSE_OUT>.jsonl.gz`` or ``.parquet``, keeping the
+first row of every company. ``company_key`` and ``domain`` use the same
+normalisation as the HiringCafe company cache, so both datasets join on them.
+"""
+import argparse
+import gzip
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = None
+    pq = None
+
+from web_Crawler.crawl_website.company_cache import normalize_company, normalize_domain
+from web_Crawler.crawl_website.crawl_utils import make_soup
+from web_Crawler.utils.utils import load_config, prepare_log
+
+COMPANY_COLUMNS = [
+    "company_key",
+    "domain",
+    "apollo_id",
+    "name",
+    "website",
+    "linkedin_url",
+    "employee_count",
+    "industry",
+    "location",
+    "keywords",
+    "source_page",
+]
+
+# Header text (casefolded, leading "#" dropped) -> record field; other headers land in `extra`.
+HEADER_FIELDS = {
+    "company": "name",
+    "company name": "name",
+    "name": "name",
+    "employees": "employee_count",
+    "employee count": "employee_count",
+    "number of employees": "employee_count",
+    "industry": "industry",
+    "industries": "industry",
+    "company location": "location",
+    "location": "location",
+    "hq location": "location",
+    "keywords": "keywords",
+    "company keywords": "keywords",
+}
+
+HEADER_CELLS = 'th, [role="columnheader"]'
+ROWS = 'tr, [role="row"]'
+DATA_CELLS = 'td, [role="cell"], [role="gridcell"]'
+
+SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.S | re.I)
+ORG_ID_RE = re.compile(r"/organizations/([0-9a-f]{8,})", re.I)
+DIGITS_RE = re.compile(r"\d+")
+SOCIAL_HOSTS = ("linkedin.com", "facebook.com", "twitter.com", "x.com", "crunchbase.com", "apollo.io")
+PAGE_NUM_RE = re.compile(r"(\d+)\.html(?:\.gz)?$")
+
+
+def header_field(text):
+    return HEADER_FIELDS.get(" ".join(text.lstrip("#").casefold().split()))
+
+
+def parse_employee_count(text):
+    """``"1,200"`` -> 1200; ranges such as ``"51-200"`` keep their upper bound."""
+    numbers = DIGITS_RE.findall((text or "").replace(",", "").replace(".", ""))
+    return int(numbers[-1]) if numbers else None
+
+
+def _row_links(row):
+    """Apollo organisation id, LinkedIn URL and company website from a row's anchors."""
+    apollo_id = linkedin_url = website = None
+    for a in row.find_all("a", href=True):
+        href = a["href"]
+        match = ORG_ID_RE.search(href)
+        if match and apollo_id is None:
+            apollo_id = match.group(1)
+            continue
+        if not href.startswith(("http://", "https://")):
+            continue
+        host = normalize_domain(href) or ""
+        if host.endswith("linkedin.com"):
+            linkedin_url = linkedin_url or href
+        elif website is None and not any(host == s or host.endswith("." + s) for s in SOCIAL_HOSTS):
+            website = href
+    return apollo_id, linkedin_url, website
+
+
+def parse_apollo_page(html, source_page=None):
+    """Company records of one saved search page, in table order."""
+    soup = make_soup(SCRIPT_STYLE_RE.sub("", html))
+    headers = [cell.get_text(" ", strip=True) for cell in soup.select(HEADER_CELLS)]
+    if not headers:
+        return []
+
+    records = []
+    for row in soup.select(ROWS):
+        if row.select_one(HEADER_CELLS):
+            continue
+        cells = row.select(DATA_CELLS)
+        if not cells:
+            continue
+        record = {"extra": {}}
+        for header, cell in zip(headers, cells):
+            field = header_field(header)
+            # The name cell also holds LinkedIn/website icons; the organisation link has the bare name.
+            org_link = cell.find("a", href=ORG_ID_RE) if field == "name" else None
+            text = (org_link or cell).get_text(" ", strip=True)
+            if field is None:
+                if header and text:
+                    record["extra"][header] = text
+            elif field not in record:
+                record[field] = text or None
+
+        name = record.get("name")
+        if not name:
+            continue
+        apollo_id, linkedin_url, website = _row_links(row)
+        record.update({
+            "company_key": normalize_company(name),
+            "domain": normalize_domain(website),
+            "apollo_id": apollo_id,
+            "website": website,
+            "linkedin_url": linkedin_url,
+            "employee_count": parse_employee_count(record.get("employee_count")),
+            "source_page": source_page,
+        })
+        records.append(record)
+    return records
+
+
+def read_page(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+def parse_page_file(root, rel_path):
+    """Parse one saved page; returns ``(rel_path, records)`` or ``(rel_path, error)``."""
+    try:
+        return rel_path, parse_apollo_page(read_page(os.path.join(root, rel_path)), rel_path)
+    except Exception as e:
+        return rel_path, e
+
+
+def _parse_chunk(root, rel_paths):
+    return [parse_page_file(root, rel_path) for rel_path in rel_paths]
+
+
+def list_pages(root):
+    """Saved pages under ``root`` ordered by folder and page number."""
+    pages = []
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            if name.endswith((".html", ".html.gz")):
+                pages.append(os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/"))
+
+    def order(rel_path):
+        folder, _, name = rel_path.rpartition("/")
+        match = PAGE_NUM_RE.search(name)
+        return folder, int(match.group(1)) if match else 0, name
+
+    return sorted(pages, key=order)
+
+
+class CompanyDeduper:
+    """Remembers every company already emitted by Apollo id, domain and name key."""
+
+    def __init__(self):
+        self._seen = set()
+        self.duplicates = 0
+
+    def add(self, record):
+        """True the first time a company is seen."""
+        keys = [
+            ("apollo", record.get("apollo_id")),
+            ("domain", record.get("domain")),
+            ("name", record.get("company_key")),
+        ]
+        keys = [key for key in keys if key[1]]
+        if any(key in self._seen for key in keys):
+            self.duplicates += 1
+            return False
+        self._seen.update(keys)
+        return True
+
+
+class CompanyWriter:
+    """Streams company records into a file that only appears under its final name on close."""
+
+    suffix = ""
+
+    def __init__(self, path, batch_size=1000):
+        self.path = path if path.endswith(self.suffix) else path + self.suffix
+        self.tmp_path = f"{self.path}.inprogress"
+        self.batch_size = max(1, int(batch_size))
+        self.records = 0
+        self._buffer = []
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._open()
+
+    def write(self, record):
+        self._buffer.append(record)
+        self.records += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._write_batch(batch)
+
+    def close(self):
+        self.flush()
+        self._close()
+        os.replace(self.tmp_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonlGzCompanyWriter(CompanyWriter):
+    suffix = ".jsonl.gz"
+
+    def _open(self):
+        self._file = gzip.open(self.tmp_path, "wt", encoding="utf-8")
+
+    def _write_batch(self, batch):
+        self._file.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch))
+
+    def _close(self):
+        self._file.close()
+
+
+class ParquetCompanyWriter(CompanyWriter):
+    """One row group per batch; ``extra`` is kept as a JSON string."""
+
+    suffix = ".parquet"
+
+    def _open(self):
+        if pa is None:
+            raise RuntimeError("Parquet output needs pyarrow: pip install pyarrow")
+        self.schema = pa.schema(
+            [(name, pa.int64() if name == "employee_count" else pa.string()) for name in COMPANY_COLUMNS]
+            + [("extra", pa.string())]
+        )
+        self._writer = pq.ParquetWriter(self.tmp_path, self.schema, compression="zstd")
+
+    def _write_batch(self, batch):
+        columns = {name: [record.get(name) for record in batch] for name in COMPANY_COLUMNS}
+        columns["extra"] = [json.dumps(record["extra"], ensure_ascii=False) if record.get("extra") else None
+                            for record in batch]
+        self._writer.write_table(pa.table(columns, schema=self.schema))
+
+    def _close(self):
+        self._writer.close()
+
+
+WRITERS = {"jsonl": JsonlGzCompanyWriter, "parquet": ParquetCompanyWriter}
+
+
+def parse_pages(root, writer, workers=None, chunk_size=20, logger=None):
+    """Parse every page under ``root`` into ``writer``; returns a stats dict."""
+    pages = list_pages(root)
+    deduper = CompanyDeduper()
+    stats = {"pages": len(pages), "failed_pages": 0, "empty_pages": 0, "rows": 0, "companies": 0}
+    started = time.perf_counter()
+    chunks = [pages[i:i + chunk_size] for i in range(0, len(pages), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields chunks in submission order, so the first row of a company wins deterministically.
+        for results in executor.map(_parse_chunk, [root] * len(chunks), chunks):
+            for rel_path, records in results:
+                if isinstance(records, Exception):
+                    stats["failed_pages"] += 1
+                    if logger:
+                        logger.warning(f"⚠️ Could not parse {rel_path}: {records}")
+                    continue
+                if not records:
+                    stats["empty_pages"] += 1
+                stats["rows"] += len(records)
+                for record in records:
+                    if deduper.add(record):
+                        writer.write(record)
+                        stats["companies"] += 1
+    writer.close()
+
+    stats["duplicates"] = deduper.duplicates
+    stats["seconds"] = round(time.perf_counter() - started, 2)
+    stats["pages_per_minute"] = round(len(pages) / stats["seconds"] * 60) if stats["seconds"] else None
+    if logger:
+        logger.info(f"🏢 Parsed Apollo pages → {writer.path}: {stats}")
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default="web_Crawler/config/apollo_config.yaml")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    parser.add_argument("--format", choices=sorted(WRITERS), default=None, help="default: APOLLO_PARSE_FORMAT")
+    parser.add_argument("--out", default=None, help="output path without suffix (default: APOLLO_PARSE_OUT)")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    save_root = str(config.get("SAVE_ROOT_DIR", "."))
+    pages_dir = os.path.join(save_root, config.get("APOLLO_OUT_DIR", "apollo_html"))
+    out = args.out or os.path.join(save_root, config.get("APOLLO_PARSE_OUT", "apollo_companies"))
+    writer_cls = WRITERS[args.format or config.get("APOLLO_PARSE_FORMAT", "jsonl")]
+    logger = prepare_log(__name__, log_dir=os.path.join(save_root, "logs_apollo"))
+
+    if not os.path.isdir(pages_dir):
+        raise SystemExit(f"No saved Apollo pages at {pages_dir}; run apollo_crawl first")
+    parse_pages(pages_dir, writer_cls(out), workers=args.workers, logger=logger)
+
+
+if __name__ == "__main__":
+    main()
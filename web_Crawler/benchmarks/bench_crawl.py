@@ -0,0 +1,177 @@
+"""End-to-end crawl benchmark against the local hiring.cafe stand-in.
+
+Usage (from the repository root; needs ``playwright install chromium``):
+
+    python -m web_Crawler.benchmarks.bench_crawl --jobs 120 --latency-ms 40 --concurrency 4
+
+It starts ``fixture_server``, points ``HiringCaffeITCrawler`` at it with a
+throwaway SAVE_ROOT_DIR, runs discovery plus the detail crawl, and reports
+jobs/min, p50/p95 per-job latency, CPU seconds and peak RSS of the crawler
+and its browser processes. ``--out`` also writes the report as JSON so runs
+can be compared over time.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:  # CPU/RSS of the browser processes need psutil
+    psutil = None
+
+from web_Crawler.benchmarks.fixture_server import FixtureSite, serve_fixture_site
+from web_Crawler.crawl_website._hiring_caffe_IT_crawl import HiringCaffeITCrawler
+from web_Crawler.utils.utils import load_config
+
+DEFAULT_CONFIG = Path(__file__).resolve().parents[1] / "config" / "hiring_caffe_config.yaml"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class ResourceSampler:
+    """Samples CPU time and RSS of this process and its children (the browsers) on a thread."""
+
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.peak_rss = 0
+        self._cpu = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+
+    def _sample(self):
+        root = psutil.Process()
+        rss = 0
+        for proc in [root, *root.children(recursive=True)]:
+            try:
+                rss += proc.memory_info().rss
+                times = proc.cpu_times()
+                self._cpu[proc.pid] = times.user + times.system
+            except psutil.Error:
+                continue
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._sample()
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if psutil is not None:
+            self._thread.start()
+        self._started_cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        if psutil is not None:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+
+    @property
+    def cpu_seconds(self):
+        if psutil is None:
+            return time.process_time() - self._started_cpu
+        return sum(self._cpu.values())
+
+
+def bench_config(config_path, root_url, save_root, args):
+    config = load_config(config_path)
+    config.update({
+        "BASE_URL": f"{root_url}/?searchState=%7B%22dateFetchedPastNDays%22%3A-1%7D",
+        "SAVE_ROOT_DIR": save_root,
+        "HEADLESS": True,
+        "TIMEOUT": 30000,
+        "DISCOVERY_MODE": args.mode,
+        "API_RESPONSE_PATTERN": r"/api/search-jobs",
+        "DETAIL_CONCURRENCY": args.concurrency,
+        "SHARDS": [],
+        "SHARD_DIMENSIONS": {},
+        "SAVE_SNAPSHOTS": args.snapshots,
+        "PARSE_WORKERS": args.parse_workers,
+        # Measure the crawler, not the politeness budget.
+        "HOST_LIMITS": {"default": {"rate": 0, "concurrency": args.concurrency, "max_concurrency": args.concurrency}},
+    })
+    return config
+
+
+def run_benchmark(args):
+    site = FixtureSite(
+        jobs=args.jobs,
+        jobs_per_company=args.jobs_per_company,
+        companies_per_page=args.companies_per_page,
+        latency_ms=args.latency_ms,
+        api_latency_ms=args.api_latency_ms,
+    )
+    with serve_fixture_site(site) as root_url, tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as save_root:
+        crawler = HiringCaffeITCrawler(bench_config(args.config, root_url, save_root, args))
+        with ResourceSampler() as sampler:
+            started = time.perf_counter()
+            asyncio.run(crawler.crawl_website())
+            elapsed = time.perf_counter() - started
+        discovered = len(crawler.frontier)
+        crawler.frontier.close()
+
+    latencies = crawler.job_seconds
+    return {
+        "mode": args.mode,
+        "concurrency": args.concurrency,
+        "parse_workers": args.parse_workers,
+        "site_jobs": len(site.jobs),
+        "latency_ms": args.latency_ms,
+        "discovered": discovered,
+        "crawled": crawler.total_crawled,
+        "coverage": round(discovered / len(site.jobs), 3) if site.jobs else None,
+        "seconds": round(elapsed, 2),
+        "jobs_per_min": round(crawler.total_crawled / elapsed * 60, 1) if elapsed else None,
+        "p50_job_s": round(percentile(latencies, 50), 3) if latencies else None,
+        "p95_job_s": round(percentile(latencies, 95), 3) if latencies else None,
+        "cpu_s": round(sampler.cpu_seconds, 2),
+        "peak_rss_mib": round(sampler.peak_rss / 2**20, 1) if psutil is not None else None,
+        "server_requests": dict(site.requests),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default=str(DEFAULT_CONFIG))
+    parser.add_argument("--jobs", type=int, default=120, help="jobs served by the fixture site")
+    parser.add_argument("--jobs-per-company", type=int, default=3, help="jobs behind each carousel card")
+    parser.add_argument("--companies-per-page", type=int, default=10)
+    parser.add_argument("--latency-ms", type=int, default=30, help="delay added to every response")
+    parser.add_argument("--api-latency-ms", type=int, default=0, help="extra delay for search API pages")
+    parser.add_argument("--mode", choices=("api", "dom"), default="api")
+    parser.add_argument("--concurrency", type=int, default=4, help="DETAIL_CONCURRENCY")
+    parser.add_argument("--parse-workers", type=int, default=2, help="PARSE_WORKERS (0 parses inline)")
+    parser.add_argument("--snapshots", action="store_true", help="also save HTML snapshots")
+    parser.add_argument("--out", default=None, help="write the report as JSON here")
+    args = parser.parse_args(argv)
+
+    if sys.platform.startswith("win"):
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+    report = run_benchmark(args)
+    width = max(len(key) for key in report)
+    for key, value in report.items():
+        print(f"{key:<{width}}  {value}")
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
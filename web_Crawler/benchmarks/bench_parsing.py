@@ -0,0 +1,102 @@
+"""Parser micro-benchmark over saved HiringCafe job pages.
+
+Usage (from the repository root):
+
+    python -m web_Crawler.benchmarks.bench_parsing --fixtures path/to/html_dir --repeat 50
+
+Every ``*.html`` / ``*.html.gz`` file in the directory counts as one job page.
+Each mode runs the four field extractors (job sections, company table, job
+description, website fallback) per page and reports pages/sec and the peak
+Python heap measured with ``tracemalloc``.
+"""
+import argparse
+import gzip
+import time
+import tracemalloc
+from pathlib import Path
+
+from web_Crawler.benchmarks import legacy_parsers
+from web_Crawler.crawl_website import crawl_utils
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parents[1] / "test" / "fixtures"
+
+
+def load_pages(fixtures_dir):
+    pages = []
+    for path in sorted(Path(fixtures_dir).iterdir()):
+        if path.name.endswith(".html.gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                pages.append(f.read())
+        elif path.suffix == ".html":
+            pages.append(path.read_text(encoding="utf-8"))
+    return pages
+
+
+def run_legacy(html):
+    """The pre-engine path: every extractor parses its own copy with html.parser."""
+    legacy_parsers.legacy_parse_job_sections(html)
+    legacy_parsers.legacy_parse_company_info_table(html)
+    legacy_parsers.legacy_parse_job_description(html)
+    legacy_parsers.legacy_parse_website_fallback(html)
+
+
+def make_engine_runner(parser):
+    def run(html):
+        soup = crawl_utils.make_soup(html, parser)
+        crawl_utils.parse_job_sections(soup)
+        crawl_utils.parse_company_info_table(soup)
+        crawl_utils.parse_job_description(soup)
+        crawl_utils.parse_website_fallback(soup)
+    return run
+
+
+def available_modes():
+    modes = [
+        ("legacy html.parser x4", run_legacy),
+        ("engine html.parser x1", make_engine_runner("html.parser")),
+    ]
+    if crawl_utils.HTML_PARSER == "lxml":
+        modes.append(("engine lxml x1", make_engine_runner("lxml")))
+    return modes
+
+
+def bench_mode(run, pages, repeat):
+    """Return (pages_per_sec, peak_bytes) for one extractor mode."""
+    run(pages[0])  # warm caches and lazy imports
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            run(html)
+    elapsed = time.perf_counter() - started
+
+    # Memory is measured in a separate pass; tracemalloc would skew the timing.
+    tracemalloc.start()
+    for html in pages:
+        run(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (repeat * len(pages)) / elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="directory of saved job pages")
+    parser.add_argument("--repeat", type=int, default=50, help="passes over the fixture set per mode")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.fixtures)
+    if not pages:
+        raise SystemExit(f"No .html/.html.gz pages found in {args.fixtures}")
+
+    print(f"{len(pages)} pages x {args.repeat} repeats")
+    print(f"{'mode':<24}{'pages/sec':>12}{'peak MiB':>12}")
+    baseline = None
+    for name, run in available_modes():
+        rate, peak = bench_mode(run, pages, args.repeat)
+        baseline = baseline or rate
+        print(f"{name:<24}{rate:>12.1f}{peak / 2**20:>12.2f}   x{rate / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Local stand-in for hiring.cafe, for benchmarks and end-to-end tests.
+
+It serves the pieces of the site the crawler touches:
+
+* ``/`` — the search page: an infinite-scroll list of company cards. Each
+  card shows one job and pages through the company's other jobs with a
+  ">" button, like the real carousel.
+* ``/api/search-jobs?page=N`` — the JSON the search page loads while scrolling.
+* ``/viewjob/<id>`` — a job page with Job Info, Company Info and Job
+  Description tabs and a Website button that opens a popup.
+* ``/company-site/<slug>`` — the page the Website popup lands on.
+
+Every response waits ``latency_ms`` (plus ``api_latency_ms`` for the API)
+so network conditions can be emulated. Run it standalone with:
+
+    python -m web_Crawler.benchmarks.fixture_server --jobs 300 --latency-ms 50
+"""
+import argparse
+import html
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+LOCATIONS = ("Ho Chi Minh City, Vietnam", "Hanoi, Vietnam", "Da Nang, Vietnam or Remote, Vietnam")
+WORK_MODES = ("Remote", "Hybrid", "Onsite")
+EMPLOYMENT_TYPES = ("Full Time", "Part Time", "Contract")
+TITLES = ("Backend Engineer", "Data Analyst", "Frontend Developer", "DevOps Engineer", "QA Engineer")
+
+PIN_SVG = (
+    '<svg viewBox="0 0 24 24" class="w-4 h-4">'
+    '<path d="M15 10.5a3 3 0 1 1-6 0 3 3 0 0 1 6 0Z"></path>'
+    '<path d="M19.5 10.5c0 7.142-7.5 11.25-7.5 11.25S4.5 17.642 4.5 10.5a7.5 7.5 0 1 1 15 0Z"></path>'
+    "</svg>"
+)
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>HiringCafe (fixture)</title>
+<style>
+  div.relative { height: 180px; border: 1px solid #ddd; margin: 8px; padding: 8px; }
+</style>
+</head>
+<body>
+<div id="__next">
+  <div class="infinite-scroll-component"><div class="grid"></div></div>
+</div>
+<script>
+const CHEVRON = '<svg viewBox="0 0 24 24"><path d="m8.25 4.5 7.5 7.5-7.5 7.5"></path></svg>';
+const grid = document.querySelector("div.grid");
+const searchState = new URLSearchParams(location.search).get("searchState") || "{}";
+let nextPage = 1;
+let loading = false;
+let exhausted = false;
+
+function renderCard(company) {
+  const card = document.createElement("div");
+  card.className = "relative";
+  let idx = 0;
+  const draw = () => {
+    const job = company.jobs[idx];
+    const last = idx >= company.jobs.length - 1;
+    card.innerHTML =
+      `<div class="font-bold">${company.name}</div>` +
+      `<a href="/viewjob/${job.id}">${job.title}</a>` +
+      `<button ${last ? "disabled" : ""}>${CHEVRON}</button>`;
+    card.querySelector("button").addEventListener("click", () => {
+      if (idx < company.jobs.length - 1) {
+        idx += 1;
+        setTimeout(draw, 30);
+      }
+    });
+  };
+  draw();
+  return card;
+}
+
+async function loadNext() {
+  if (loading || exhausted) return;
+  loading = true;
+  const spinner = document.createElement("div");
+  spinner.setAttribute("role", "status");
+  document.body.appendChild(spinner);
+  try {
+    const res = await fetch(`/api/search-jobs?page=${nextPage}&searchState=${encodeURIComponent(searchState)}`);
+    const payload = await res.json();
+    const companies = new Map();
+    for (const job of payload.results) {
+      if (!companies.has(job.company)) companies.set(job.company, {name: job.company, jobs: []});
+      companies.get(job.company).jobs.push(job);
+    }
+    for (const company of companies.values()) grid.appendChild(renderCard(company));
+    exhausted = !payload.has_more;
+    nextPage += 1;
+  } finally {
+    spinner.remove();
+    loading = false;
+  }
+}
+
+window.addEventListener("scroll", () => {
+  if (window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 400) loadNext();
+});
+loadNext();
+</script>
+</body>
+</html>
+"""
+
+VIEWJOB_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title} | HiringCafe (fixture)</title></head>
+<body>
+<div id="__next">
+  <main class="flex flex-col max-w-4xl mx-auto p-4">
+    <div class="flex flex-col space-y-2">
+      <h2 class="text-2xl font-extrabold text-gray-900">{title}</h2>
+      <span class="text-xl font-semibold text-gray-700"><span class="text-gray-400">@</span> {company}</span>
+      <div class="flex items-center space-x-1 text-sm">{pin}<span>{location}</span></div>
+      <div class="flex flex-wrap gap-2 text-xs">
+        <span>{salary}</span><span>{work_mode}</span><span>{employment_type}</span><span>Posted {posted}</span>
+      </div>
+    </div>
+    <div class="flex space-x-4 border-b" role="tablist">
+      <button role="tab" data-tab="info">Job Info</button>
+      <button role="tab" data-tab="company">Company Info</button>
+      <button role="tab" data-tab="description">Job Description</button>
+    </div>
+    <section id="panel" class="mt-4 space-y-3">{info_panel}</section>
+    <div class="flex items-center gap-2"><button id="website">Website</button></div>
+  </main>
+</div>
+<script>
+const PANELS = {panels};
+const panel = document.getElementById("panel");
+document.querySelectorAll("[data-tab]").forEach((tab) => {{
+  tab.addEventListener("click", () => {{
+    panel.innerHTML = "";
+    setTimeout(() => {{ panel.innerHTML = PANELS[tab.dataset.tab]; }}, {render_ms});
+  }});
+}});
+document.getElementById("website").addEventListener("click", () => window.open({website}, "_blank"));
+</script>
+</body>
+</html>
+"""
+
+COMPANY_SITE_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{name}</title></head><body><h1>{name}</h1></body></html>
+"""
+
+
+class FixtureSite:
+    """Deterministic set of fake companies and jobs plus the HTML/JSON to serve them."""
+
+    def __init__(self, jobs=200, jobs_per_company=3, companies_per_page=10,
+                 latency_ms=0, api_latency_ms=0, render_ms=50):
+        self.jobs_per_company = max(1, jobs_per_company)
+        self.companies_per_page = max(1, companies_per_page)
+        self.latency_ms = latency_ms
+        self.api_latency_ms = api_latency_ms
+        self.render_ms = render_ms
+        self.jobs = [self._make_job(idx) for idx in range(jobs)]
+        self.by_id = {job["id"]: job for job in self.jobs}
+        self.requests = {"search": 0, "api": 0, "viewjob": 0, "company_site": 0, "other": 0}
+        self._lock = threading.Lock()
+
+    def _make_job(self, idx):
+        company_idx = idx // self.jobs_per_company
+        return {
+            "id": f"fx{idx:06d}",
+            "title": f"{TITLES[idx % len(TITLES)]} {idx}",
+            "company": f"Fixture Company {company_idx}",
+            "company_slug": f"fixture-company-{company_idx}",
+            "location": LOCATIONS[idx % len(LOCATIONS)],
+            "salary": f"${1000 + idx % 50 * 100}-${2000 + idx % 50 * 100}/mo",
+            "work_mode": WORK_MODES[idx % len(WORK_MODES)],
+            "employment_type": EMPLOYMENT_TYPES[idx % len(EMPLOYMENT_TYPES)],
+            "posted": f"{idx % 7 + 1}d ago",
+        }
+
+    @property
+    def job_ids(self):
+        return [job["id"] for job in self.jobs]
+
+    def count(self, kind):
+        with self._lock:
+            self.requests[kind] += 1
+
+    # ---------------- responses ----------------
+    def api_page(self, page):
+        per_page = self.companies_per_page * self.jobs_per_company
+        start = (page - 1) * per_page
+        results = [
+            {"id": job["id"], "title": job["title"], "company": job["company"]}
+            for job in self.jobs[start:start + per_page]
+        ]
+        return {"results": results, "page": page, "total": len(self.jobs), "has_more": start + per_page < len(self.jobs)}
+
+    def viewjob_html(self, job):
+        esc = {key: html.escape(str(value)) for key, value in job.items()}
+        info_panel = (
+            '<div><span class="font-bold">Responsibilities</span>'
+            f'<span class="text-sm">build and run {esc["title"]} services</span></div>'
+            '<div><span class="font-bold">Requirements Summary</span>'
+            '<span class="text-sm">3+ years experience; English</span></div>'
+        )
+        company_panel = (
+            '<table class="table-auto w-full text-sm"><tbody>'
+            f'<tr><td>Name</td><td>{esc["company"]}</td></tr>'
+            '<tr><td>Industries</td><td><a href="/?industry=software">Software</a><a href="/?industry=it">IT Services</a></td></tr>'
+            '<tr><td>Num Employees</td><td>201-500</td></tr>'
+            f'<tr><td>Linkedin Url</td><td><a href="https://www.linkedin.com/company/{esc["company_slug"]}">{esc["company_slug"]}</a></td></tr>'
+            "</tbody></table>"
+        )
+        description_panel = (
+            f'<div class="flex flex-col"><p>{esc["company"]} is hiring a {esc["title"]}.</p>'
+            "<p>Responsibilities: ship features, review code, keep services healthy.</p>"
+            "<p>Qualifications: a degree or equivalent experience.</p></div>"
+        )
+        panels = {"info": info_panel, "company": company_panel, "description": description_panel}
+        return VIEWJOB_PAGE.format(
+            pin=PIN_SVG,
+            info_panel=info_panel,
+            panels=json.dumps(panels),
+            render_ms=int(self.render_ms),
+            website=json.dumps(f"/company-site/{job['company_slug']}"),
+            **esc,
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    site = None  # set per server in serve_fixture_site
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        site = self.site
+        parts = urlsplit(self.path)
+        if site.latency_ms:
+            time.sleep(site.latency_ms / 1000)
+
+        if parts.path == "/":
+            site.count("search")
+            return self._send(200, SEARCH_PAGE)
+        if parts.path == "/api/search-jobs":
+            site.count("api")
+            if site.api_latency_ms:
+                time.sleep(site.api_latency_ms / 1000)
+            try:
+                page = max(1, int(parse_qs(parts.query).get("page", ["1"])[0]))
+            except ValueError:
+                page = 1
+            return self._send(200, json.dumps(site.api_page(page)), "application/json")
+        if parts.path.startswith("/viewjob/"):
+            job = site.by_id.get(parts.path.rsplit("/", 1)[-1])
+            if job is None:
+                site.count("other")
+                return self._send(404, "<h1>Not found</h1>")
+            site.count("viewjob")
+            return self._send(200, site.viewjob_html(job))
+        if parts.path.startswith("/company-site/"):
+            site.count("company_site")
+            return self._send(200, COMPANY_SITE_PAGE.format(name=html.escape(parts.path.rsplit("/", 1)[-1])))
+        site.count("other")
+        return self._send(404, "<h1>Not found</h1>")
+
+
+@contextmanager
+def serve_fixture_site(site, host="127.0.0.1", port=0):
+    """Serve ``site`` on a background thread; yields the root URL (``http://host:port``)."""
+    handler = type("FixtureHandler", (_Handler,), {"site": site})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True)
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--jobs-per-company", type=int, default=3)
+    parser.add_argument("--companies-per-page", type=int, default=10)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--api-latency-ms", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    site = FixtureSite(args.jobs, args.jobs_per_company, args.companies_per_page, args.latency_ms, args.api_latency_ms)
+    with serve_fixture_site(site, port=args.port) as root_url:
+        print(f"Serving {len(site.jobs)} fixture jobs at {root_url}/ (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
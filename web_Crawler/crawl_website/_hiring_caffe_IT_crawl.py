@@ -1,14 +1,41 @@
 import asyncio
 import json
+import logging
 import os
 import sys
-import hashlib
-from urllib.parse import urljoin
-from playwright.async_api import async_playwright
+import time
+from datetime import datetime
 
 from web_Crawler.crawl_website._crawler_base import CrawlerBase
-from web_Crawler.utils.utils import load_config, prepare_folder, prepare_log
+from web_Crawler.utils.utils import ProgressLogger, load_config, prepare_folder, prepare_log
+from web_Crawler.utils.metrics import Metrics
+from web_Crawler.utils.rate_limit import HostScheduler, host_of
+from web_Crawler.crawl_website.change_tracker import UNCHANGED, ChangeTracker
+from web_Crawler.crawl_website.company_cache import CompanyCache
+from web_Crawler.crawl_website.near_dup import NearDupIndex
 from web_Crawler.crawl_website.crawl_utils import crawl_full_job_with_tabs
+from web_Crawler.crawl_website.browser_pool import BrowserPool
+from web_Crawler.crawl_website.parse_pool import make_parser
+from web_Crawler.crawl_website.request_filter import RequestFilter
+from web_Crawler.crawl_website.wait_engine import WaitEngine
+from web_Crawler.crawl_website.api_discovery import ApiLinkCollector, DEFAULT_API_PATTERN
+from web_Crawler.crawl_website.frontier import CrawlFrontier
+from web_Crawler.crawl_website.result_sink import make_result_sink
+from web_Crawler.crawl_website.snapshot_store import SNAPSHOT_TABS, SnapshotStore
+from web_Crawler.crawl_website.link_harvester import LinkHarvester
+from web_Crawler.crawl_website.shard_planner import merge_shard_results, plan_shards_from_config
+from web_Crawler.crawl_website.carousel_expander import (
+    CARD_SELECTOR,
+    LIST_SELECTOR,
+    CarouselExpander,
+    find_expandable_cards,
+)
+
+# Scroll one viewport down and report whether the bottom of the document is reached
+SCROLL_STEP_JS = """() => {
+    window.scrollBy(0, window.innerHeight * 0.9);
+    return window.scrollY + window.innerHeight >= document.documentElement.scrollHeight - 2;
+}"""
 
 
 class HiringCaffeITCrawler(CrawlerBase):
@@ -20,149 +47,570 @@ class HiringCaffeITCrawler(CrawlerBase):
         prepare_folder(save_root, "logs_it_vn")
         self.res_dir = os.path.join(save_root, "result_it_vn")
         self.log_dir = os.path.join(save_root, "logs_it_vn")
-        self.logger = prepare_log(__name__, log_dir=self.log_dir)
+        self.logger = prepare_log(
+            __name__,
+            log_dir=self.log_dir,
+            level=str(self.config.get("LOG_LEVEL", "INFO")).upper(),
+            queued=self.config.get("LOG_QUEUE", True),
+            json_format=self.config.get("LOG_JSON", False),
+        )
+        self.request_filter = RequestFilter.from_config(self.config)
+        # Job pages never run more detail workers at once than the pool has slots.
+        self.scheduler = HostScheduler.from_config(
+            self.config, caps={host_of(self.config["BASE_URL"]): self.config.get("DETAIL_CONCURRENCY", 4)}
+        )
+        self.waits = WaitEngine.from_config(self.config)
+        self.metrics = Metrics()
+        self._job_progress = self._progress("Crawled jobs", "jobs")
+        self.frontier = CrawlFrontier(os.path.join(save_root, self.config.get("FRONTIER_DB", "frontier.sqlite3")))
+        self.changes = ChangeTracker.from_config(self.config, save_root)
+        # Jobs count as done only once the sink says their record is on disk.
+        self.sink = make_result_sink(self.config, self.res_dir, on_commit=self._on_commit, logger=self.logger)
+        self.job_seconds = []  # wall time of every successful detail crawl
+        self.snapshots = None
+        if self.config.get("SAVE_SNAPSHOTS", False):
+            self.snapshots = SnapshotStore(os.path.join(save_root, self.config.get("SNAPSHOT_DIR", "snapshots")))
+        self.company_cache = CompanyCache.from_config(self.config, save_root)
+        self.near_dups = NearDupIndex.from_config(self.config, save_root)
+        self.cards = {}  # job URL -> (title, company) from the search API's cards
+        self.parser = None  # PARSE_WORKERS processes, started for the detail crawl
+
+    def _progress(self, label, unit):
+        return ProgressLogger(
+            self.logger,
+            label,
+            every=self.config.get("PROGRESS_EVERY", 500),
+            interval=self.config.get("PROGRESS_SECONDS", 10),
+            unit=unit,
+        )
+
+    def _make_pool(self, **overrides):
+        """Browser pool for this crawler; ``overrides`` replace config keys."""
+        return BrowserPool.from_config(
+            {**self.config, **overrides}, request_filter=self.request_filter, scheduler=self.scheduler
+        )
 
     # =========================================================
     # ✅ New integrated safe function
     # =========================================================
-async def extract_all_job_links_safely(self):
-    base_url = self.config["BASE_URL"]
-    timeout = self.config.get("TIMEOUT", 60000)
-    all_jobs = set()
-    processed_cards = set()
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page(viewport={"width": 1440, "height": 900})
-        await page.goto(base_url, wait_until="domcontentloaded", timeout=timeout)
-        await asyncio.sleep(5)
-
-        self.logger.info("🌀 Begin zig-zag scroll crawling (React virtualization bypass)")
-
-        async def extract_from_visible_cards():
-            """Extract visible + carousel job links from currently rendered cards."""
-            new_added = 0
-            cards = await page.query_selector_all("div.infinite-scroll-component div.grid > div.relative")
-            self.logger.info(f"📦 {len(cards)} visible cards")
-            for card in cards:
-                try:
-                    card_html = await card.inner_html()
-                    card_hash = hashlib.md5(card_html.encode("utf-8")).hexdigest()
-                    if card_hash in processed_cards:
-                        continue
-                    processed_cards.add(card_hash)
-
-                    # --- visible job(s)
-                    anchors = await card.query_selector_all("a[href*='/viewjob/']")
-                    for a in anchors:
-                        href = await a.get_attribute("href")
-                        if href:
-                            full = urljoin(base_url, href)
-                            if full not in all_jobs:
-                                all_jobs.add(full)
-                                new_added += 1
-                                self.logger.info(f"➕ Job link: {full}")
-
-                    # --- carousel jobs (“>” button)
-                    for click_idx in range(1, 10):
+    async def extract_all_job_links_safely(self, pool=None, search_url=None, save_links=True):
+        """Scroll the search list and collect job URLs; returns ``(links, complete)``.
+
+        ``complete`` is False when DOM_MAX_SCROLL_STEPS ran out before the
+        list went idle, so some jobs may not have been seen.
+        """
+        if pool is None:
+            workers = self.config.get("CAROUSEL_WORKERS", 3)
+            async with self._make_pool(DETAIL_CONCURRENCY=1 + workers) as own_pool:
+                return await self.extract_all_job_links_safely(own_pool, search_url, save_links)
+
+        base_url = search_url or self.config["BASE_URL"]
+        timeout = self.config.get("TIMEOUT", 60000)
+        max_steps = self.config.get("DOM_MAX_SCROLL_STEPS", 400)
+        idle_limit = self.config.get("DOM_IDLE_STEPS", 3)
+        all_jobs = set()
+        harvester = LinkHarvester(base_url, LIST_SELECTOR)
+        progress = self._progress("Discovered links", "links")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        def add_links(urls):
+            fresh = [url for url in urls if url not in all_jobs]
+            all_jobs.update(fresh)
+            self.frontier.add_discovered(fresh)
+            progress.add(len(fresh))
+            if debug:
+                for url in fresh:
+                    self.logger.debug(f"➕ Job link: {url}")
+            return len(fresh)
+
+        # The discovery tab holds one pool slot; carousel workers get the rest.
+        expander = CarouselExpander(
+            base_url,
+            pool,
+            self.waits,
+            workers=min(self.config.get("CAROUSEL_WORKERS", 3), pool.concurrency - 1),
+            max_clicks=self.config.get("CAROUSEL_MAX_CLICKS", 9),
+            timeout=timeout,
+            on_links=add_links,
+            logger=self.logger,
+        )
+        expander.start()
+        try:
+            async with pool.page() as page:
+                with self.metrics.timer("discovery_navigate"):
+                    await page.goto(base_url, wait_until="domcontentloaded", timeout=timeout)
+                    await self.waits.selector(page, CARD_SELECTOR, timeout_ms=5000, name="search_first_card")
+                    await self.waits.dom_quiet(page, LIST_SELECTOR, timeout_ms=5000, name="search_settle")
+                await harvester.install(page)
+
+                self.logger.info("🌀 Begin single-pass scroll crawling (in-page link harvester)")
+
+                async def collect_links():
+                    """Drain the links the harvester saw since the last call."""
+                    return add_links(await harvester.drain(page))
+
+                async def queue_carousels():
+                    """Queue cards that still hide jobs behind “>”; inline expansion when there are no workers."""
+                    tasks = await find_expandable_cards(page)
+                    if expander.workers:
+                        expander.enqueue(tasks)
+                        return
+                    for task in tasks:
+                        if not expander.enqueue([task]):
+                            continue
                         try:
-                            next_btn = await card.query_selector(
-                                "button:not([disabled]):has(svg path[d*='7.5 7.5-7.5'])"
-                            )
-                            if not next_btn:
-                                break
-                            html_before = await card.inner_html()
-                            prev_hash = hashlib.md5(html_before.encode("utf-8")).hexdigest()
-
-                            await next_btn.click(force=True)
-                            await asyncio.sleep(1.8)
-
-                            html_after = await card.inner_html()
-                            after_hash = hashlib.md5(html_after.encode("utf-8")).hexdigest()
-                            if after_hash == prev_hash:
-                                break
-
-                            anchors2 = await card.query_selector_all("a[href*='/viewjob/']")
-                            for a2 in anchors2:
-                                href2 = await a2.get_attribute("href")
-                                if href2:
-                                    full2 = urljoin(base_url, href2)
-                                    if full2 not in all_jobs:
-                                        all_jobs.add(full2)
-                                        new_added += 1
-                                        self.logger.info(f"➡️ Hidden job link: {full2}")
-                        except Exception:
-                            break
-                except Exception as e:
-                    self.logger.debug(f"Card extract error: {e}")
-            return new_added
-
-        # === Multi-pass zig-zag scroll ===
-        total_passes = 4          # You can raise this to 5–6 for 600 + jobs
-        scroll_steps = 40         # Number of downward scrolls per pass
-        for pass_idx in range(total_passes):
-            self.logger.info(f"🔁 Pass {pass_idx+1}/{total_passes} — scrolling ↓↓")
-            # Scroll top→bottom
-            await page.evaluate("window.scrollTo(0, 0)")
-            await asyncio.sleep(2)
-
-            for i in range(scroll_steps):
-                await page.evaluate("window.scrollBy(0, window.innerHeight * 0.9)")
-                await asyncio.sleep(2.5)
-                await extract_from_visible_cards()
-
-            # Wait for any new cards (spinner)
-            try:
-                await page.wait_for_function(
-                    "() => !document.querySelector('div[role=\"status\"], div[class*=\"loading\"], div[class*=\"spinner\"]')",
-                    timeout=10000,
-                )
-            except Exception:
-                pass
+                            card = await expander.locate(page, task)
+                            if card is not None:
+                                await expander.expand_card(page, card)
+                        except Exception as e:
+                            self.metrics.error("carousel", e)
+                            self.logger.debug(f"Card carousel error: {e}")
+
+                # === Single downward pass ===
+                await collect_links()
+                idle_steps = 0
+                complete = False
+                for step in range(1, max_steps + 1):
+                    with self.metrics.timer("scroll_step"):
+                        at_bottom = await page.evaluate(SCROLL_STEP_JS)
+                        await self.waits.dom_quiet(page, LIST_SELECTOR, quiet_ms=300, timeout_ms=2500, name="scroll_down")
+                        if at_bottom:
+                            # Give the infinite-scroll loader a chance to append the next page
+                            try:
+                                await page.wait_for_function(
+                                    "() => !document.querySelector('div[role=\"status\"], div[class*=\"loading\"], div[class*=\"spinner\"]')",
+                                    timeout=10000,
+                                )
+                            except Exception:
+                                pass
+                    with self.metrics.timer("queue_carousels"):
+                        await queue_carousels()
+                    added = await collect_links()
+                    self.metrics.observe("links_per_scroll_step", added)
+                    self.logger.debug(f"📜 Step {step}: +{added} links (total {len(all_jobs)})")
 
-            self.logger.info(f"🔁 Pass {pass_idx+1}: scrolling ↑↑ to re-render old cards")
-            # Scroll bottom→top
-            for i in range(scroll_steps):
-                await page.evaluate("window.scrollBy(0, -window.innerHeight * 0.9)")
-                await asyncio.sleep(1.8)
-                await extract_from_visible_cards()
+                    idle_steps = idle_steps + 1 if (at_bottom and added == 0) else 0
+                    if idle_steps >= idle_limit:
+                        complete = True
+                        break
+                else:
+                    self.logger.warning(f"⚠️ Stopped after DOM_MAX_SCROLL_STEPS={max_steps} before the list went idle")
 
-        # === Final double-check ===
-        await asyncio.sleep(3)
-        added_final = await extract_from_visible_cards()
-        self.logger.info(f"✅ Final check added {added_final} new jobs")
+                # === Final double-check ===
+                await self.waits.dom_quiet(page, LIST_SELECTOR, timeout_ms=3000, name="final_settle")
+                added_final = await collect_links()
+                self.logger.info(f"✅ Final check added {added_final} new jobs")
 
+            self.logger.info(f"🎠 Waiting for {expander.stats['queued']} queued carousels")
+            with self.metrics.timer("carousel_drain"):
+                await expander.join()
+        finally:
+            # A failed discovery must not leave workers holding pool slots
+            await expander.close()
+        self.logger.info(f"🎠 Carousel stats: {expander.stats}")
+        for outcome in ("expanded", "not_found"):
+            self.metrics.incr("carousel_cards", expander.stats[outcome], outcome=outcome)
+        self.metrics.incr("carousel_clicks", expander.stats["clicks"])
+        self.metrics.incr("links_discovered", len(all_jobs), mode="dom")
+
+        progress.close()
         self.logger.info(f"🎯 Crawl complete — {len(all_jobs)} unique job URLs found")
 
-        # === Save results ===
+        if save_links:
+            self._save_job_links(all_jobs)
+        return list(all_jobs), complete
+
+    # =========================================================
+    # ✅ API capture discovery (no DOM scraping)
+    # =========================================================
+    async def extract_job_links_from_api(self, pool=None, search_url=None, save_links=True):
+        """Discover job URLs from the search API's JSON responses while scrolling the list.
+
+        Returns ``(links, complete)``; ``complete`` is False when API_MAX_PAGES
+        responses were read before the list stopped growing.
+        """
+        if pool is None:
+            async with self._make_pool(DETAIL_CONCURRENCY=1) as own_pool:
+                return await self.extract_job_links_from_api(own_pool, search_url, save_links)
+
+        base_url = search_url or self.config["BASE_URL"]
+        timeout = self.config.get("TIMEOUT", 60000)
+        max_pages = self.config.get("API_MAX_PAGES", 1000)
+        idle_limit = self.config.get("API_IDLE_ROUNDS", 3)
+        payload_dir = None
+        if self.config.get("SAVE_API_PAYLOADS", False):
+            payload_dir = os.path.join(self.res_dir, "api_payloads", f"{datetime.now():%Y%m%d_%H%M%S}")
+
+        collector = ApiLinkCollector(
+            base_url,
+            pattern=self.config.get("API_RESPONSE_PATTERN", DEFAULT_API_PATTERN),
+            results_key=self.config.get("API_RESULTS_KEY", "results"),
+            id_key=self.config.get("API_JOB_ID_KEY", "id"),
+            payload_dir=payload_dir,
+            logger=self.logger,
+            title_keys=self.config.get("API_CARD_TITLE_KEYS", ["title", "job_information.title"]),
+            company_keys=self.config.get("API_CARD_COMPANY_KEYS", ["company", "enriched_company_data.name"]),
+        )
+
+        async with pool.page() as page:
+            collector.attach(page)
+            self.logger.info("📡 Begin API capture discovery")
+            with self.metrics.timer("discovery_navigate"):
+                await self.waits.response(
+                    page,
+                    collector.matches,
+                    action=lambda: page.goto(base_url, wait_until="domcontentloaded", timeout=timeout),
+                    timeout_ms=timeout,
+                    name="api_first_page",
+                )
+
+            # Every scroll to the bottom asks the infinite-scroll list for its next page.
+            progress = self._progress("API job links", "links")
+            idle_rounds = 0
+            checkpointed = set()
+            while collector.responses < max_pages and idle_rounds < idle_limit:
+                before = len(collector.jobs)
+                with self.metrics.timer("api_page"):
+                    await self.waits.response(
+                        page,
+                        collector.matches,
+                        action=lambda: page.evaluate("window.scrollTo(0, document.body.scrollHeight)"),
+                        name="api_next_page",
+                    )
+                    await collector.settle()
+                self.metrics.observe("links_per_api_page", len(collector.jobs) - before)
+                idle_rounds = idle_rounds + 1 if len(collector.jobs) == before else 0
+                fresh = collector.jobs - checkpointed
+                self.frontier.add_discovered(fresh)
+                progress.add(len(fresh))
+                checkpointed |= fresh
+            complete = idle_rounds >= idle_limit
+            if not complete:
+                self.logger.warning(f"⚠️ Stopped after API_MAX_PAGES={max_pages} responses before the list went idle")
+            await collector.settle()
+            self.frontier.add_discovered(collector.jobs - checkpointed)
+            progress.add(len(collector.jobs - checkpointed))
+            progress.close()
+
+        self.logger.info(
+            f"🎯 API discovery complete — {len(collector.jobs)} unique job URLs from {collector.responses} responses"
+        )
+        self.metrics.incr("api_responses", collector.responses)
+        self.cards.update(collector.cards)
+        self.metrics.incr("links_discovered", len(collector.jobs), mode="api")
+        if not collector.jobs:
+            self.logger.warning("⚠️ No job IDs found in API responses — falling back to DOM discovery")
+            return await self.extract_all_job_links_safely(pool, search_url, save_links)
+
+        if save_links:
+            self._save_job_links(collector.jobs)
+        return list(collector.jobs), complete
+
+    async def discover_job_links(self, pool=None, search_url=None, save_links=True):
+        """Run the discovery strategy selected by DISCOVERY_MODE ("api" or "dom").
+
+        When SHARDS / SHARD_DIMENSIONS are configured (and no ``search_url``
+        is forced), the search is split into shards instead. Returns
+        ``(links, complete)``: only a complete discovery proves that a job
+        missing from ``links`` is no longer listed.
+        """
+        if search_url is None and plan_shards_from_config(self.config):
+            return await self.discover_sharded(pool)
+        if self.config.get("DISCOVERY_MODE", "dom") == "api":
+            return await self.extract_job_links_from_api(pool, search_url, save_links)
+        return await self.extract_all_job_links_safely(pool, search_url, save_links)
+
+    # =========================================================
+    # ✅ Sharded discovery over searchState partitions
+    # =========================================================
+    async def discover_sharded(self, pool=None):
+        """Discover each shard's search on its own pooled context, then merge and dedupe.
+
+        The result is complete only when every shard finished and was complete.
+        """
+        if pool is None:
+            async with self._make_pool() as own_pool:
+                return await self.discover_sharded(own_pool)
+
+        base_url = self.config["BASE_URL"]
+        shards = plan_shards_from_config(self.config)
+        parallel = max(1, min(self.config.get("SHARD_CONCURRENCY", 2), pool.concurrency))
+        limit = asyncio.Semaphore(parallel)
+        results = {}
+        timings = {}
+        incomplete = []
+
+        async def run_shard(shard):
+            async with limit:
+                self.logger.info(f"🧩 Shard {shard.name} → {shard.url(base_url)}")
+                started = time.perf_counter()
+                try:
+                    links, complete = await self.discover_job_links(
+                        pool, search_url=shard.url(base_url), save_links=False
+                    )
+                except Exception as e:
+                    self.metrics.error("shard", e)
+                    self.logger.exception(f"❌ Shard {shard.name} failed: {e}")
+                    links, complete = [], False
+                if not complete:
+                    incomplete.append(shard.name)
+                results[shard.name] = links
+                timings[shard.name] = round(time.perf_counter() - started, 1)
+                self.logger.info(f"🧩 Shard {shard.name} done — {len(links)} links in {timings[shard.name]}s")
+
+        self.logger.info(f"🧩 Sharded discovery: {len(shards)} shards, {parallel} at a time")
+        await asyncio.gather(*(run_shard(shard) for shard in shards))
+
+        all_jobs, summary = merge_shard_results({shard.name: results.get(shard.name, []) for shard in shards})
+        for shard in shards:
+            summary["shards"][shard.name]["seconds"] = timings.get(shard.name)
+            summary["shards"][shard.name]["search_state"] = shard.overrides
+        self.logger.info(f"🧩 Shard totals: {summary['totals']}")
+        summary["incomplete_shards"] = sorted(incomplete)
+        self._save_shard_summary(summary)
+        self._save_job_links(all_jobs)
+        return list(all_jobs), not incomplete
+
+    def _save_shard_summary(self, summary):
+        os.makedirs(self.res_dir, exist_ok=True)
+        output_file = os.path.join(self.res_dir, "shard_summary.json")
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        self.logger.info(f"💾 Saved shard summary → {output_file}")
+
+    def _save_job_links(self, all_jobs):
         os.makedirs(self.res_dir, exist_ok=True)
         output_file = os.path.join(self.res_dir, "job_links_zigzag_full.json")
         with open(output_file, "w", encoding="utf-8") as f:
             json.dump(sorted(all_jobs), f, ensure_ascii=False, indent=2)
         self.logger.info(f"💾 Saved job links → {output_file}")
 
-        await browser.close()
+    # =========================================================
+    # ✅ Main crawl pipeline
+    # =========================================================
+    async def crawl_website(self):
+        self._prepare_frontier()
+        stale_after = self.config.get("STALE_AFTER_HOURS", 72) * 3600
+        max_attempts = self.config.get("MAX_ATTEMPTS", 3)
 
-        return list(all_jobs)
+        async with self._make_pool() as pool:
+            if self._discovery_is_fresh():
+                self.logger.info("♻️ Last discovery is still fresh — resuming from the frontier")
+            else:
+                with self.metrics.timer("discovery"):
+                    links, complete = await self.discover_job_links(pool)
+                self.frontier.set_meta("discovery_completed_at", time.time())
+                self._track_removals(links, complete)
 
+            job_links = self.frontier.pending(stale_after=stale_after, max_attempts=max_attempts)
+            if self.config.get("NEAR_DUP_SKIP_CARDS", False):
+                job_links = self._skip_card_duplicates(job_links)
+            self.logger.info(f"🗂️ Frontier: {self.frontier.counts()}")
 
+            queue = asyncio.Queue()
+            for job_url in job_links:
+                queue.put_nowait(job_url)
+            self._job_progress = self._progress("Crawled jobs", "jobs")
 
-        
+            self.parser = make_parser(self.config)
+            self.logger.info(f"🚀 Crawling {len(job_links)} jobs with {pool.concurrency} workers")
+            workers = [
+                asyncio.create_task(self._detail_worker(pool, queue))
+                for _ in range(pool.concurrency)
+            ]
+            try:
+                with self.metrics.timer("detail_crawl"):
+                    await asyncio.gather(*workers)
+            finally:
+                self.parser.close()
+                with self.metrics.timer("save"):
+                    self.sink.close()
+                self._write_metrics(pool)
+                if self.changes is not None:
+                    self.changes.close()
+            self._job_progress.close()
+            self.logger.info(f"🏁 Detail crawl done — {self.total_crawled} jobs saved, pool stats {pool.stats}")
+            if self.request_filter is not None:
+                self.logger.info(f"🚫 Request filter stats: {self.request_filter.stats}")
+            self.logger.info(f"⏱️ Wait stats: {self.waits.summary()}")
+            self.logger.info(f"🧮 Parse stats: {self.parser.summary()}")
+            for host, stats in self.scheduler.summary().items():
+                self.logger.info(f"🚦 Host {host}: {stats}")
+            self.logger.info(f"📦 Sink stats: {self.sink.stats}")
+            if self.snapshots is not None:
+                self.logger.info(f"🗃️ Snapshot stats: {self.snapshots.stats}")
+            if self.company_cache is not None:
+                self.logger.info(f"🏢 Company cache stats: {self.company_cache.summary()}")
+            if self.changes is not None:
+                self.logger.info(f"🧾 Changes: {self.changes.summary()}")
+            if self.near_dups is not None:
+                self.logger.info(f"🧬 Near-duplicates: {self.near_dups.summary()}")
 
-    # =========================================================
-    # ✅ Main crawl pipeline
-    # =========================================================
-    async def crawl_website(self):
-        job_links = await self.extract_all_job_links_safely()
-        for job_url in job_links:
+    def _track_removals(self, links, complete):
+        """Write tracked jobs missing from ``links`` to the delta feed as removed, after a complete discovery only."""
+        if self.changes is None:
+            return []
+        if not complete:
+            self.logger.warning("⚠️ Discovery was incomplete — not marking unseen jobs as removed")
+            return []
+        removed = self.changes.mark_removed(links)
+        self.logger.info(f"🗑️ {len(removed)} tracked jobs are no longer listed")
+        return removed
+
+    async def _detail_worker(self, pool, queue):
+        """Pull job URLs off the queue and crawl them on pooled pages until it is empty."""
+        while True:
+            try:
+                job_url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
             try:
-                data = await crawl_full_job_with_tabs(job_url)
-                os.makedirs(self.res_dir, exist_ok=True)
-                url_hash = hashlib.md5(job_url.encode("utf-8")).hexdigest()
-                filename = f"{url_hash}.json"
-                filepath = os.path.join(self.res_dir, filename)
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                self.logger.info(f"💾 Saved job data for {job_url}")
+                await self.crawl_job(pool, job_url)
             except Exception as e:
-                self.logger.exception(f"❌ Failed to crawl {job_url}: {e}")
\ No newline at end of file
+                self.logger.exception(f"❌ Failed to crawl {job_url}: {e}")
+
+    async def crawl_job(self, pool, job_url):
+        """Crawl one job on a pooled page, snapshot and save it; returns the record.
+
+        The frontier, metrics and progress are updated either way; a failure
+        is recorded and re-raised for the caller to log or report.
+        """
+        self.frontier.mark_in_flight(job_url)
+        started = time.perf_counter()
+        try:
+            snapshot = {} if self.snapshots is not None else None
+            async with self.scheduler.request(job_url), pool.page() as page:
+                data = await crawl_full_job_with_tabs(
+                    job_url,
+                    page=page,
+                    waits=self.waits,
+                    snapshot=snapshot,
+                    metrics=self.metrics,
+                    company_cache=self.company_cache,
+                    parser=self.parser,
+                    logger=self.logger,
+                )
+            if snapshot is not None:
+                with self.metrics.timer("snapshot"):
+                    self.snapshots.put(
+                        job_url,
+                        {tab: snapshot.get(tab) for tab in SNAPSHOT_TABS},
+                        extras={
+                            "clicked_website": snapshot.get("clicked_website"),
+                            "cached_company_info": snapshot.get("cached_company_info"),
+                        },
+                    )
+            if self.near_dups is not None:
+                with self.metrics.timer("near_dup"):
+                    cluster = self.near_dups.add(job_url, data)
+                if cluster is not None:
+                    self.metrics.incr("near_dup", outcome="unique" if cluster == job_url else "duplicate")
+            change = self.changes.stage(job_url, data) if self.changes is not None else None
+            if change is not None:
+                self.metrics.incr("records", outcome=change)
+            if change == UNCHANGED:
+                # Same content as the stored record: nothing to rewrite, only the crawl time moves.
+                self.frontier.mark_done(job_url)
+            else:
+                with self.metrics.timer("save"):
+                    self.sink.write(job_url, data)
+        except Exception as e:
+            self.metrics.incr("jobs", outcome="failed")
+            self.metrics.error("detail", e)
+            self.frontier.mark_failed(job_url, e)
+            raise
+        elapsed = time.perf_counter() - started
+        self.job_seconds.append(elapsed)
+        self.metrics.observe("job_seconds", elapsed)
+        self.metrics.incr("jobs", outcome="done")
+        self.total_crawled += 1
+        self._job_progress.add()
+        return data
+
+    def _skip_card_duplicates(self, job_links):
+        """Drop new jobs whose search card matches an indexed near-duplicate cluster."""
+        if self.near_dups is None:
+            return job_links
+        kept = []
+        for job_url in job_links:
+            card = self.cards.get(job_url)
+            cluster = None
+            if card is not None and not self.near_dups.is_indexed(job_url):
+                cluster = self.near_dups.match_card(*card)
+            if cluster is None:
+                kept.append(job_url)
+                continue
+            self.near_dups.add_card_duplicate(job_url, cluster, *card)
+            self.frontier.mark_done(job_url)
+            self.metrics.incr("jobs", outcome="near_duplicate")
+        if len(kept) < len(job_links):
+            self.logger.info(f"🧬 Skipped {len(job_links) - len(kept)} jobs whose card matches a known cluster")
+        return kept
+
+    def _on_commit(self, urls):
+        """The sink made these records durable: record their fingerprints, then mark them done."""
+        if self.changes is not None:
+            self.changes.commit(urls)
+        self.frontier.mark_done_many(urls)
+
+    def _write_metrics(self, pool=None):
+        """Write the run summary JSON and the Prometheus text file into METRICS_DIR."""
+        metrics_dir = self.config.get("METRICS_DIR") or self.log_dir
+        extra = {
+            "jobs_crawled": self.total_crawled,
+            "frontier": self.frontier.counts(),
+            "waits": self.waits.summary(),
+            "sink": self.sink.stats,
+        }
+        if pool is not None:
+            extra["pool"] = pool.stats
+        if self.request_filter is not None:
+            extra["request_filter"] = self.request_filter.stats
+        if self.snapshots is not None:
+            extra["snapshots"] = self.snapshots.stats
+        if self.company_cache is not None:
+            extra["company_cache"] = self.company_cache.summary()
+        if self.parser is not None:
+            extra["parse"] = self.parser.summary()
+        if self.changes is not None:
+            extra["changes"] = self.changes.summary()
+        if self.near_dups is not None:
+            extra["near_dup"] = self.near_dups.summary()
+        extra["hosts"] = self.scheduler.summary()
+        try:
+            summary_path = self.metrics.write_json(
+                os.path.join(metrics_dir, f"run_summary_{self.metrics.started_at:%Y%m%d_%H%M%S}.json"), extra
+            )
+            prom_path = self.metrics.write_prometheus(os.path.join(metrics_dir, "crawler_metrics.prom"))
+            self.logger.info(f"📈 Metrics → {summary_path}, {prom_path}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not write metrics: {e}")
+
+    def _prepare_frontier(self):
+        """Recover jobs a crashed run left in flight and adopt result files from before the frontier."""
+        recovered = self.frontier.recover_in_flight()
+        if recovered:
+            self.logger.info(f"♻️ Re-queued {recovered} jobs left in flight by the previous run")
+        if len(self.frontier) == 0:
+            seeded = 0
+            for name in os.listdir(self.res_dir):
+                if not name.endswith(".json") or name.startswith("job_links"):
+                    continue
+                path = os.path.join(self.res_dir, name)
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        job_url = json.load(f).get("job_url")
+                except Exception:
+                    continue
+                if job_url:
+                    self.frontier.seed_done(job_url, os.path.getmtime(path))
+                    seeded += 1
+            if seeded:
+                self.logger.info(f"🌱 Seeded frontier with {seeded} existing result files")
+
+    def _discovery_is_fresh(self):
+        completed_at = self.frontier.get_meta("discovery_completed_at")
+        if completed_at is None:
+            return False
+        max_age = self.config.get("DISCOVERY_STALE_HOURS", 24) * 3600
+        return time.time() - float(completed_at) < max_age
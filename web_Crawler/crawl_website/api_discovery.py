@@ -0,0 +1,146 @@
+import asyncio
+import gzip
+import json
+import os
+import re
+from urllib.parse import urljoin
+
+
+DEFAULT_API_PATTERN = r"hiring\.cafe/api/search-jobs"
+VIEWJOB_RE = re.compile(r"/viewjob/([A-Za-z0-9_-]+)")
+
+
+def _get_path(item, dotted_key):
+    """Read ``a.b.c`` style keys from nested dicts; None when any hop is missing."""
+    value = item
+    for part in dotted_key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def extract_job_ids(payload, results_key="results", id_key="id"):
+    """Return the job IDs found in one search API payload, in payload order.
+
+    IDs come from ``payload[results_key][*][id_key]`` plus any ``/viewjob/<id>``
+    path embedded anywhere in the payload, so a renamed ID field still yields
+    whatever links the API already spells out.
+    """
+    ids = []
+    seen = set()
+
+    def add(job_id):
+        job_id = str(job_id).strip()
+        if job_id and job_id not in seen:
+            seen.add(job_id)
+            ids.append(job_id)
+
+    results = _get_path(payload, results_key) if isinstance(payload, dict) else payload
+    if isinstance(results, list):
+        for item in results:
+            if isinstance(item, dict):
+                job_id = _get_path(item, id_key)
+                if isinstance(job_id, (str, int)):
+                    add(job_id)
+
+    for match in VIEWJOB_RE.finditer(json.dumps(payload, ensure_ascii=False)):
+        add(match.group(1))
+    return ids
+
+
+def extract_job_cards(payload, results_key="results", id_key="id", title_keys=(), company_keys=()):
+    """``{job_id: (title, company)}`` for results that carry both, trying each dotted key in turn."""
+    cards = {}
+    results = _get_path(payload, results_key) if isinstance(payload, dict) else payload
+    if not isinstance(results, list) or not title_keys or not company_keys:
+        return cards
+    for item in results:
+        if not isinstance(item, dict):
+            continue
+        job_id = _get_path(item, id_key)
+        title = next((v for v in (_get_path(item, k) for k in title_keys) if isinstance(v, str) and v), None)
+        company = next((v for v in (_get_path(item, k) for k in company_keys) if isinstance(v, str) and v), None)
+        if isinstance(job_id, (str, int)) and title and company:
+            cards[str(job_id).strip()] = (title, company)
+    return cards
+
+
+def job_url_from_id(base_url, job_id):
+    return urljoin(base_url, f"/viewjob/{job_id}")
+
+
+class ApiLinkCollector:
+    """Collects job URLs from the search API responses a page receives.
+
+    Attach it with ``collector.attach(page)`` before navigating; every JSON
+    response whose URL matches ``pattern`` is parsed and optionally written
+    gzipped to ``payload_dir`` as ``page_0001.json.gz``, ``page_0002...``.
+    With ``title_keys`` and ``company_keys``, ``cards`` maps each job URL
+    to the ``(title, company)`` its search card shows.
+    """
+
+    def __init__(self, base_url, pattern=DEFAULT_API_PATTERN, results_key="results",
+                 id_key="id", payload_dir=None, logger=None, title_keys=(), company_keys=()):
+        self.base_url = base_url
+        self.pattern = re.compile(pattern)
+        self.results_key = results_key
+        self.id_key = id_key
+        self.payload_dir = payload_dir
+        self.logger = logger
+        self.title_keys = tuple(title_keys or ())
+        self.company_keys = tuple(company_keys or ())
+        self.jobs = set()
+        self.cards = {}
+        self.responses = 0
+        self._tasks = set()
+        if payload_dir:
+            os.makedirs(payload_dir, exist_ok=True)
+
+    def attach(self, page):
+        page.on("response", self._schedule)
+
+    def _schedule(self, response):
+        if not self.matches(response):
+            return
+        task = asyncio.ensure_future(self._on_response(response))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def settle(self):
+        """Wait until every captured response has been parsed."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def matches(self, response):
+        return bool(self.pattern.search(response.url))
+
+    async def _on_response(self, response):
+        if not response.ok:
+            return
+        try:
+            payload = await response.json()
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Skipping non-JSON API response {response.url}: {e}")
+            return
+        self.responses += 1
+        new_urls = 0
+        for job_id in extract_job_ids(payload, self.results_key, self.id_key):
+            url = job_url_from_id(self.base_url, job_id)
+            if url not in self.jobs:
+                self.jobs.add(url)
+                new_urls += 1
+        for job_id, card in extract_job_cards(
+            payload, self.results_key, self.id_key, self.title_keys, self.company_keys
+        ).items():
+            self.cards[job_url_from_id(self.base_url, job_id)] = card
+        if self.payload_dir:
+            self._save_payload(payload)
+        if self.logger:
+            self.logger.info(f"📡 API page {self.responses}: +{new_urls} jobs (total {len(self.jobs)})")
+
+    def _save_payload(self, payload):
+        path = os.path.join(self.payload_dir, f"page_{self.responses:04d}.json.gz")
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
@@ -0,0 +1,195 @@
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+
+from playwright.async_api import async_playwright
+
+from web_Crawler.crawl_website.browser_service import acquire_browser, launch_profile
+
+
+DEFAULT_VIEWPORT = {"width": 1440, "height": 900}
+
+
+class _ContextSlot:
+    """One browser context that serves a single page at a time."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.context = None
+        self.pages_served = 0
+
+
+class BrowserPool:
+    """Long-lived Chromium browsers whose contexts hand out pages to concurrent workers.
+
+    Every slot owns its own context, so popups opened by one worker
+    (``page.context.expect_page``) never leak into another worker's page.
+    A context is recycled after ``max_pages_per_context`` pages or after a
+    worker fails with it, which keeps cookies/cache/memory from piling up.
+    With ``service_url`` pointing at a running browser service the pool
+    attaches over CDP instead of launching, and only its contexts are new.
+    """
+
+    def __init__(
+        self,
+        browsers: int = 1,
+        concurrency: int = 4,
+        max_pages_per_context: int = 50,
+        headless: bool = False,
+        viewport: dict | None = None,
+        user_agent: str | None = None,
+        extra_headers: dict | None = None,
+        request_filter=None,
+        scheduler=None,
+        service_url: str | None = None,
+        launch_args: list | None = None,
+    ):
+        self.browsers = max(1, int(browsers))
+        self.concurrency = max(1, int(concurrency))
+        self.max_pages_per_context = max(1, int(max_pages_per_context))
+        self.headless = headless
+        self.viewport = viewport or dict(DEFAULT_VIEWPORT)
+        self.user_agent = user_agent
+        self.extra_headers = extra_headers or {}
+        self.request_filter = request_filter
+        self.scheduler = scheduler
+        self.service_url = service_url
+        self.launch_args = list(launch_args or [])
+
+        self._playwright = None
+        self._browsers = []
+        self._slots = asyncio.Queue()
+        self._all_slots = []
+        self.stats = {"pages_served": 0, "contexts_created": 0, "contexts_recycled": 0,
+                      "startup_mode": None, "startup_seconds": None}
+
+    @classmethod
+    def from_config(cls, config, request_filter=None, scheduler=None):
+        """Build a pool from the crawler YAML config."""
+        headers = config.get("HEADERS") or {}
+        # Only identity headers are forwarded; Chromium manages Accept/Connection/Referer itself.
+        extra = {k: v for k, v in headers.items() if k == "Accept-Language"}
+        profile = launch_profile(config)
+        return cls(
+            browsers=config.get("BROWSER_POOL_SIZE", 1),
+            concurrency=config.get("DETAIL_CONCURRENCY", 4),
+            max_pages_per_context=config.get("CONTEXT_MAX_PAGES", 50),
+            headless=profile["headless"],
+            viewport=profile["viewport"],
+            user_agent=headers.get("User-Agent"),
+            extra_headers=extra,
+            request_filter=request_filter,
+            scheduler=scheduler,
+            service_url=config.get("BROWSER_SERVICE_URL"),
+            launch_args=profile["args"],
+        )
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Attach to (or launch) the browsers and open one context per concurrent slot."""
+        if self._playwright is not None:
+            return
+        started = time.perf_counter()
+        self._playwright = await async_playwright().start()
+        profile = {"headless": self.headless, "args": self.launch_args}
+        for _ in range(self.browsers):
+            browser, mode = await acquire_browser(self._playwright, self.service_url, profile)
+            self._browsers.append(browser)
+            self.stats["startup_mode"] = mode
+
+        # Spread the slots round-robin over the browser processes.
+        for browser in itertools.islice(itertools.cycle(self._browsers), self.concurrency):
+            slot = _ContextSlot(browser)
+            await self._open_context(slot)
+            self._all_slots.append(slot)
+            self._slots.put_nowait(slot)
+        self.stats["startup_seconds"] = round(time.perf_counter() - started, 3)
+
+    async def close(self):
+        """Close every context and browser, then stop Playwright."""
+        for slot in self._all_slots:
+            await self._close_context(slot)
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = None
+        self._browsers = []
+        self._all_slots = []
+        self._slots = asyncio.Queue()
+
+    async def new_context(self, browser=None):
+        """Create a context with the pool's viewport, headers, request filter and host scheduler."""
+        browser = browser or self._browsers[0]
+        options = {"viewport": self.viewport}
+        if self.user_agent:
+            options["user_agent"] = " ".join(str(self.user_agent).split())
+        if self.extra_headers:
+            options["extra_http_headers"] = {k: str(v) for k, v in self.extra_headers.items()}
+        context = await browser.new_context(**options)
+        if self.request_filter is not None:
+            await self.request_filter.attach(context)
+        if self.scheduler is not None:
+            await self.scheduler.attach(context)
+        return context
+
+    async def _open_context(self, slot):
+        slot.context = await self.new_context(slot.browser)
+        slot.pages_served = 0
+        self.stats["contexts_created"] += 1
+
+    async def _close_context(self, slot):
+        if slot.context is None:
+            return
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+        slot.context = None
+
+    async def _recycle(self, slot):
+        await self._close_context(slot)
+        self.stats["contexts_recycled"] += 1
+        try:
+            await self._open_context(slot)
+        except Exception:
+            # Reopened lazily on the next borrow.
+            slot.context = None
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a fresh page; waits while all slots are busy."""
+        slot = await self._slots.get()
+        failed = False
+        page = None
+        try:
+            if slot.context is None:
+                await self._open_context(slot)
+            page = await slot.context.new_page()
+            yield page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    failed = True
+            slot.pages_served += 1
+            self.stats["pages_served"] += 1
+            try:
+                if failed or slot.pages_served >= self.max_pages_per_context:
+                    await self._recycle(slot)
+            finally:
+                self._slots.put_nowait(slot)
@@ -0,0 +1,242 @@
+"""Long-running local Chromium that crawler runs and tests attach to over CDP.
+
+Usage (from the repository root):
+
+    python -m web_Crawler.crawl_website.browser_service start --config web_Crawler/config/hiring_caffe_config.yaml
+    python -m web_Crawler.crawl_website.browser_service status
+    python -m web_Crawler.crawl_website.browser_service bench --runs 5
+    python -m web_Crawler.crawl_website.browser_service stop
+
+``start`` launches Playwright's Chromium with the BROWSER_PROFILE launch
+profile and a remote-debugging port, detached from the shell, and records it
+in ``browser_service.json`` under SAVE_ROOT_DIR. With BROWSER_SERVICE_URL
+set, ``BrowserPool`` and the Apollo downloader ``connect_over_cdp`` to it and
+only open fresh contexts; when nothing answers there they launch their own
+browser with the same profile. ``bench`` compares both startup paths.
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+from web_Crawler.utils.utils import load_config
+
+DEFAULT_SERVICE_URL = "http://127.0.0.1:9222"
+STATE_FILE = "browser_service.json"
+
+# Used when BROWSER_PROFILES does not define the selected profile.
+DEFAULT_PROFILES = {
+    "server": {
+        "headless": True,
+        "args": ["--disable-dev-shm-usage", "--disable-gpu", "--no-first-run", "--no-default-browser-check"],
+    },
+    "debug": {"headless": False, "args": []},
+}
+
+
+def launch_profile(config, name=None):
+    """The launch options (headless, args, viewport) of BROWSER_PROFILE, or of ``HEADLESS`` without one."""
+    name = name or config.get("BROWSER_PROFILE")
+    if not name:
+        return {"name": None, "headless": config.get("HEADLESS", False), "args": [], "viewport": config.get("VIEWPORT")}
+    profiles = {**DEFAULT_PROFILES, **(config.get("BROWSER_PROFILES") or {})}
+    if name not in profiles:
+        raise ValueError(f"Unknown BROWSER_PROFILE {name!r}; expected one of {sorted(profiles)}")
+    profile = profiles[name]
+    return {
+        "name": name,
+        "headless": profile.get("headless", True),
+        "args": list(profile.get("args") or []),
+        "viewport": profile.get("viewport") or config.get("VIEWPORT"),
+    }
+
+
+def chromium_command(executable, profile, port, user_data_dir):
+    """Command line for a Chromium that serves CDP on ``127.0.0.1:port``."""
+    command = [
+        executable,
+        f"--remote-debugging-port={port}",
+        "--remote-debugging-address=127.0.0.1",
+        f"--user-data-dir={user_data_dir}",
+        *profile["args"],
+    ]
+    if profile["headless"]:
+        command.append("--headless=new")
+    command.append("about:blank")
+    return command
+
+
+def service_version(service_url, timeout=0.5):
+    """``/json/version`` of a CDP endpoint, or None when nothing answers there."""
+    if not service_url:
+        return None
+    try:
+        with urllib.request.urlopen(f"{service_url.rstrip('/')}/json/version", timeout=timeout) as response:
+            return json.load(response)
+    except (OSError, ValueError):
+        return None
+
+
+async def acquire_browser(playwright, service_url=None, profile=None):
+    """Attach to the browser service, or launch a browser with ``profile``; returns ``(browser, mode)``.
+
+    Closing a CDP-attached browser only disconnects, so the service stays warm.
+    """
+    profile = profile or DEFAULT_PROFILES["server"]
+    if service_url and await asyncio.to_thread(service_version, service_url) is not None:
+        try:
+            return await playwright.chromium.connect_over_cdp(service_url), "cdp"
+        except Exception as e:
+            print(f"⚠️ Browser service at {service_url} refused the connection ({e}); launching locally")
+    browser = await playwright.chromium.launch(headless=profile["headless"], args=profile.get("args") or None)
+    return browser, "launch"
+
+
+# ---------------- daemon management ----------------
+def state_path(config):
+    return os.path.join(str(config.get("SAVE_ROOT_DIR", ".")), STATE_FILE)
+
+
+def read_state(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def start_service(config, profile_name=None, wait_seconds=15):
+    """Launch the daemon unless one already answers; returns its state dict."""
+    service_url = config.get("BROWSER_SERVICE_URL") or DEFAULT_SERVICE_URL
+    path = state_path(config)
+    if service_version(service_url) is not None:
+        return read_state(path) or {"url": service_url}
+
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        executable = p.chromium.executable_path
+    profile = launch_profile(config, profile_name or config.get("BROWSER_PROFILE") or "server")
+    port = urlsplit(service_url).port or 9222
+    user_data_dir = tempfile.mkdtemp(prefix="aair-browser-")
+    log_path = os.path.join(str(config.get("SAVE_ROOT_DIR", ".")), "browser_service.log")
+    os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+
+    detach = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if sys.platform.startswith("win") \
+        else {"start_new_session": True}
+    with open(log_path, "ab") as log:
+        process = subprocess.Popen(
+            chromium_command(executable, profile, port, user_data_dir),
+            stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, **detach,
+        )
+
+    started = time.perf_counter()
+    version = None
+    while time.perf_counter() - started < wait_seconds:
+        version = service_version(service_url)
+        if version is not None or process.poll() is not None:
+            break
+        time.sleep(0.1)
+    if version is None:
+        process.kill()
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+        raise RuntimeError(f"Chromium did not serve CDP on {service_url}; see {log_path}")
+
+    state = {
+        "pid": process.pid,
+        "url": service_url,
+        "websocket": version.get("webSocketDebuggerUrl"),
+        "browser": version.get("Browser"),
+        "profile": profile["name"],
+        "user_data_dir": user_data_dir,
+        "started_at": time.time(),
+        "startup_seconds": round(time.perf_counter() - started, 3),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    return state
+
+
+def stop_service(config):
+    """Terminate the daemon recorded in the state file; returns True if one was running."""
+    path = state_path(config)
+    state = read_state(path)
+    if state is None:
+        return False
+    running = _pid_alive(state["pid"])
+    if running:
+        os.kill(state["pid"], signal.SIGTERM)
+        for _ in range(50):
+            if not _pid_alive(state["pid"]):
+                break
+            time.sleep(0.1)
+    shutil.rmtree(state.get("user_data_dir") or "", ignore_errors=True)
+    os.remove(path)
+    return running
+
+
+async def measure_startup(service_url, profile, runs=3):
+    """Seconds to a usable page when launching cold vs attaching to the service."""
+    from playwright.async_api import async_playwright
+
+    timings = {"launch": [], "cdp": []}
+    async with async_playwright() as p:
+        for _ in range(runs):
+            for mode, url in (("launch", None), ("cdp", service_url)):
+                if mode == "cdp" and service_version(service_url) is None:
+                    continue
+                started = time.perf_counter()
+                browser, _ = await acquire_browser(p, url, profile)
+                context = await browser.new_context()
+                page = await context.new_page()
+                await page.goto("about:blank")
+                timings[mode].append(time.perf_counter() - started)
+                await context.close()
+                await browser.close()
+    return {
+        mode: {"runs": len(values), "avg_s": round(sum(values) / len(values), 3), "min_s": round(min(values), 3)}
+        for mode, values in timings.items() if values
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=("start", "stop", "status", "bench"))
+    parser.add_argument("--config", default="web_Crawler/config/hiring_caffe_config.yaml")
+    parser.add_argument("--profile", default=None, help="launch profile (default: BROWSER_PROFILE)")
+    parser.add_argument("--runs", type=int, default=3, help="bench: startups per mode")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    service_url = config.get("BROWSER_SERVICE_URL") or DEFAULT_SERVICE_URL
+    if args.command == "start":
+        state = start_service(config, args.profile)
+        print(f"🟢 Browser service on {state['url']} ({state.get('browser')}, profile {state.get('profile')})")
+    elif args.command == "stop":
+        print("🛑 Browser service stopped" if stop_service(config) else "ℹ️ No browser service was running")
+    elif args.command == "status":
+        version = service_version(service_url)
+        state = read_state(state_path(config))
+        print(json.dumps({"url": service_url, "up": version is not None, "version": version, "state": state}, indent=2))
+    else:
+        profile = launch_profile(config, args.profile or config.get("BROWSER_PROFILE") or "server")
+        print(json.dumps(asyncio.run(measure_startup(service_url, profile, args.runs)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+import asyncio
+from dataclasses import dataclass
+
+
+CARD_SELECTOR = "div.infinite-scroll-component div.grid > div.relative"
+LIST_SELECTOR = "div.infinite-scroll-component"
+NEXT_BUTTON_SELECTOR = "button:not([disabled]):has(svg path[d*='7.5 7.5-7.5'])"
+JOB_ANCHOR_SELECTOR = "a[href*='/viewjob/']"
+MARK_ATTR = "data-aair-carousel"
+
+# Rendered cards that still have an enabled ">" button: their first job link and page offset.
+FIND_EXPANDABLE_JS = """
+([cardSelector, buttonSelector, anchorSelector]) => {
+    const out = [];
+    for (const card of document.querySelectorAll(cardSelector)) {
+        if (!card.querySelector(buttonSelector)) continue;
+        const first = card.querySelector(anchorSelector);
+        if (!first) continue;
+        out.push({key: first.href, offset: Math.round(card.getBoundingClientRect().top + window.scrollY)});
+    }
+    return out;
+}
+"""
+
+# Mark the card whose job links include `key`; returns false when it is not rendered.
+LOCATE_CARD_JS = """
+([cardSelector, anchorSelector, markAttr, key]) => {
+    document.querySelectorAll(`[${markAttr}]`).forEach((el) => el.removeAttribute(markAttr));
+    for (const card of document.querySelectorAll(cardSelector)) {
+        for (const a of card.querySelectorAll(anchorSelector)) {
+            if (a.href === key) {
+                card.setAttribute(markAttr, "1");
+                card.scrollIntoView({block: "center"});
+                return true;
+            }
+        }
+    }
+    return false;
+}
+"""
+
+# Scroll toward `target` (the list only grows while we are near its bottom); true once there.
+SCROLL_TOWARDS_JS = """
+(target) => {
+    window.scrollTo(0, Math.min(target, document.documentElement.scrollHeight));
+    return window.scrollY + window.innerHeight >= target;
+}
+"""
+
+HREF_SET_JS = "(el, sel) => [...el.querySelectorAll(sel)].map((a) => a.href).sort().join('\\n')"
+HREFS_CHANGED_JS = (
+    "([el, sel, before]) => !el.isConnected"
+    " || [...el.querySelectorAll(sel)].map((a) => a.href).sort().join('\\n') !== before"
+)
+
+
+@dataclass(frozen=True)
+class CarouselTask:
+    """A company card that still hides jobs behind its ">" button."""
+
+    key: str
+    offset: int = 0
+
+
+async def find_expandable_cards(page):
+    """Cards currently rendered on ``page`` that can still be paged, in one round trip."""
+    found = await page.evaluate(FIND_EXPANDABLE_JS, [CARD_SELECTOR, NEXT_BUTTON_SELECTOR, JOB_ANCHOR_SELECTOR])
+    return [CarouselTask(item["key"], item["offset"]) for item in found]
+
+
+class CarouselExpander:
+    """Pages through company-card carousels on a pool of worker tabs.
+
+    Discovery ``enqueue``s cards as it scrolls past them; each worker keeps
+    one search tab open, scrolls it to the queued card and clicks ">" until
+    the card's set of job hrefs stops changing. New links are handed to
+    ``on_links`` as they appear. With ``workers=0`` nothing is queued and
+    ``expand_card`` is expected to be called inline on the discovery page.
+    """
+
+    def __init__(self, base_url, pool, waits, workers=3, max_clicks=9,
+                 max_locate_steps=40, timeout=60000, on_links=None, logger=None):
+        self.base_url = base_url
+        self.pool = pool
+        self.waits = waits
+        self.workers = max(0, int(workers))
+        self.max_clicks = max_clicks
+        self.max_locate_steps = max_locate_steps
+        self.timeout = timeout
+        self.on_links = on_links
+        self.logger = logger
+        self.links = set()
+        self.stats = {"queued": 0, "expanded": 0, "not_found": 0, "clicks": 0}
+        self._seen = set()
+        self._queue = asyncio.Queue()
+        self._tasks = []
+
+    def enqueue(self, tasks):
+        """Queue cards not seen before; returns how many were added."""
+        added = 0
+        for task in tasks:
+            if task.key in self._seen:
+                continue
+            self._seen.add(task.key)
+            self._queue.put_nowait(task)
+            added += 1
+        self.stats["queued"] += added
+        return added
+
+    def start(self):
+        for idx in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(idx)))
+
+    async def join(self):
+        """Wait until every queued card is expanded, then release the worker tabs."""
+        alive = set(self._tasks)
+        joiner = asyncio.ensure_future(self._queue.join())
+        # Stop early if every worker died (e.g. its search tab never loaded).
+        while alive and not joiner.done():
+            done, _ = await asyncio.wait({joiner, *alive}, return_when=asyncio.FIRST_COMPLETED)
+            alive -= done
+        if not joiner.done():
+            joiner.cancel()
+            if self._tasks and self.logger:
+                self.logger.warning(f"⚠️ All carousel workers stopped; {self._queue.qsize()} cards left unexpanded")
+        await self.close()
+
+    async def close(self):
+        """Cancel the workers and release their tabs; safe to call more than once."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self, idx):
+        async with self.pool.page() as page:
+            await page.goto(self.base_url, wait_until="domcontentloaded", timeout=self.timeout)
+            await self.waits.selector(page, CARD_SELECTOR, timeout_ms=5000, name="carousel_worker_ready")
+            while True:
+                task = await self._queue.get()
+                try:
+                    card = await self.locate(page, task)
+                    if card is None:
+                        self.stats["not_found"] += 1
+                        if self.logger:
+                            self.logger.debug(f"Carousel worker {idx}: card {task.key} not found")
+                        continue
+                    await self.expand_card(page, card)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.debug(f"Carousel worker {idx}: {task.key} failed: {e}")
+                finally:
+                    self._queue.task_done()
+
+    async def locate(self, page, task):
+        """Scroll ``page`` until the queued card is rendered and return it; None when it never shows up."""
+        args = [CARD_SELECTOR, JOB_ANCHOR_SELECTOR, MARK_ATTR, task.key]
+        nudges = 0
+        for _ in range(self.max_locate_steps):
+            if await page.evaluate(LOCATE_CARD_JS, args):
+                return await page.query_selector(f"[{MARK_ATTR}]")
+            reached = await page.evaluate(SCROLL_TOWARDS_JS, task.offset)
+            if reached:
+                # Card heights differ between tabs; look one viewport around the offset.
+                nudges += 1
+                if nudges > 4:
+                    return None
+                direction = -1 if nudges % 2 else 1
+                await page.evaluate(f"window.scrollBy(0, {direction * nudges} * window.innerHeight * 0.5)")
+            await self.waits.dom_quiet(page, LIST_SELECTOR, quiet_ms=300, timeout_ms=2500, name="carousel_locate")
+        return None
+
+    async def expand_card(self, page, card):
+        """Click ">" until the card's job hrefs stop changing; returns the new links."""
+        fresh = []
+        before = await card.evaluate(HREF_SET_JS, JOB_ANCHOR_SELECTOR)
+        self._collect(before, fresh)
+        for _ in range(self.max_clicks):
+            next_btn = await card.query_selector(NEXT_BUTTON_SELECTOR)
+            if not next_btn:
+                break
+            await next_btn.click(force=True)
+            self.stats["clicks"] += 1
+            changed = await self.waits.condition(
+                page, HREFS_CHANGED_JS, [card, JOB_ANCHOR_SELECTOR, before], timeout_ms=1800, name="carousel_click"
+            )
+            if not changed:
+                break
+            after = await card.evaluate(HREF_SET_JS, JOB_ANCHOR_SELECTOR)
+            if after == before:
+                break
+            self._collect(after, fresh)
+            before = after
+        self.stats["expanded"] += 1
+        if fresh and self.on_links:
+            self.on_links(fresh)
+        return fresh
+
+    def _collect(self, href_block, fresh):
+        for href in href_block.split("\n"):
+            if href and href not in self.links:
+                self.links.add(href)
+                fresh.append(href)
@@ -0,0 +1,180 @@
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+ADDED = "added"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+REMOVED = "removed"
+
+# posted_date is recomputed from datetime.now() on every crawl ("3 days ago" -> a date).
+DEFAULT_IGNORE = ("posted_date",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    job_url TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    removed_at REAL
+);
+"""
+
+
+def _canonical(value):
+    """JSON-able value with whitespace runs collapsed, so reflowed text hashes the same."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def _digest(payload):
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def field_fingerprints(record, ignore=DEFAULT_IGNORE):
+    """``{field: hash}`` of every top-level field except ``job_url`` and the ``ignore``d ones."""
+    skip = {"job_url", *ignore}
+    return {
+        field: _digest(json.dumps(_canonical(value), ensure_ascii=False, sort_keys=True))
+        for field, value in record.items()
+        if field not in skip
+    }
+
+
+def record_fingerprint(fields):
+    return _digest(json.dumps(fields, sort_keys=True))
+
+
+class ChangeTracker:
+    """Field-level fingerprints per job URL and the added/changed/removed delta feed of a run.
+
+    ``stage(job_url, record)`` compares a freshly parsed record with the
+    last committed fingerprint and returns ``added``, ``changed`` or
+    ``unchanged``; the crawler only hands changed records to the sink.
+    ``commit(urls)`` runs when the sink has made those records durable: it
+    stores their fingerprints and appends their delta lines to
+    ``delta_<run>.jsonl.gz``, so the feed never announces a record that
+    was lost. ``mark_removed(live_urls)`` retires jobs discovery no longer
+    lists. ``close`` seals the feed (``.inprogress`` until then).
+    """
+
+    def __init__(self, db_path, delta_dir, ignore=DEFAULT_IGNORE, include_records=True):
+        self.ignore = tuple(ignore)
+        self.include_records = include_records
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        os.makedirs(delta_dir, exist_ok=True)
+        self.delta_path = os.path.join(delta_dir, f"delta_{datetime.now():%Y%m%d_%H%M%S}.jsonl.gz")
+        self._feed = None
+        self._staged = {}  # job_url -> delta entry waiting for the sink to commit
+        self.stats = {ADDED: 0, CHANGED: 0, UNCHANGED: 0, REMOVED: 0, "delta_lines": 0}
+
+    @classmethod
+    def from_config(cls, config, save_root):
+        """None when CHANGE_TRACKING is off."""
+        if not config.get("CHANGE_TRACKING", True):
+            return None
+        return cls(
+            os.path.join(save_root, config.get("FINGERPRINT_DB", "fingerprints.sqlite3")),
+            os.path.join(save_root, config.get("DELTA_DIR", "deltas")),
+            ignore=config.get("FINGERPRINT_IGNORE", DEFAULT_IGNORE),
+            include_records=config.get("DELTA_INCLUDE_RECORDS", True),
+        )
+
+    def stage(self, job_url, record):
+        """Classify ``record``; anything but ``unchanged`` waits in memory for ``commit``."""
+        fields = field_fingerprints(record, self.ignore)
+        fingerprint = record_fingerprint(fields)
+        row = self.conn.execute(
+            "SELECT fingerprint, fields, removed_at FROM fingerprints WHERE job_url = ?", (job_url,)
+        ).fetchone()
+        if row is not None and row[0] == fingerprint and row[2] is None:
+            self._staged.pop(job_url, None)
+            self.stats[UNCHANGED] += 1
+            return UNCHANGED
+        entry = {"op": ADDED, "job_url": job_url, "fingerprint": fingerprint, "fields": fields}
+        if row is not None and row[2] is None:
+            previous = json.loads(row[1])
+            entry["op"] = CHANGED
+            entry["changed_fields"] = sorted(f for f in fields.keys() | previous.keys() if fields.get(f) != previous.get(f))
+        if self.include_records:
+            entry["record"] = record
+        self._staged[job_url] = entry
+        return entry["op"]
+
+    def commit(self, urls, now=None):
+        """Persist the fingerprints of ``urls`` and write their delta lines."""
+        now = now or time.time()
+        entries = [self._staged.pop(url) for url in urls if url in self._staged]
+        if not entries:
+            return 0
+        self.conn.executemany(
+            "INSERT INTO fingerprints (job_url, fingerprint, fields, first_seen, updated_at) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(job_url) DO UPDATE SET fingerprint = excluded.fingerprint, fields = excluded.fields,"
+            " updated_at = excluded.updated_at, removed_at = NULL",
+            [(e["job_url"], e["fingerprint"], json.dumps(e["fields"], sort_keys=True), now, now) for e in entries],
+        )
+        self.conn.commit()
+        for entry in entries:
+            self.stats[entry["op"]] += 1
+        self._append([{k: v for k, v in e.items() if k != "fields"} for e in entries], now)
+        return len(entries)
+
+    def mark_removed(self, live_urls, now=None):
+        """Retire every tracked job missing from ``live_urls`` (a complete discovery); returns them."""
+        now = now or time.time()
+        live = set(live_urls)
+        if not live:
+            return []  # an empty discovery is a failed one, not a site without jobs
+        rows = self.conn.execute("SELECT job_url FROM fingerprints WHERE removed_at IS NULL").fetchall()
+        removed = [url for (url,) in rows if url not in live]
+        self.conn.executemany("UPDATE fingerprints SET removed_at = ? WHERE job_url = ?", [(now, url) for url in removed])
+        self.conn.commit()
+        self.stats[REMOVED] += len(removed)
+        self._append([{"op": REMOVED, "job_url": url} for url in removed], now)
+        return removed
+
+    def _append(self, entries, now):
+        if not entries:
+            return
+        if self._feed is None:
+            self._feed = gzip.open(self.delta_path + ".inprogress", "at", encoding="utf-8")
+        at = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+        self._feed.write("".join(json.dumps({**e, "at": at}, ensure_ascii=False) + "\n" for e in entries))
+        self._feed.flush()
+        self.stats["delta_lines"] += len(entries)
+
+    def close(self):
+        """Seal the delta feed (only written when something changed) and close the database."""
+        if self._feed is not None:
+            self._feed.close()
+            self._feed = None
+            os.replace(self.delta_path + ".inprogress", self.delta_path)
+        self.conn.close()
+
+    def summary(self):
+        return {**self.stats, "pending": len(self._staged),
+                "delta_file": self.delta_path if self.stats["delta_lines"] else None}
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM fingerprints WHERE removed_at IS NULL").fetchone()[0]
+
+
+def iter_deltas(path):
+    """Read a delta feed back, one dict per line."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,134 @@
+import json
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    key TEXT PRIMARY KEY,
+    name TEXT,
+    company_info TEXT NOT NULL,
+    company_website TEXT,
+    updated_at REAL NOT NULL
+);
+"""
+
+_NON_WORD_RE = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_company(name):
+    """Cache key for a company name: case, "@", punctuation and spacing are ignored."""
+    if not name or not isinstance(name, str):
+        return None
+    key = _NON_WORD_RE.sub(" ", name.replace("@", " ").casefold()).strip()
+    key = " ".join(key.split())
+    return key if key and key != "n a" else None
+
+
+def normalize_domain(url):
+    """Bare host of a company website ("https://www.Acme.io/about" -> "acme.io"), or None."""
+    if not url or not isinstance(url, str) or url == "N/A":
+        return None
+    host = urlsplit(url if "//" in url else f"//{url}").hostname
+    if not host or "." not in host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
+
+class CompanyCache:
+    """Company Info table and resolved website per company, shared by all its jobs.
+
+    Entries live in SQLite so they survive restarts and expire after
+    ``ttl_seconds``; the ``max_memory`` most recently used ones are also
+    kept in an in-memory LRU so hot companies never touch the database.
+    """
+
+    def __init__(self, db_path, ttl_seconds=7 * 24 * 3600, max_memory=2048):
+        self.ttl_seconds = ttl_seconds
+        self.max_memory = max(0, int(max_memory))
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self._memory = OrderedDict()
+        self.stats = {"hits": 0, "memory_hits": 0, "misses": 0, "expired": 0, "stores": 0}
+
+    @classmethod
+    def from_config(cls, config, save_root):
+        """None when COMPANY_CACHE is off."""
+        if not config.get("COMPANY_CACHE", True):
+            return None
+        return cls(
+            os.path.join(save_root, config.get("COMPANY_CACHE_DB", "company_cache.sqlite3")),
+            ttl_seconds=config.get("COMPANY_CACHE_TTL_HOURS", 168) * 3600,
+            max_memory=config.get("COMPANY_CACHE_MEMORY", 2048),
+        )
+
+    def close(self):
+        self.conn.close()
+
+    def _remember(self, key, entry):
+        if not self.max_memory:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+
+    def get(self, company, now=None):
+        """``{"company_info": ..., "company_website": ...}`` for a fresh entry, else None."""
+        key = normalize_company(company)
+        if key is None:
+            return None
+        now = now or time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None and now - entry["updated_at"] < self.ttl_seconds:
+            self._memory.move_to_end(key)
+            self.stats["hits"] += 1
+            self.stats["memory_hits"] += 1
+            return entry
+
+        row = self.conn.execute(
+            "SELECT company_info, company_website, updated_at FROM companies WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        if now - row[2] >= self.ttl_seconds:
+            self._memory.pop(key, None)
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return None
+        entry = {"company_info": json.loads(row[0]), "company_website": row[1], "updated_at": row[2]}
+        self._remember(key, entry)
+        self.stats["hits"] += 1
+        return entry
+
+    def put(self, company, company_info, company_website, now=None):
+        """Store a company's data; only real Company Info tables are cached, never failures."""
+        key = normalize_company(company)
+        if key is None or not isinstance(company_info, dict) or not company_info:
+            return False
+        if company_info.get("company_info") == "N/A":
+            return False
+        now = now or time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO companies (key, name, company_info, company_website, updated_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, company, json.dumps(company_info, ensure_ascii=False), company_website, now),
+        )
+        self.conn.commit()
+        self._remember(key, {"company_info": company_info, "company_website": company_website, "updated_at": now})
+        self.stats["stores"] += 1
+        return True
+
+    def summary(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {**self.stats, "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else None}
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
@@ -1,8 +1,40 @@
 from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+import logging
 import re
+import time
+import soupsieve
 from datetime import datetime, timedelta
 
+from web_Crawler.crawl_website.browser_service import acquire_browser, launch_profile
+from web_Crawler.crawl_website.parse_pool import InlineParser
+from web_Crawler.crawl_website.wait_engine import WaitEngine
+from web_Crawler.utils.metrics import Metrics
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Used when no crawler logger is passed in (one-off crawls, tests)
+log = logging.getLogger(__name__)
+
+# Precompiled patterns/selectors shared by every extractor call
+POSTED_PREFIX_RE = re.compile(r'^[Pp]osted[:\s]*')
+RELATIVE_DATE_RE = re.compile(r'(?P<num>\d+)\s*(?P<unit>(?:mins?|minutes?|m|hrs?|hours?|h|days?|d|weeks?|w))', re.I)
+YESTERDAY_RE = re.compile(r'\byesterday\b', re.I)
+TODAY_RE = re.compile(r'\btoday\b', re.I)
+ABSOLUTE_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%d", "%d %b %Y")
+POSTED_RE = re.compile(r'\bPosted\b', re.I)
+WEBSITE_RE = re.compile(r'Website', re.I)
+LOCATION_CONTAINER = soupsieve.compile("div.flex")
+LOCATION_PIN_PATHS = ("M15 10.5a3 3 0", "M19.5 10.5c0 7.142")
+COMPANY_CLASSES = ("text-xl", "font-semibold", "text-gray-700")
+WORK_MODES = ("Remote", "Onsite", "Hybrid")
+EMPLOYMENT_TYPES = ("Full Time", "Part Time", "Temporary", "Contract", "All Commitments Available")
+
+
 def parse_posted_date_text(text: str, now: datetime | None = None) -> str | None:
     """Convert strings like 'Posted 1d ago' or 'Posted 2 hours ago' to a datetime string.
     Returns ISO-like datetime string 'YYYY-MM-DD HH:MM:SS' or the original text if unknown.
@@ -11,12 +43,12 @@ def parse_posted_date_text(text: str, now: datetime | None = None) -> str | None
         return None
     s = text.strip()
     # remove leading 'Posted' or similar
-    s = re.sub(r'^[Pp]osted[:\s]*', '', s).strip()
+    s = POSTED_PREFIX_RE.sub('', s).strip()
 
     now = now or datetime.now()
 
     # common relative formats: "1d ago", "2 hours ago", "5m ago", "30 mins ago"
-    m = re.match(r'(?P<num>\d+)\s*(?P<unit>(?:mins?|minutes?|m|hrs?|hours?|h|days?|d|weeks?|w))', s, flags=re.I)
+    m = RELATIVE_DATE_RE.match(s)
     if m:
         n = int(m.group('num'))
         unit = m.group('unit').lower()
@@ -34,14 +66,14 @@ def parse_posted_date_text(text: str, now: datetime | None = None) -> str | None
         return dt.strftime("%Y-%m-%d %H:%M:%S")
 
     # single-word cases
-    if re.search(r'\byesterday\b', s, flags=re.I):
+    if YESTERDAY_RE.search(s):
         dt = now - timedelta(days=1)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
-    if re.search(r'\btoday\b', s, flags=re.I):
+    if TODAY_RE.search(s):
         return now.strftime("%Y-%m-%d %H:%M:%S")
 
     # try common absolute date formats
-    for fmt in ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%d", "%d %b %Y"):
+    for fmt in ABSOLUTE_DATE_FORMATS:
         try:
             dt = datetime.strptime(s, fmt)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -51,6 +83,15 @@ def parse_posted_date_text(text: str, now: datetime | None = None) -> str | None
     # fallback: return original text
     return s
 
+def make_soup(html, parser=None):
+    """Build one BeautifulSoup tree with the fastest available backend."""
+    return BeautifulSoup(html, parser or HTML_PARSER)
+
+
+def _as_soup(html):
+    return html if isinstance(html, BeautifulSoup) else make_soup(html)
+
+
 def extract_text_after_button(soup, header_text):
     """Finds a section following a header span with specific text (for fallback parsing)."""
     header = soup.find("span", string=lambda t: t and header_text.lower() in t.lower())
@@ -59,70 +100,113 @@ def extract_text_after_button(soup, header_text):
         return next_span.get_text(strip=True) if next_span else "N/A"
     return "N/A"
 
-def parse_job_sections(html):
-    """Parse job info, company info, and job description from rendered HTML."""
-    soup = BeautifulSoup(html, "html.parser")
+
+def _text_after(header):
+    if header:
+        next_span = header.find_next("span")
+        return next_span.get_text(strip=True) if next_span else "N/A"
+    return "N/A"
+
+
+def _is_company_span(span):
+    classes = span.get("class")
+    if not classes:
+        return False
+    joined = " ".join(classes) if isinstance(classes, list) else classes
+    return all(c in joined for c in COMPANY_CLASSES)
+
+
+# (key, predicate on span.string) — the first span in document order wins, like soup.find(...)
+_SPAN_TEXT_MATCHERS = (
+    ("salary", lambda t: "$" in t),
+    ("work_mode", lambda t: any(x in t for x in WORK_MODES)),
+    ("employment_type", lambda t: any(x in t for x in EMPLOYMENT_TYPES)),
+    ("responsibilities", lambda t: "responsibilities" in t.lower()),
+    ("requirements", lambda t: "requirements summary" in t.lower()),
+)
+
+
+def _scan_spans(soup):
+    """One pass over every <span> collecting the first match for each field."""
+    found = {}
+    wanted = len(_SPAN_TEXT_MATCHERS) + 1
+    for span in soup.find_all("span"):
+        if "company" not in found and _is_company_span(span):
+            found["company"] = span
+        text = span.string
+        if text:
+            for key, matches in _SPAN_TEXT_MATCHERS:
+                if key not in found and matches(text):
+                    found[key] = span
+        if len(found) == wanted:
+            break
+    return found
+
+
+def _find_location(soup):
+    """First div.flex whose first <svg> is the map pin and whose first <span> holds a real location."""
+    pins = set()
+    for svg in soup.find_all("svg"):
+        path_data = " ".join(p.get("d", "") for p in svg.find_all("path"))
+        if LOCATION_PIN_PATHS[0] in path_data and LOCATION_PIN_PATHS[1] in path_data:
+            pins.add(id(svg))
+    if not pins:
+        return None
+
+    for container in LOCATION_CONTAINER.select(soup):
+        svg = container.find("svg")
+        if svg is None or id(svg) not in pins:
+            continue
+        span = container.find("span")
+        if not span:
+            continue
+        text = span.get_text(strip=True)
+        if not text or text.lower() in ("loading...", "hiringcafe"):
+            continue
+        return text
+    return None
+
+
+def parse_job_sections(html, now=None):
+    """Parse job info, company info, and job description from rendered HTML (or a parsed soup).
+
+    Relative posted dates ("Posted 3d ago") are resolved against ``now``,
+    the time the page was fetched; by default the current time.
+    """
+    soup = _as_soup(html)
     data = {}
 
     # --- Basic Job Info ---
     title = soup.find("h2", class_="font-extrabold")
+    spans = _scan_spans(soup)
+
     #EXTRACT COMPANY NAME 
-    company = soup.find(
-        "span",
-        class_=lambda c: c and "text-xl" in c and "font-semibold" in c and "text-gray-700" in c
-    )
+    company = spans.get("company")
     company_name = "N/A"
     if company:
         # Extract text safely and remove leading '@' and artifacts
         text_parts = [t.strip() for t in company.stripped_strings if t.strip()]
         company_name = " ".join(text_parts)
         company_name = company_name.replace("@", "").strip()
-    
-    salary = soup.find("span", string=lambda t: "$" in t)
-    posted_text_node = soup.find(string=re.compile(r'\bPosted\b', re.I))
+
+    salary = spans.get("salary")
+    posted_text_node = soup.find(string=POSTED_RE)
     posted_tag = posted_text_node.parent if posted_text_node else None
 
-    
-    work_mode = soup.find("span", string=lambda t: t and any(x in t for x in ["Remote", "Onsite", "Hybrid"]))
-    employment_type = soup.find("span", string=lambda t: t and any(x in t for x in ["Full Time", "Part Time","Temporary","Contract","All Commitments Available"]))
-    
-    # --- Location parsing (fixed) ---
+    work_mode = spans.get("work_mode")
+    employment_type = spans.get("employment_type")
+
+    # --- Location parsing ---
     location = None
     location_choices = []
-    
-    # Try to find location container with the map pin icon
-    loc_containers = soup.select('div.flex')
-    for container in loc_containers:
-        # Verify this div has the map pin SVG with the correct path pattern
-        svg = container.find('svg')
-        if not svg:
-            continue
-            
-        # Check if this is the location pin SVG by looking at its paths
-        paths = svg.find_all('path')
-        path_data = ' '.join(p.get('d', '') for p in paths)
-        # Location pin SVG has specific path data containing these patterns
-        if not ('M15 10.5a3 3 0' in path_data and 'M19.5 10.5c0 7.142' in path_data):
-            continue
-            
-        # Find the span next to SVG
-        span = container.find('span')
-        if not span:
-            continue
-            
-        # Skip loading placeholder
-        text = span.get_text(strip=True)
-        if not text or text.lower() in ('loading...', 'hiringcafe'):
-            continue
-            
-        # Found valid location text
+    text = _find_location(soup)
+    if text:
         if ' or ' in text:
             location_choices = [loc.strip() for loc in text.split(' or ')]
             location = location_choices[0]
         else:
             location = text
             location_choices = [text]
-        break  # Found valid location, stop searching
 
     # Store results
     data["location"] = location if location else "N/A" 
@@ -136,20 +220,20 @@ def parse_job_sections(html):
     # parse and normalize posted date
     if posted_tag:
         pd_text = posted_tag.get_text(strip=True)
-        parsed = parse_posted_date_text(pd_text)
+        parsed = parse_posted_date_text(pd_text, now)
         data["posted_date"] = parsed if parsed else pd_text
     else:
         data["posted_date"] = "N/A"
 
-    data["responsibilities"] = extract_text_after_button(soup, "Responsibilities")
-    data["requirements"] = extract_text_after_button(soup, "Requirements Summary")
+    data["responsibilities"] = _text_after(spans.get("responsibilities"))
+    data["requirements"] = _text_after(spans.get("requirements"))
 
     return data
 
 
 def parse_company_info_table(html):
     """Parse the company info table with proper key-value mapping."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _as_soup(html)
     table = soup.find("table", class_="table-auto")
     company_info = {}
 
@@ -178,159 +262,326 @@ def parse_company_info_table(html):
     return company_info
 
 
-async def crawl_full_job_with_tabs(job_url):
-    """Async version: render a full job page and extract Job Info + Company Info + Job Description + Website."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page()
-        print(f"🌐 Opening {job_url}")
-        
-        # Increase initial page load timeout and wait
-        await page.goto(job_url, wait_until="networkidle", timeout=90000)
-        await page.wait_for_timeout(3000)  # Initial wait for JS to settle
+def parse_job_description(html):
+    """Return the Job Description tab text, or "N/A"."""
+    soup = _as_soup(html)
+    desc_section = soup.find("div", class_="flex flex-col")
+    return desc_section.get_text(" ", strip=True) if desc_section else "N/A"
 
-        result = {"job_url": job_url}
 
-        # --- Tab 1: Job Info (default) ---
-        html_job = await page.content()
-        result.update(parse_job_sections(html_job))
+def _is_external(href):
+    return href.startswith(("http://", "https://")) and "hiring.cafe" not in href
 
-        # --- Tab 2: Company Info (improved) ---
+
+def _first_tag_containing(root, names, needle):
+    """First tag (document order) named in ``names`` whose stripped text contains ``needle``.
+
+    A tag's ``get_text(strip=True)`` always contains each descendant's, so
+    subtrees whose root text lacks ``needle`` are skipped without visiting them.
+    """
+    stack = [root]
+    while stack:
+        tag = stack.pop()
+        if needle not in tag.get_text(strip=True).lower():
+            continue
+        if tag is not root and tag.name in names:
+            return tag
+        stack.extend(reversed([c for c in tag.contents if isinstance(c, Tag)]))
+    return None
+
+
+def parse_website_fallback(html):
+    """Find the company website in static HTML when the Website button gave nothing."""
+    soup = _as_soup(html)
+    a = soup.find("a", string=WEBSITE_RE)
+    if a and a.get("href") and _is_external(a["href"]):
+        return a["href"]
+
+    btn = _first_tag_containing(soup, ("button", "div", "span"), "website")
+    if btn:
+        parent = btn.parent
+        if parent:
+            link = parent.find("a", href=True)
+            if link and _is_external(link["href"]):
+                return link["href"]
+
+    for link in soup.find_all("a", href=True):
+        if _is_external(link["href"]):
+            return link["href"]
+    return None
+
+
+async def crawl_full_job_with_tabs(
+    job_url, page=None, waits=None, snapshot=None, metrics=None, company_cache=None, parser=None,
+    service_url=None, config=None, logger=None,
+):
+    """Async version: render a full job page and extract Job Info + Company Info + Job Description + Website.
+
+    Pass a ``page`` borrowed from a ``BrowserPool`` to reuse a warm browser;
+    without one a throwaway Chromium is launched for this single job, or a
+    context is opened on the browser service at ``service_url`` (default:
+    ``config``'s BROWSER_SERVICE_URL) if it is up.
+    That Chromium follows ``config``'s HEADLESS / BROWSER_PROFILE like the
+    pool does; without a config it runs the headless "server" profile.
+    ``waits`` is a shared ``WaitEngine`` so wait timings are aggregated per run.
+    When ``snapshot`` is a dict it receives each tab's raw HTML (see
+    ``build_job_record``) so the job can be re-parsed later without a browser.
+    ``metrics`` collects per-stage timers, retry counts and error classes.
+    With a ``CompanyCache``, a company seen recently skips the Company Info
+    tab and the website click; fresh results are stored back into it.
+    ``parser`` runs the HTML extraction (a ``ParsePool`` moves it off the
+    event loop into worker processes); by default it runs inline.
+    Per-job progress and retries go to ``logger`` (the crawler's queued
+    logger), never straight to stdout.
+    """
+    waits = waits or WaitEngine()
+    metrics = metrics or Metrics()
+    parser = parser or InlineParser()
+    if page is not None:
+        return await _crawl_job_page(page, job_url, waits, snapshot, metrics, company_cache, parser, logger)
+
+    async with async_playwright() as p:
+        profile = launch_profile(config) if config is not None else launch_profile({}, "server")
+        service_url = service_url or (config or {}).get("BROWSER_SERVICE_URL")
+        browser, _ = await acquire_browser(p, service_url, profile)
+        context = await browser.new_context(**({"viewport": profile["viewport"]} if profile["viewport"] else {}))
         try:
-            # Click Company Info tab with retry
-            for attempt in range(3):
-                try:
+            page = await context.new_page()
+            return await _crawl_job_page(page, job_url, waits, snapshot, metrics, company_cache, parser, logger)
+        finally:
+            await context.close()
+            await browser.close()
+
+
+def build_job_record(job_url, tabs, clicked_website=None, cached_company_info=None, now=None):
+    """Rebuild a job record from saved tab HTML, the offline twin of ``_crawl_job_page``.
+
+    ``tabs`` maps ``job_info`` / ``company_info`` (the table) /
+    ``job_description`` to HTML; ``clicked_website`` is the URL the live
+    crawl resolved by clicking "Website", which no snapshot contains.
+    ``cached_company_info`` stands in for the table when the live crawl took
+    it from the company cache instead of opening the tab. ``now`` is the
+    crawl time that relative posted dates are resolved against.
+    """
+    result = {"job_url": job_url}
+    if tabs.get("job_info"):
+        result.update(parse_job_sections(make_soup(tabs["job_info"]), now=now))
+
+    company_data = parse_company_info_table(make_soup(tabs["company_info"])) if tabs.get("company_info") else None
+    if not company_data and cached_company_info:
+        company_data = cached_company_info
+    result["company_info"] = company_data if company_data and not isinstance(company_data, str) else "N/A"
+
+    desc_website = None
+    if tabs.get("job_description"):
+        result["job_description"], desc_website = parse_description_and_website(tabs["job_description"])
+    else:
+        result["job_description"] = "N/A"
+    result["company_website"] = clicked_website or desc_website or "N/A"
+    return result
+
+
+def parse_description_and_website(html):
+    """Job Description text and the static website fallback from one parse of the tab."""
+    soup = _as_soup(html)
+    return parse_job_description(soup), parse_website_fallback(soup)
+
+
+async def _company_info_tab(page, waits, snapshot, metrics, parser, logger):
+    """Open the Company Info tab and parse its table; "N/A" when it never fills in."""
+    company_info = "N/A"
+    try:
+        # Click Company Info tab with retry
+        for attempt in range(3):
+            if attempt:
+                metrics.incr("company_info_retries")
+            try:
+                with metrics.timer("company_info_tab"):
                     await page.click("text=Company Info", timeout=5000)
                     # Wait for table to appear
                     await page.wait_for_selector("table.table-auto", timeout=5000)
-                    await page.wait_for_timeout(2000)  # Additional wait for content
-                    
-                    html_company = await page.content()
-                    company_data = parse_company_info_table(html_company)
+                    await waits.dom_quiet(page, "table.table-auto", quiet_ms=300, timeout_ms=2000, name="company_info_settle")
                     
-                    # Verify we got actual data
-                    if company_data and not isinstance(company_data, str) and len(company_data) > 0:
-                        result["company_info"] = company_data
-                        break
-                    else:
-                        print(f"⚠️ Company Info attempt {attempt+1}: Empty data, retrying...")
-                        await page.wait_for_timeout(2000)
-                except Exception as e:
-                    print(f"⚠️ Company Info attempt {attempt+1} failed: {e}")
-                    await page.wait_for_timeout(2000)
-            else:
-                print("❌ All attempts to get company info failed")
-                result["company_info"] = "N/A"
-        except Exception as e:
-            print(f"⚠️ Company Info section failed: {e}")
-            result["company_info"] = "N/A"
+                    # Only the table is serialized, not the whole page
+                    html_company = await page.eval_on_selector("table.table-auto", "el => el.outerHTML")
+                snapshot["company_info"] = html_company
+                with metrics.timer("parse_company_info"):
+                    company_data = await parser.run(parse_company_info_table, html_company)
+                
+                # Verify we got actual data
+                if company_data and not isinstance(company_data, str) and len(company_data) > 0:
+                    company_info = company_data
+                    break
+                else:
+                    logger.warning(f"⚠️ Company Info attempt {attempt+1}: Empty data, retrying...")
+                    await waits.dom_quiet(page, timeout_ms=2000, name="company_info_retry")
+            except Exception as e:
+                metrics.error("company_info", e)
+                logger.warning(f"⚠️ Company Info attempt {attempt+1} failed: {e}")
+                await waits.dom_quiet(page, timeout_ms=2000, name="company_info_retry")
+        else:
+            logger.warning("❌ All attempts to get company info failed")
+            metrics.incr("company_info_missing")
+            company_info = "N/A"
+    except Exception as e:
+        metrics.error("company_info", e)
+        logger.warning(f"⚠️ Company Info section failed: {e}")
+        company_info = "N/A"
+    return company_info
 
-        # --- Tab 3: Job Description (improved) ---
-        try:
-            await page.click("text=Job Description", timeout=5000)
-            await page.wait_for_timeout(3000)
-            await page.wait_for_selector("div.flex.flex-col", timeout=5000)
-            html_desc = await page.content()
-            soup_desc = BeautifulSoup(html_desc, "html.parser")
-            desc_section = soup_desc.find("div", class_="flex flex-col")
-            result["job_description"] = (
-                desc_section.get_text(" ", strip=True) if desc_section else "N/A"
-            )
-        except Exception as e:
-            print(f"⚠️ Job Description not found: {e}")
-            result["job_description"] = "N/A"
-
-        # --- Website extraction (async-safe) ---
-        try:
-            website_url = None
 
-            website_selector_candidates = [
-                'button:has-text("Website")',
-                'a:has-text("Website")',
-                '[role="button"]:has-text("Website")',
-                '[data-test="company-website"]',
-            ]
+async def _resolve_website(page, waits, snapshot, metrics, parser, logger, has_desc=False, desc_website=None):
+    """Click "Website" (popup, navigation or href) and fall back to the static HTML.
 
-            website_elem = None
-            for sel in website_selector_candidates:
+    ``desc_website`` is the fallback already found in the Job Description
+    tab (``has_desc``); it is used when no Website button was clicked.
+    """
+    website_started = time.perf_counter()
+    website_source = "none"
+    website_url = None
+    try:
+        website_selector_candidates = [
+            'button:has-text("Website")',
+            'a:has-text("Website")',
+            '[role="button"]:has-text("Website")',
+            '[data-test="company-website"]',
+        ]
+
+        website_elem = None
+        for sel in website_selector_candidates:
+            try:
+                website_elem = await page.query_selector(sel)
+            except Exception:
+                website_elem = None
+            if website_elem:
+                break
+
+        if website_elem:
+            try:
+                async with page.context.expect_page(timeout=4000) as popup_info:
+                    await website_elem.click()
+                popup = await popup_info.value
                 try:
-                    website_elem = await page.query_selector(sel)
+                    await popup.wait_for_load_state("load", timeout=5000)
                 except Exception:
-                    website_elem = None
-                if website_elem:
-                    break
-
-            if website_elem:
+                    pass
+                popup_url = popup.url or None
+                if popup_url and popup_url.startswith(("http://", "https://")) and "hiring.cafe" not in popup_url:
+                    website_url = popup_url
+                    website_source = "popup"
                 try:
-                    async with page.context.expect_page(timeout=4000) as popup_info:
-                        await website_elem.click()
-                    popup = await popup_info.value
-                    try:
-                        await popup.wait_for_load_state("load", timeout=5000)
-                    except Exception:
-                        pass
-                    popup_url = popup.url or None
-                    if popup_url and popup_url.startswith(("http://", "https://")) and "hiring.cafe" not in popup_url:
-                        website_url = popup_url
-                    try:
-                        await popup.close()
-                    except Exception:
-                        pass
+                    await popup.close()
                 except Exception:
-                    try:
-                        original_url = page.url
-                        await website_elem.click()
-                        await page.wait_for_timeout(1500)
-                        new_url = page.url
-                        if (
-                            new_url != original_url
-                            and new_url.startswith(("http://", "https://"))
-                            and "hiring.cafe" not in new_url
-                        ):
-                            website_url = new_url
-                        else:
-                            href = await website_elem.get_attribute("href")
-                            if not href:
-                                href = await website_elem.get_attribute("data-href") or await website_elem.get_attribute("data-url")
-                            if href and href.startswith(("http://", "https://")) and "hiring.cafe" not in href:
-                                website_url = href
-                    except Exception:
-                        pass
-
-            if not website_url:
-                html_after = await page.content()
-                soup_after = BeautifulSoup(html_after, "html.parser")
-                a = soup_after.find("a", string=re.compile(r'Website', re.I))
-                if a and a.get("href"):
-                    href = a["href"]
-                    if href.startswith(("http://", "https://")) and "hiring.cafe" not in href:
-                        website_url = href
-                if not website_url:
-                    btn = soup_after.find(
-                        lambda tag: tag.name in ["button", "div", "span"]
-                        and tag.get_text(strip=True)
-                        and "website" in tag.get_text(strip=True).lower()
-                    )
-                    if btn:
-                        parent = btn.parent
-                        if parent:
-                            link = parent.find("a", href=True)
-                            if link:
-                                href = link["href"]
-                                if href.startswith(("http://", "https://")) and "hiring.cafe" not in href:
-                                    website_url = href
-                if not website_url:
-                    for link in soup_after.find_all("a", href=True):
-                        href = link["href"]
-                        if href.startswith(("http://", "https://")) and "hiring.cafe" not in href:
+                    pass
+            except Exception:
+                try:
+                    original_url = page.url
+                    await website_elem.click()
+                    await waits.url_change(page, original_url, timeout_ms=1500, name="website_navigation")
+                    new_url = page.url
+                    if (
+                        new_url != original_url
+                        and new_url.startswith(("http://", "https://"))
+                        and "hiring.cafe" not in new_url
+                    ):
+                        website_url = new_url
+                        website_source = "navigation"
+                    else:
+                        href = await website_elem.get_attribute("href")
+                        if not href:
+                            href = await website_elem.get_attribute("data-href") or await website_elem.get_attribute("data-url")
+                        if href and href.startswith(("http://", "https://")) and "hiring.cafe" not in href:
                             website_url = href
-                            break
+                            website_source = "href"
+                except Exception as e:
+                    metrics.error("website_click", e)
 
-            result["company_website"] = website_url or "N/A"
-        except Exception as e:
-            print(f"⚠️ Website extraction failed: {e}")
-            result["company_website"] = "N/A"
+        snapshot["clicked_website"] = website_url
 
-        await page.wait_for_timeout(1000)  # Final wait before closing
-        await browser.close()
-        return result
\ No newline at end of file
+        if not website_url:
+            # Nothing was clicked since the description snapshot, so reuse its result
+            if website_elem is None and has_desc:
+                website_url = desc_website
+            else:
+                website_url = await parser.run(parse_website_fallback, await page.content())
+            if website_url:
+                website_source = "fallback"
+
+        website_url = website_url or "N/A"
+    except Exception as e:
+        metrics.error("website", e)
+        logger.warning(f"⚠️ Website extraction failed: {e}")
+        website_url = "N/A"
+    metrics.observe("stage_seconds", time.perf_counter() - website_started, stage="website")
+    metrics.incr("website_source", source=website_source)
+    return website_url
+
+
+async def _crawl_job_page(
+    page, job_url, waits, snapshot=None, metrics=None, company_cache=None, parser=None, logger=None
+):
+    """Extract every tab of one job page using an already open ``page``."""
+    snapshot = snapshot if snapshot is not None else {}
+    metrics = metrics or Metrics()
+    parser = parser or InlineParser()
+    logger = logger or log
+    logger.debug(f"🌐 Opening {job_url}")
+    
+    # Increase initial page load timeout and wait
+    with metrics.timer("navigate"):
+        await page.goto(job_url, wait_until="networkidle", timeout=90000)
+    # Wait for the title to render, then for React to stop patching the DOM
+    with metrics.timer("job_info_tab"):
+        await waits.selector(page, "h2.font-extrabold", timeout_ms=3000, name="job_title")
+        await waits.dom_quiet(page, timeout_ms=3000, name="job_info_settle")
+        html_job = await page.content()
+
+    result = {"job_url": job_url}
+
+    # --- Tab 1: Job Info (default) ---
+    snapshot["job_info"] = html_job
+    with metrics.timer("parse_job_info"):
+        result.update(await parser.run(parse_job_sections, html_job))
+
+    # --- Company cache: jobs of an already seen company skip Tab 2 and the website ---
+    cached = company_cache.get(result.get("company")) if company_cache is not None else None
+    if company_cache is not None:
+        metrics.incr("company_cache", outcome="hit" if cached else "miss")
+    if cached:
+        result["company_info"] = cached["company_info"]
+        snapshot["cached_company_info"] = cached["company_info"]
+    else:
+        # --- Tab 2: Company Info (improved) ---
+        result["company_info"] = await _company_info_tab(page, waits, snapshot, metrics, parser, logger)
+
+    # --- Tab 3: Job Description (improved) ---
+    has_desc = False
+    desc_website = None
+    try:
+        with metrics.timer("job_description_tab"):
+            await page.click("text=Job Description", timeout=5000)
+            await page.wait_for_selector("div.flex.flex-col", timeout=5000)
+            await waits.dom_quiet(page, timeout_ms=3000, name="job_description_settle")
+            html_desc = await page.content()
+        snapshot["job_description"] = html_desc
+        with metrics.timer("parse_job_description"):
+            result["job_description"], desc_website = await parser.run(parse_description_and_website, html_desc)
+        has_desc = True
+    except Exception as e:
+        metrics.error("job_description", e)
+        logger.warning(f"⚠️ Job Description not found: {e}")
+        result["job_description"] = "N/A"
+
+    # --- Website extraction (async-safe) ---
+    if cached:
+        snapshot["clicked_website"] = cached["company_website"]
+        result["company_website"] = cached["company_website"] or "N/A"
+    else:
+        result["company_website"] = await _resolve_website(
+            page, waits, snapshot, metrics, parser, logger, has_desc, desc_website
+        )
+        if company_cache is not None:
+            website = result["company_website"]
+            company_cache.put(result.get("company"), result["company_info"], website if website != "N/A" else None)
+
+    return result
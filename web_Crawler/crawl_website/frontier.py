@@ -0,0 +1,136 @@
+import sqlite3
+import time
+
+DISCOVERED = "discovered"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    discovered_at REAL NOT NULL,
+    last_crawled REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_urls_state ON urls(state);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class CrawlFrontier:
+    """SQLite-backed crawl frontier with one state row per job URL.
+
+    States move ``discovered -> in_flight -> done | failed``. Every call
+    commits, so a crash loses at most the job that was being rendered; on
+    the next run ``recover_in_flight`` puts those back to ``discovered``.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ---------------- discovery ----------------
+    def add_discovered(self, urls, now=None):
+        """Insert new URLs as ``discovered``; known URLs keep their state. Returns how many were new."""
+        now = now or time.time()
+        before = self.conn.total_changes
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO urls (url, state, discovered_at) VALUES (?, ?, ?)",
+            ((url, DISCOVERED, now) for url in urls),
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def seed_done(self, url, crawled_at):
+        """Record a job crawled before the frontier existed (e.g. an existing result file)."""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO urls (url, state, attempts, discovered_at, last_crawled) VALUES (?, ?, 0, ?, ?)",
+            (url, DONE, crawled_at, crawled_at),
+        )
+        self.conn.commit()
+
+    # ---------------- detail crawling ----------------
+    def mark_in_flight(self, url):
+        self.conn.execute(
+            "UPDATE urls SET state = ?, attempts = attempts + 1 WHERE url = ?",
+            (IN_FLIGHT, url),
+        )
+        self.conn.commit()
+
+    # A success resets ``attempts``: it counts consecutive failures, not stale recrawls.
+    def mark_done(self, url, now=None):
+        self.conn.execute(
+            "UPDATE urls SET state = ?, attempts = 0, last_crawled = ?, last_error = NULL WHERE url = ?",
+            (DONE, now or time.time(), url),
+        )
+        self.conn.commit()
+
+    def mark_done_many(self, urls, now=None):
+        now = now or time.time()
+        self.conn.executemany(
+            "UPDATE urls SET state = ?, attempts = 0, last_crawled = ?, last_error = NULL WHERE url = ?",
+            ((DONE, now, url) for url in urls),
+        )
+        self.conn.commit()
+
+    def mark_failed(self, url, error=None):
+        self.conn.execute(
+            "UPDATE urls SET state = ?, last_error = ? WHERE url = ?",
+            (FAILED, str(error)[:500] if error else None, url),
+        )
+        self.conn.commit()
+
+    def recover_in_flight(self):
+        """Return jobs left ``in_flight`` by a crashed run to ``discovered``."""
+        cur = self.conn.execute("UPDATE urls SET state = ? WHERE state = ?", (DISCOVERED, IN_FLIGHT))
+        self.conn.commit()
+        return cur.rowcount
+
+    def pending(self, stale_after=None, max_attempts=3, now=None):
+        """URLs that still need a detail crawl, oldest discoveries first.
+
+        That is every ``discovered`` URL, ``failed`` URLs with attempts left,
+        and ``done`` URLs last crawled more than ``stale_after`` seconds ago.
+        """
+        now = now or time.time()
+        cutoff = now - stale_after if stale_after is not None else None
+        rows = self.conn.execute(
+            """
+            SELECT url FROM urls
+            WHERE state = ?
+               OR (state = ? AND attempts < ?)
+               OR (state = ? AND ? IS NOT NULL AND last_crawled < ?)
+            ORDER BY discovered_at, url
+            """,
+            (DISCOVERED, FAILED, max_attempts, DONE, cutoff, cutoff),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    # ---------------- bookkeeping ----------------
+    def set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+        self.conn.commit()
+
+    def get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def counts(self):
+        """Number of URLs per state."""
+        return dict(self.conn.execute("SELECT state, COUNT(*) FROM urls GROUP BY state").fetchall())
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
@@ -0,0 +1,253 @@
+"""Columnar, typed dataset of the stored job records.
+
+Usage (from the repository root):
+
+    python -m web_Crawler.crawl_website.job_dataset --config web_Crawler/config/hiring_caffe_config.yaml
+
+Loads the latest record per job from RESULT_SINK and writes
+``result_it_vn/jobs_normalized.parquet`` with:
+
+* ``salary_min`` / ``salary_max`` / ``salary_currency`` / ``salary_period``
+  and the yearly ``salary_year_min`` / ``salary_year_max``
+* ``posted_at`` and ``crawled_at`` timestamps
+* one boolean ``work_mode_<mode>`` column per work mode
+* ``company_employees_min`` / ``company_employees_max`` and
+  ``company_year_founded`` integers from ``company_info``
+
+Every field is normalized with column-wide pandas operations that reuse
+the patterns of ``job_fields`` and ``crawl_utils``; repeated strings
+become categoricals, and the long text columns are only loaded with
+``--text``.
+"""
+import argparse
+import json
+import os
+import re
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from web_Crawler.crawl_website.api_discovery import VIEWJOB_RE
+from web_Crawler.crawl_website.crawl_utils import (
+    ABSOLUTE_DATE_FORMATS,
+    POSTED_PREFIX_RE,
+    RELATIVE_DATE_RE,
+    TODAY_RE,
+    WORK_MODES,
+    YESTERDAY_RE,
+)
+from web_Crawler.crawl_website.job_fields import CURRENCY_SYMBOLS, MULTIPLIERS, PERIODS, PERIODS_PER_YEAR, SALARY_RE
+from web_Crawler.crawl_website.result_sink import JOB_COLUMNS, MANIFEST_NAME, iter_sink_records, pa, pq
+from web_Crawler.utils.utils import load_config
+
+TEXT_COLUMNS = ("job_description", "responsibilities", "requirements")
+LOAD_COLUMNS = [name for name in JOB_COLUMNS if name not in TEXT_COLUMNS] + ["company_info", "crawled_at"]
+# company_info keys; the first one a record has wins
+COMPANY_FIELDS = {
+    "employees": ("Num Employees", "Employees"),
+    "year_founded": ("Year Founded",),
+    "industries": ("Industries",),
+    "country": ("Headquarters Country",),
+}
+EMPLOYEES_RE = re.compile(r"^\s*(?P<min>\d[\d,]*)\s*(?:(?:-|–|to)\s*(?P<max>\d[\d,]*)|(?P<plus>\+))?")
+UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def load_records(config, res_dir, text=False):
+    """DataFrame of the latest stored record per ``job_url`` (text columns only when ``text``)."""
+    columns = LOAD_COLUMNS + (list(TEXT_COLUMNS) if text else [])
+    sink_dir = os.path.join(res_dir, "parquet")
+    if config.get("RESULT_SINK", "files") == "parquet" and pq is not None:
+        # Straight from the Parquet columns: company_info stays JSON text and no record is built.
+        manifest_path = os.path.join(sink_dir, MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return pd.DataFrame(columns=columns)
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            segments = json.load(f)["segments"]
+        tables = [pq.read_table(os.path.join(sink_dir, segment["path"]), columns=columns) for segment in segments]
+        if not tables:
+            return pd.DataFrame(columns=columns)
+        frame = pa.concat_tables(tables).to_pandas()
+    else:
+        frame = pd.DataFrame.from_records(iter_sink_records(config, res_dir), columns=columns)
+    return frame.drop_duplicates("job_url", keep="last").reset_index(drop=True)
+
+
+def _clean(series):
+    """Stripped strings with "N/A" and blanks as missing."""
+    series = series.astype("string[pyarrow]").str.strip()
+    return series.mask(series.isin(["", "N/A"]))
+
+
+def _number(series):
+    return pd.to_numeric(series.str.replace(",", "", regex=False), errors="coerce")
+
+
+def _per_value(series, normalize):
+    """``normalize`` run on the distinct values of ``series`` only, then broadcast back to every row.
+
+    Salaries, work modes, posted dates and company tables repeat across
+    thousands of jobs, so the string work scales with the distinct values.
+    """
+    codes, uniques = pd.factorize(series)
+    values = normalize(pd.Series([*uniques, None], dtype=object))
+    result = values.take(np.where(codes < 0, len(uniques), codes))
+    result.index = series.index
+    return result
+
+
+def _categorical(series):
+    """``series`` cleaned as a categorical; distinct values are only cleaned once."""
+    codes, uniques = pd.factorize(series)
+    value_codes, categories = pd.factorize(_clean(pd.Series(uniques, dtype=object)))
+    codes = np.append(value_codes, -1)[codes]  # a missing value (-1) picks the appended -1
+    return pd.Series(pd.Categorical.from_codes(codes, categories), index=series.index)
+
+
+def normalize_salary(salary):
+    """``salary_*`` columns for a Series of salary texts; the vectorized twin of ``parse_salary``."""
+    parts = _clean(salary).astype(object).str.extract(SALARY_RE.pattern, flags=SALARY_RE.flags)
+    low = _number(parts["min"]) * parts["min_mult"].str.lower().map(MULTIPLIERS).fillna(1).astype(float)
+    max_mult = parts["max_mult"].str.lower().map(MULTIPLIERS).astype(float)
+    high = (_number(parts["max"]) * max_mult.fillna(1)).fillna(low)
+    # "$80-120k" means 80k-120k: a bare lower bound borrows the upper bound's multiplier.
+    borrow = parts["max"].notna() & parts["min_mult"].isna() & max_mult.notna() & (low < high / 1e3)
+    low = low.mask(borrow, low * max_mult)
+    period = parts["period"].str.lower().map(PERIODS)
+    per_year = period.map(PERIODS_PER_YEAR).astype(float)
+    return pd.DataFrame({
+        "salary_min": low,
+        "salary_max": high,
+        "salary_currency": parts["currency"].str.upper().replace(CURRENCY_SYMBOLS),
+        "salary_period": period,
+        "salary_year_min": low * per_year,
+        "salary_year_max": high * per_year,
+    })
+
+
+def normalize_posted(posted):
+    """``posted_at`` and ``posted_ago`` for a Series of posted-date texts.
+
+    Crawled records already hold "YYYY-MM-DD HH:MM:SS". The raw texts
+    ``parse_posted_date_text`` fell back to get its absolute formats
+    (``posted_at``) and then its relative ones ("3d ago", "yesterday"),
+    which give ``posted_ago`` to count back from the crawl time.
+    """
+    text = _clean(posted).astype(object).str.replace(POSTED_PREFIX_RE, "", regex=True).str.strip()
+    posted_at = pd.to_datetime(text, format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    for fmt in ABSOLUTE_DATE_FORMATS:
+        posted_at = posted_at.fillna(pd.to_datetime(text.where(posted_at.isna()), format=fmt, errors="coerce"))
+    rest = posted_at.isna() & text.notna()
+    relative = text.where(rest).str.extract("^" + RELATIVE_DATE_RE.pattern, flags=RELATIVE_DATE_RE.flags)
+    seconds = pd.to_numeric(relative["num"]) * relative["unit"].str[0].str.lower().map(UNIT_SECONDS)
+    ago = pd.to_timedelta(seconds, unit="s")
+    ago = ago.mask(ago.isna() & rest & text.str.contains(YESTERDAY_RE, na=False), pd.Timedelta(days=1))
+    ago = ago.mask(ago.isna() & rest & text.str.contains(TODAY_RE, na=False), pd.Timedelta(0))
+    return pd.DataFrame({"posted_at": posted_at, "posted_ago": ago})
+
+
+def normalize_work_modes(work_mode):
+    """One boolean ``work_mode_<mode>`` column per ``WORK_MODES`` entry ("Remote · Hybrid" sets two)."""
+    work_mode = _clean(work_mode)
+    return pd.DataFrame({
+        f"work_mode_{mode.lower()}": work_mode.str.contains(rf"\b{mode}\b", case=False, regex=True).fillna(False)
+        .astype(bool)
+        for mode in WORK_MODES
+    })
+
+
+def _employees(employees):
+    parts = _clean(employees).astype(object).str.extract(EMPLOYEES_RE.pattern)
+    low = _number(parts["min"]).astype("Int64")
+    return pd.DataFrame({
+        "company_employees_min": low,
+        "company_employees_max": _number(parts["max"]).astype("Int64").fillna(low).mask(parts["plus"].notna()),
+    })
+
+
+def normalize_company(info):
+    """``company_*`` columns (employee range, founding year, industries, country) from ``company_info``.
+
+    ``info`` holds dicts, or their JSON text as stored by the Parquet sink.
+    """
+    records = [json.loads(value) if isinstance(value, str) and value.startswith("{") else value for value in info]
+    keys = [key for names in COMPANY_FIELDS.values() for key in names]
+    raw = pd.DataFrame.from_records(
+        [record if isinstance(record, dict) else {} for record in records], columns=keys, index=info.index
+    )
+    fields = {}
+    for name, names in COMPANY_FIELDS.items():
+        fields[name] = raw[names[0]]
+        for key in names[1:]:
+            fields[name] = fields[name].where(fields[name].notna(), raw[key])
+    out = _per_value(fields["employees"], _employees)
+    out["company_year_founded"] = pd.to_numeric(_clean(fields["year_founded"]), errors="coerce").astype("Int16")
+    out["company_industries"] = _clean(fields["industries"])
+    out["company_country"] = _categorical(fields["country"])
+    return out
+
+
+def normalize_jobs(frame, now=None):
+    """Typed, normalized columns for a DataFrame of raw job records (see ``load_records``)."""
+    if pa is None:
+        raise RuntimeError("Building the job dataset needs pyarrow: pip install pyarrow")
+    now = pd.Timestamp(now or datetime.now())
+    job_url = frame["job_url"].astype(pd.ArrowDtype(pa.string()))
+    out = pd.DataFrame({
+        "job_url": job_url.astype("string[pyarrow]"),
+        "job_id": job_url.str.extract(VIEWJOB_RE.pattern.replace("(", "(?P<id>", 1), expand=False)
+        .astype("string[pyarrow]"),
+        "job_title": _clean(frame["job_title"]),
+    })
+    missing = pd.Series(None, index=frame.index, dtype=object)
+    for name in ("company", "location", "employment_type"):
+        out[name] = _categorical(frame.get(name, missing))
+    out["company_website"] = _clean(frame.get("company_website", missing))
+    out = out.join(_per_value(frame["salary"], normalize_salary))
+    out = out.join(_per_value(frame["work_mode"], normalize_work_modes))
+
+    crawled_at = pd.to_datetime(frame.get("crawled_at", missing), errors="coerce", format="ISO8601")
+    posted = _per_value(frame["posted_date"], normalize_posted)
+    out["posted_at"] = posted["posted_at"].fillna(crawled_at.fillna(now) - posted["posted_ago"])
+    out["crawled_at"] = crawled_at
+    if "company_info" in frame:
+        info = frame["company_info"]
+        # JSON text (Parquet) is hashable, so each distinct company table is decoded once.
+        json_text = not any(isinstance(value, dict) for value in info)
+        out = out.join(_per_value(info, normalize_company) if json_text else normalize_company(info))
+    for name in TEXT_COLUMNS:
+        if name in frame:
+            text = frame[name].map(lambda value: ", ".join(value) if isinstance(value, list) else value)
+            out[name] = _clean(text)
+    for name in ("salary_currency", "salary_period"):
+        out[name] = out[name].astype("category")
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the normalized, typed job dataset")
+    parser.add_argument("--config", default="web_Crawler/config/hiring_caffe_config.yaml")
+    parser.add_argument("--out", default=None, help="default: result_it_vn/jobs_normalized.parquet")
+    parser.add_argument("--text", action="store_true", help="keep description, responsibilities and requirements")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    res_dir = os.path.join(str(config.get("SAVE_ROOT_DIR", ".")), "result_it_vn")
+    started = time.perf_counter()
+    frame = load_records(config, res_dir, text=args.text)
+    loaded = time.perf_counter()
+    dataset = normalize_jobs(frame)
+    normalized = time.perf_counter()
+    out = args.out or os.path.join(res_dir, "jobs_normalized.parquet")
+    dataset.to_parquet(out, index=False)
+    print(f"📦 {len(dataset)} jobs → {out} (load {loaded - started:.1f}s, normalize {normalized - loaded:.1f}s, "
+          f"{dataset.memory_usage(deep=True).sum() / 1e6:.0f} MB in memory)")
+    print(f"   salary parsed: {dataset['salary_min'].notna().sum()}, "
+          f"posted_at parsed: {dataset['posted_at'].notna().sum()}, "
+          f"employees parsed: {dataset['company_employees_min'].notna().sum() if 'company_employees_min' in dataset else 0}")
+
+
+if __name__ == "__main__":
+    main()
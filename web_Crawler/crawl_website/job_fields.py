@@ -0,0 +1,87 @@
+import re
+import unicodedata
+
+# Salary texts look like "$2,500-$4,000/mo", "$18-$29/hr", "€60k/yr" or "₫20,000,000 - ₫30,000,000 per month".
+CURRENCY_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "₫": "VND", "¥": "JPY", "₹": "INR"}
+PERIODS = {
+    "hr": "hour", "hour": "hour", "h": "hour",
+    "day": "day", "d": "day",
+    "wk": "week", "week": "week", "w": "week",
+    "mo": "month", "month": "month", "m": "month",
+    "yr": "year", "year": "year", "y": "year", "annum": "year",
+}
+PERIODS_PER_YEAR = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+MULTIPLIERS = {"k": 1e3, "m": 1e6}
+ISO_CURRENCIES = (
+    "USD", "EUR", "GBP", "VND", "JPY", "INR", "SGD", "AUD", "CAD", "CHF", "CNY", "HKD", "KRW", "THB",
+    "MYR", "IDR", "PHP", "NZD", "SEK", "NOK", "DKK", "PLN", "BRL", "MXN", "ZAR", "AED",
+)
+
+# Codes are matched case-sensitively so words like "Est" or "Pay" are not currencies.
+_CURRENCY = rf"[$€£₫¥₹]|(?-i:\b(?:{'|'.join(ISO_CURRENCIES)})\b)"
+SALARY_RE = re.compile(
+    rf"(?P<currency>{_CURRENCY})?\s*(?P<min>\d[\d,]*(?:\.\d+)?)\s*(?P<min_mult>[kKmM](?![a-z]))?\+?"
+    rf"(?:\s*(?:-|–|—|to)\s*(?:{_CURRENCY})?\s*(?P<max>\d[\d,]*(?:\.\d+)?)\s*(?P<max_mult>[kKmM](?![a-z]))?\+?)?"
+    r"(?:\s*(?:/|per\s+|an?\s+)\s*(?P<period>hour|hr|h|day|d|week|wk|w|month|mo|m|year|yr|y|annum)\b)?",
+    re.I,
+)
+WORK_MODE_SPLIT_RE = re.compile(r"\s*[·•|,/]\s*")
+
+
+def _amount(number, mult):
+    value = float(number.replace(",", ""))
+    return value * MULTIPLIERS[mult.lower()] if mult else value
+
+
+def parse_salary(text):
+    """``{"min", "max", "currency", "period"}`` from a salary text, or None when it has no amount."""
+    if not text or not isinstance(text, str) or text == "N/A":
+        return None
+    match = SALARY_RE.search(text)
+    if match is None:
+        return None
+    low = _amount(match["min"], match["min_mult"])
+    # "$80-120k" means 80k-120k: a bare lower bound borrows the upper bound's multiplier.
+    high = _amount(match["max"], match["max_mult"]) if match["max"] else low
+    if match["max"] and not match["min_mult"] and match["max_mult"] and low < high / 1e3:
+        low *= MULTIPLIERS[match["max_mult"].lower()]
+    currency = match["currency"]
+    return {
+        "min": low,
+        "max": high,
+        "currency": CURRENCY_SYMBOLS.get(currency, currency.upper() if currency else None),
+        "period": PERIODS.get((match["period"] or "").lower()),
+    }
+
+
+def annualize(amount, period):
+    """Yearly equivalent of ``amount`` per ``period`` (None when either is unknown)."""
+    if amount is None or period not in PERIODS_PER_YEAR:
+        return None
+    return amount * PERIODS_PER_YEAR[period]
+
+
+def split_work_modes(text):
+    """"Remote · Hybrid" -> ["Remote", "Hybrid"]; "N/A" and blanks give []."""
+    if not text or not isinstance(text, str) or text == "N/A":
+        return []
+    return [part for part in WORK_MODE_SPLIT_RE.split(text.strip()) if part]
+
+
+def fold(text):
+    """Case- and accent-insensitive form used for matching ("Hồ Chí Minh" -> "ho chi minh")."""
+    text = unicodedata.normalize("NFKD", str(text).replace("đ", "d").replace("Đ", "D"))
+    return " ".join("".join(c for c in text if not unicodedata.combining(c)).casefold().split())
+
+
+def location_values(record):
+    """Every location choice of a record plus its comma-separated parts (city, region, country)."""
+    choices = record.get("location_choices") or [record.get("location")]
+    values = []
+    for choice in choices:
+        if not choice or not isinstance(choice, str) or choice == "N/A":
+            continue
+        for value in [choice, *(part.strip() for part in choice.split(","))]:
+            if value and value not in values:
+                values.append(value)
+    return values
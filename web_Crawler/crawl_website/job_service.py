@@ -0,0 +1,500 @@
+"""Local HTTP service that crawls HiringCafe job details on demand.
+
+Usage (from the repository root):
+
+    python -m web_Crawler.crawl_website.job_service --config web_Crawler/config/hiring_caffe_config.yaml
+
+Endpoints:
+
+    POST /jobs              {"urls": [...], "wait": false, "force": false}  crawl (or serve cached) job URLs
+    GET  /jobs?url=...      latest record of a job URL
+    GET  /jobs/<job_id>     latest record of a /viewjob/<job_id>
+    POST /discoveries       {"crawl": true}  run link discovery, optionally queueing every link
+    GET  /discoveries/<id>  status of a discovery run
+    GET  /search?q=...      full-text search (+ work_mode, employment_type, location, salary_min, currency,
+                            limit, offset) over every indexed job, with facet counts; salary_min
+                            needs a currency
+    GET  /health            queue, cache and crawl counters
+
+The crawler, its browser pool and every SQLite handle live on one asyncio
+loop in a background thread; Flask request threads only hand coroutines to
+that loop. SERVICE_WORKERS workers pull URLs off a queue bounded by
+SERVICE_QUEUE_SIZE (a full queue answers 503). Records younger than
+SERVICE_RESULT_TTL_MINUTES are served from the result cache, and requests
+for a URL that is already queued or crawling share that one crawl. Every
+crawled record is also upserted into the search index (SEARCH_INDEX_DB).
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+from web_Crawler.crawl_website.api_discovery import VIEWJOB_RE
+from web_Crawler.utils.rate_limit import host_of
+from web_Crawler.utils.utils import load_config
+
+try:
+    from flask import Flask, jsonify, request
+except ImportError:  # the service is optional; the crawler itself never needs Flask
+    Flask = None
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    job_url TEXT PRIMARY KEY,
+    job_id TEXT,
+    record TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_job_id ON results(job_id);
+"""
+
+
+def job_id_of(job_url):
+    """The ``<id>`` of a ``/viewjob/<id>`` URL, or None."""
+    match = VIEWJOB_RE.search(job_url or "")
+    return match.group(1) if match else None
+
+
+def is_job_url(url, host):
+    """True for an http(s) ``/viewjob/<id>`` URL on ``host`` (or ``www.`` + host)."""
+    parts = urlsplit(url)
+    return (
+        parts.scheme in ("http", "https")
+        and host_of(url) == host
+        and VIEWJOB_RE.fullmatch(parts.path.rstrip("/")) is not None
+    )
+
+
+class ServiceBusy(Exception):
+    """The crawl queue is full; the client should retry later."""
+
+
+class ResultCache:
+    """Latest record per job URL in SQLite, looked up by URL or job ID."""
+
+    def __init__(self, db_path, ttl_seconds=3600):
+        self.ttl_seconds = ttl_seconds
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def _entry(self, row, now=None):
+        if row is None:
+            return None
+        job_url, job_id, record, fetched_at = row
+        age = (now or time.time()) - fetched_at
+        return {
+            "job_url": job_url,
+            "job_id": job_id,
+            "fetched_at": fetched_at,
+            "age_seconds": round(age, 1),
+            "fresh": age < self.ttl_seconds,
+            "record": json.loads(record),
+        }
+
+    def get(self, job_url, now=None):
+        row = self.conn.execute(
+            "SELECT job_url, job_id, record, fetched_at FROM results WHERE job_url = ?", (job_url,)
+        ).fetchone()
+        return self._entry(row, now)
+
+    def by_id(self, job_id, now=None):
+        row = self.conn.execute(
+            "SELECT job_url, job_id, record, fetched_at FROM results WHERE job_id = ?"
+            " ORDER BY fetched_at DESC LIMIT 1",
+            (job_id,),
+        ).fetchone()
+        return self._entry(row, now)
+
+    def put(self, job_url, record, now=None):
+        row = (job_url, job_id_of(job_url), json.dumps(record, ensure_ascii=False), now or time.time())
+        self.conn.execute("INSERT OR REPLACE INTO results (job_url, job_id, record, fetched_at) VALUES (?, ?, ?, ?)", row)
+        self.conn.commit()
+        return self._entry(row, row[3])
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+class JobService:
+    """Bounded crawl queue with a result cache and one crawl per URL in flight.
+
+    ``crawl(job_url)`` and ``discover()`` are coroutines supplied by the
+    caller (``build_service`` wires them to ``HiringCaffeITCrawler``);
+    ``search`` is an optional ``SearchIndex`` kept up to date with each crawl.
+    Every method must run on the loop the service was started on.
+    """
+
+    def __init__(self, crawl, discover=None, cache=None, workers=4, queue_size=1000, search=None):
+        self.crawl = crawl
+        self.discover = discover
+        self.cache = cache
+        self.search = search
+        self.workers = max(1, int(workers))
+        self._queue = asyncio.Queue(maxsize=max(1, int(queue_size)))
+        self._inflight = {}  # job_url -> Future shared by every request for it
+        self._tasks = []
+        self._discovery = None
+        self._current_run = None
+        self._run_ids = itertools.count(1)
+        self.runs = {}
+        self.stats = {"requests": 0, "cache_hits": 0, "collapsed": 0, "queued": 0, "rejected": 0,
+                      "crawled": 0, "failed": 0, "crawl_seconds": 0.0}
+
+    async def start(self):
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for future in self._inflight.values():
+            if not future.done():
+                future.cancel()
+        self._inflight.clear()
+
+    # ---------------- jobs ----------------
+    def request(self, job_url, force=False):
+        """``("cached", entry)`` for a fresh record, else ``("queued" | "in_flight", future)``.
+
+        Raises ``ServiceBusy`` when a new crawl does not fit in the queue.
+        """
+        self.stats["requests"] += 1
+        if not force and self.cache is not None:
+            entry = self.cache.get(job_url)
+            if entry is not None and entry["fresh"]:
+                self.stats["cache_hits"] += 1
+                return "cached", entry
+        future = self._inflight.get(job_url)
+        if future is not None:
+            self.stats["collapsed"] += 1
+            return "in_flight", future
+        if self._queue.full():
+            self.stats["rejected"] += 1
+            raise ServiceBusy(f"crawl queue is full ({self._queue.maxsize})")
+        future = asyncio.get_running_loop().create_future()
+        # Nobody may await a fire-and-forget crawl; retrieve its error so it is not reported as lost.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[job_url] = future
+        self._queue.put_nowait(job_url)
+        self.stats["queued"] += 1
+        return "queued", future
+
+    async def submit(self, job_urls, force=False, wait=False, timeout=None):
+        """Request every URL; with ``wait`` the crawls are awaited (at most ``timeout`` seconds)."""
+        results = []
+        for job_url in job_urls:
+            try:
+                status, value = self.request(job_url, force)
+            except ServiceBusy as e:
+                results.append({"job_url": job_url, "status": "rejected", "error": str(e)})
+                continue
+            if status == "cached":
+                results.append({**value, "status": "cached"})
+            else:
+                results.append({"job_url": job_url, "job_id": job_id_of(job_url), "status": status, "future": value})
+        if wait:
+            await asyncio.gather(*(self._settle(item, timeout) for item in results if "future" in item))
+        for item in results:
+            item.pop("future", None)
+        return results
+
+    async def _settle(self, item, timeout):
+        try:
+            # shield: a client giving up must not cancel the crawl other requests share.
+            entry = await asyncio.wait_for(asyncio.shield(item["future"]), timeout)
+        except asyncio.TimeoutError:
+            item["status"] = "pending"
+        except Exception as e:
+            item.update(status="failed", error=f"{type(e).__name__}: {e}")
+        else:
+            item.update(entry, status="done")
+
+    def lookup(self, job_url=None, job_id=None):
+        """Latest cached entry (fresh or not), ``{"status": "in_flight"}`` while crawling, else None."""
+        entry = None
+        if self.cache is not None:
+            entry = self.cache.get(job_url) if job_url else self.cache.by_id(job_id)
+        if job_url is None:
+            job_url = entry["job_url"] if entry else next((url for url in self._inflight if job_id_of(url) == job_id), None)
+        if job_url in self._inflight:
+            return {**(entry or {"job_url": job_url, "job_id": job_id_of(job_url)}), "status": "in_flight"}
+        return {**entry, "status": "cached"} if entry is not None else None
+
+    async def _worker(self):
+        while True:
+            job_url = await self._queue.get()
+            future = self._inflight.get(job_url)
+            started = time.perf_counter()
+            try:
+                record = await self.crawl(job_url)
+                entry = self.cache.put(job_url, record) if self.cache is not None else {
+                    "job_url": job_url, "job_id": job_id_of(job_url), "record": record
+                }
+                if self.search is not None and record:
+                    self.search.upsert({**record, "job_url": job_url})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["failed"] += 1
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            else:
+                self.stats["crawled"] += 1
+                if future is not None and not future.done():
+                    future.set_result(entry)
+            finally:
+                self.stats["crawl_seconds"] += time.perf_counter() - started
+                self._inflight.pop(job_url, None)
+                self._queue.task_done()
+
+    # ---------------- discovery ----------------
+    def start_discovery(self, crawl=True):
+        """Start a discovery run, or return the one already running; ``crawl`` queues every link found."""
+        if self.discover is None:
+            raise RuntimeError("this service has no discovery")
+        if self._discovery is not None and not self._discovery.done():
+            self.stats["collapsed"] += 1
+            return self._current_run
+        run = {"id": str(next(self._run_ids)), "status": "running", "started_at": time.time(),
+               "finished_at": None, "links": None, "queued": 0, "cached": 0, "rejected": 0, "error": None}
+        self.runs[run["id"]] = run
+        self._current_run = run
+        self._discovery = asyncio.create_task(self._run_discovery(run, crawl))
+        return run
+
+    async def _run_discovery(self, run, crawl):
+        try:
+            links = await self.discover()
+            run["links"] = len(links)
+            for job_url in links if crawl else ():
+                try:
+                    status, _ = self.request(job_url)
+                except ServiceBusy:
+                    run["rejected"] += 1
+                    continue
+                run["cached" if status == "cached" else "queued"] += 1
+            run["status"] = "done"
+        except Exception as e:
+            run.update(status="failed", error=f"{type(e).__name__}: {e}")
+        finally:
+            run["finished_at"] = time.time()
+
+    def summary(self):
+        return {
+            **self.stats,
+            "crawl_seconds": round(self.stats["crawl_seconds"], 3),
+            "queue": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "in_flight": len(self._inflight),
+            "workers": self.workers,
+            "cached_results": len(self.cache) if self.cache is not None else None,
+            "search": self.search.summary() if self.search is not None else None,
+        }
+
+
+class BackgroundLoop:
+    """An asyncio loop in a daemon thread; ``call`` runs a coroutine there from any thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="job-service-loop", daemon=True)
+        self.thread.start()
+
+    def call(self, coro, timeout=None):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+async def build_service(config):
+    """Crawler, browser pool and ``JobService`` wired together; returns ``(service, shutdown)``."""
+    from web_Crawler.crawl_website._hiring_caffe_IT_crawl import HiringCaffeITCrawler
+    from web_Crawler.crawl_website.parse_pool import make_parser
+    from web_Crawler.crawl_website.search_index import SearchIndex
+
+    crawler = HiringCaffeITCrawler(config)
+    crawler._prepare_frontier()
+    pool = crawler._make_pool()
+    await pool.start()
+    crawler.parser = make_parser(config)
+    save_root = str(config.get("SAVE_ROOT_DIR", "."))
+    cache = ResultCache(
+        os.path.join(save_root, config.get("SERVICE_RESULT_DB", "service_results.sqlite3")),
+        ttl_seconds=config.get("SERVICE_RESULT_TTL_MINUTES", 60) * 60,
+    )
+    search = SearchIndex.from_config(config, save_root)
+
+    async def crawl(job_url):
+        try:
+            return await crawler.crawl_job(pool, job_url)
+        except Exception as e:
+            crawler.logger.exception(f"❌ Failed to crawl {job_url}: {e}")
+            raise
+
+    async def discover():
+        links, _ = await crawler.discover_job_links(pool)
+        crawler.frontier.set_meta("discovery_completed_at", time.time())
+        return links
+
+    service = JobService(
+        crawl,
+        discover,
+        cache,
+        workers=config.get("SERVICE_WORKERS") or pool.concurrency,
+        queue_size=config.get("SERVICE_QUEUE_SIZE", 1000),
+        search=search,
+    )
+    await service.start()
+    crawler.logger.info(f"🛎️ Job service ready: {service.workers} workers, pool {pool.stats}")
+
+    async def shutdown():
+        await service.stop()
+        crawler.parser.close()
+        crawler.sink.close()
+        crawler._write_metrics(pool)
+        if crawler.changes is not None:
+            crawler.changes.close()
+        await pool.close()
+        cache.close()
+        if search is not None:
+            search.close()
+        crawler.logger.info(f"🛎️ Job service stopped: {service.summary()}")
+
+    return service, shutdown
+
+
+def create_app(service, runner, wait_seconds=120, job_host="hiring.cafe"):
+    """Flask app whose handlers run ``service`` calls on ``runner``'s loop.
+
+    ``POST /jobs`` only accepts ``/viewjob/`` URLs on ``job_host``, so the
+    service never fetches pages of other hosts.
+    """
+    if Flask is None:
+        raise RuntimeError("The job service needs Flask (pip install flask)")
+    app = Flask(__name__)
+
+    async def on_loop(fn, *args):
+        return fn(*args)
+
+    def call(fn, *args):
+        return runner.call(on_loop(fn, *args))
+
+    @app.get("/health")
+    def health():
+        return jsonify(call(service.summary))
+
+    @app.post("/jobs")
+    def submit_jobs():
+        body = request.get_json(silent=True) or {}
+        urls = body.get("urls") or ([body["url"]] if body.get("url") else [])
+        if not urls or not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+            return jsonify({"error": "give 'url' or a list of 'urls'"}), 400
+        invalid = [url for url in urls if not is_job_url(url, job_host)]
+        if invalid:
+            return jsonify({"error": f"only https://{job_host}/viewjob/<id> URLs are crawled", "invalid": invalid}), 400
+        wait = bool(body.get("wait", False))
+        try:
+            timeout = float(body.get("timeout", wait_seconds))
+        except (TypeError, ValueError):
+            timeout = math.nan
+        if not math.isfinite(timeout) or timeout < 0:
+            return jsonify({"error": "'timeout' must be a number of seconds >= 0"}), 400
+        timeout = min(timeout, wait_seconds)
+        results = runner.call(service.submit(urls, force=bool(body.get("force")), wait=wait, timeout=timeout))
+        if all(item["status"] == "rejected" for item in results):
+            return jsonify({"results": results}), 503, {"Retry-After": "30"}
+        settled = all(item["status"] in ("cached", "done", "failed") for item in results)
+        return jsonify({"results": results}), 200 if settled else 202
+
+    @app.get("/jobs")
+    def job_by_url():
+        job_url = request.args.get("url")
+        if not job_url:
+            return jsonify({"error": "missing 'url'"}), 400
+        return _entry_response(call(service.lookup, job_url))
+
+    @app.get("/jobs/<job_id>")
+    def job_by_id(job_id):
+        return _entry_response(call(service.lookup, None, job_id))
+
+    @app.post("/discoveries")
+    def start_discovery():
+        body = request.get_json(silent=True) or {}
+        return jsonify(call(service.start_discovery, bool(body.get("crawl", True)))), 202
+
+    @app.get("/search")
+    def search_jobs():
+        if service.search is None:
+            return jsonify({"error": "search is disabled (SEARCH_INDEX: false)"}), 404
+        args = request.args
+        try:
+            filters = {
+                "salary_min": float(args["salary_min"]) if args.get("salary_min") else None,
+                "limit": min(int(args.get("limit", 20)), 100),
+                "offset": int(args.get("offset", 0)),
+            }
+        except ValueError:
+            return jsonify({"error": "salary_min, limit and offset must be numbers"}), 400
+        for name in ("work_mode", "employment_type", "location", "currency"):
+            filters[name] = args.get(name)
+        if filters["salary_min"] is not None and not filters["currency"]:
+            return jsonify({"error": "salary_min needs a currency"}), 400
+        return jsonify(call(lambda: service.search.search(args.get("q"), **filters)))
+
+    @app.get("/discoveries/<run_id>")
+    def discovery(run_id):
+        run = call(service.runs.get, run_id)
+        return (jsonify(run), 200) if run is not None else (jsonify({"error": "unknown run"}), 404)
+
+    return app
+
+
+def _entry_response(entry):
+    if entry is None:
+        return jsonify({"error": "not crawled yet; POST it to /jobs"}), 404
+    return jsonify(entry), 202 if entry["status"] == "in_flight" else 200
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default="web_Crawler/config/hiring_caffe_config.yaml")
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if sys.platform.startswith("win"):
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    config = load_config(args.config)
+    runner = BackgroundLoop()
+    service, shutdown = runner.call(build_service(config))
+    app = create_app(service, runner, config.get("SERVICE_WAIT_SECONDS", 120), host_of(config["BASE_URL"]))
+    try:
+        app.run(
+            host=args.host or config.get("SERVICE_HOST", "127.0.0.1"),
+            port=args.port or config.get("SERVICE_PORT", 8765),
+            threaded=True,
+        )
+    finally:
+        runner.call(shutdown())
+        runner.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+from urllib.parse import urljoin
+
+
+JOB_ANCHOR_SELECTOR = "a[href*='/viewjob/']"
+
+# Installs window.__aairHarvester: a MutationObserver on the infinite-scroll list
+# that records every /viewjob/ href the moment React mounts (or re-points) an anchor.
+INSTALL_JS = """
+([listSelector, anchorSelector]) => {
+    if (window.__aairHarvester) {
+        return window.__aairHarvester.seen.size;
+    }
+    const state = {seen: new Set(), pending: [], observer: null};
+    const collect = (node) => {
+        if (!node || node.nodeType !== Node.ELEMENT_NODE) return;
+        const anchors = node.matches(anchorSelector) ? [node] : [];
+        anchors.push(...node.querySelectorAll(anchorSelector));
+        for (const a of anchors) {
+            const href = a.href;
+            if (href && !state.seen.has(href)) {
+                state.seen.add(href);
+                state.pending.push(href);
+            }
+        }
+    };
+    const observe = (list) => {
+        collect(list);
+        state.observer = new MutationObserver((mutations) => {
+            for (const m of mutations) {
+                if (m.type === "attributes") collect(m.target);
+                else m.addedNodes.forEach(collect);
+            }
+        });
+        state.observer.observe(list, {childList: true, subtree: true, attributes: true, attributeFilter: ["href"]});
+    };
+    const list = document.querySelector(listSelector);
+    if (list) {
+        observe(list);
+    } else {
+        // The list is not mounted yet: attach as soon as it appears.
+        const waiter = new MutationObserver(() => {
+            const found = document.querySelector(listSelector);
+            if (found) {
+                waiter.disconnect();
+                observe(found);
+            }
+        });
+        waiter.observe(document.documentElement, {childList: true, subtree: true});
+    }
+    window.__aairHarvester = state;
+    return state.seen.size;
+}
+"""
+
+DRAIN_JS = "() => window.__aairHarvester ? window.__aairHarvester.pending.splice(0) : []"
+
+
+class LinkHarvester:
+    """In-page collector of job links for the virtualized search list.
+
+    Links are recorded by the browser as cards mount, so Python only needs
+    one ``drain`` round trip per batch instead of reading every card and
+    anchor, and cards that unmount before Python looks are not lost.
+    """
+
+    def __init__(self, base_url, list_selector="div.infinite-scroll-component"):
+        self.base_url = base_url
+        self.list_selector = list_selector
+
+    async def install(self, page):
+        """Inject the observer; safe to call again on the same document."""
+        return await page.evaluate(INSTALL_JS, [self.list_selector, JOB_ANCHOR_SELECTOR])
+
+    async def drain(self, page):
+        """Return the links recorded since the previous drain, as absolute URLs."""
+        hrefs = await page.evaluate(DRAIN_JS)
+        return [urljoin(self.base_url, href) for href in hrefs]
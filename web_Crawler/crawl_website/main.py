@@ -1,19 +1,19 @@
+import argparse
 import sys
-from pathlib import Path
 import asyncio
 
-from playwright.async_api import async_playwright
-
-from web_Crawler.crawl_website._crawler_base import CrawlerBase
 from web_Crawler.crawl_website._hiring_caffe_IT_crawl import HiringCaffeITCrawler
-from web_Crawler.utils.utils import load_config, prepare_folder, prepare_log
-from web_Crawler.crawl_website.crawl_utils import crawl_full_job_with_tabs
+from web_Crawler.utils.utils import load_config
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl HiringCafe jobs end to end")
+    parser.add_argument("--config", default="web_Crawler/config/hiring_caffe_config.yaml")
+    args = parser.parse_args()
+
     if sys.platform.startswith("win"):
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
-    config = load_config("C:\\Users\\leduc\\aair_lab\\web_Crawler\\config\\hiring_caffe_config.yaml")
+    config = load_config(args.config)
 
     crawler = HiringCaffeITCrawler(config)
-    asyncio.run(crawler.crawl_website())
\ No newline at end of file
+    asyncio.run(crawler.crawl_website())
@@ -0,0 +1,318 @@
+"""Near-duplicate job detection with MinHash signatures and LSH banding.
+
+Usage (from the repository root), to index every stored record and write
+the clusters with more than one job to ``result_it_vn/near_duplicates.json``:
+
+    python -m web_Crawler.crawl_website.near_dup --config web_Crawler/config/hiring_caffe_config.yaml
+
+The crawler also adds every record it saves to the same index, so reposts,
+per-location copies and agency copies of a role end up in one cluster.
+With NEAR_DUP_SKIP_CARDS, jobs whose search card (title + company) matches
+an indexed cluster are not detail-crawled at all.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import zlib
+
+import numpy as np
+
+from web_Crawler.crawl_website.company_cache import normalize_company
+from web_Crawler.utils.utils import load_config
+
+MAX_HASH = np.uint64(0xFFFFFFFF)
+SHINGLE_BASE = np.uint64(1000003)
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    job_url TEXT PRIMARY KEY,
+    cluster TEXT NOT NULL,
+    card_key TEXT,
+    signature BLOB,
+    added_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_signatures_cluster ON signatures(cluster);
+CREATE INDEX IF NOT EXISTS idx_signatures_card ON signatures(card_key);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    key INTEGER NOT NULL,
+    job_url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_buckets_key ON buckets(band, key);
+CREATE INDEX IF NOT EXISTS idx_buckets_url ON buckets(job_url);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _words(text):
+    if not text or not isinstance(text, str) or text == "N/A":
+        return []
+    return TOKEN_RE.findall(text.casefold())
+
+
+def card_key(title, company):
+    """Key of a search card: normalized company and title, or None when either is missing."""
+    company_key = normalize_company(company)
+    title_words = _words(title)
+    if not company_key or not title_words:
+        return None
+    return f"{company_key}|{' '.join(title_words)}"
+
+
+def _crc(tokens):
+    return np.fromiter((zlib.crc32(t.encode("utf-8")) for t in tokens), dtype=np.uint64, count=len(tokens))
+
+
+def job_features(record, shingle_size=4):
+    """Unique 32-bit hashes of the description's word shingles, the title words and the company.
+
+    Empty without a description. Shingles are hashed by combining the hashes
+    of their words in numpy, so no shingle string is ever built.
+    """
+    words = _words(record.get("job_description"))
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    word_hashes = _crc(words)
+    width = min(shingle_size, len(words))
+    count = len(words) - width + 1
+    shingles = word_hashes[:count].copy()
+    for offset in range(1, width):
+        shingles = (shingles * SHINGLE_BASE + word_hashes[offset:offset + count]) & MAX_HASH
+    tagged = [f"title:{word}" for word in _words(record.get("job_title"))]
+    company = normalize_company(record.get("company"))
+    if company:
+        tagged.append(f"company:{company}")
+    return np.unique(np.concatenate([shingles, _crc(tagged)]))
+
+
+class MinHasher:
+    """``num_perm`` MinHash values of a feature set, computed for all permutations at once."""
+
+    def __init__(self, num_perm=128, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = int(num_perm)
+        # Multiply-shift hashing: (a * x + b) mod 2^64, top 32 bits; a is odd.
+        self.a = rng.integers(0, 2 ** 63, size=self.num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = rng.integers(0, 2 ** 63, size=self.num_perm, dtype=np.uint64)
+
+    def signature(self, hashes):
+        """Signature of an array of 32-bit feature hashes (see ``job_features``); None when it is empty."""
+        if not len(hashes):
+            return None
+        permuted = np.multiply.outer(self.a, hashes)  # wraps around 2^64 on purpose
+        permuted += self.b[:, None]
+        return (permuted.min(axis=1) >> np.uint64(32)).astype(np.uint32)
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+class NearDupIndex:
+    """Persistent MinHash/LSH index that assigns every job to a near-duplicate cluster.
+
+    A signature is cut into ``bands`` bands; jobs sharing any band bucket
+    are candidates, and a candidate whose estimated Jaccard similarity is
+    at least ``threshold`` joins (or merges) its cluster. Lookups touch one
+    bucket per band, so adding a job costs the same at 1k or 1M jobs.
+    A cluster is named after its first member.
+    """
+
+    def __init__(self, db_path, num_perm=128, bands=16, threshold=0.8, shingle_size=4, seed=1):
+        if num_perm % bands:
+            raise ValueError(f"NEAR_DUP_PERMUTATIONS ({num_perm}) must be a multiple of NEAR_DUP_BANDS ({bands})")
+        self.num_perm = int(num_perm)
+        self.bands = int(bands)
+        self.rows = self.num_perm // self.bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm, seed)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._check_params({"num_perm": self.num_perm, "bands": self.bands, "shingle_size": shingle_size, "seed": seed})
+        self.stats = {"indexed": 0, "duplicates": 0, "merges": 0, "unindexable": 0, "card_skips": 0,
+                      "candidates": 0}
+
+    @classmethod
+    def from_config(cls, config, save_root):
+        """None when NEAR_DUP is off."""
+        if not config.get("NEAR_DUP", True):
+            return None
+        return cls(
+            os.path.join(save_root, config.get("NEAR_DUP_DB", "near_dup.sqlite3")),
+            num_perm=config.get("NEAR_DUP_PERMUTATIONS", 128),
+            bands=config.get("NEAR_DUP_BANDS", 16),
+            threshold=config.get("NEAR_DUP_THRESHOLD", 0.8),
+            shingle_size=config.get("NEAR_DUP_SHINGLE", 4),
+        )
+
+    def _check_params(self, params):
+        """Signatures built with other parameters cannot be compared; refuse to mix them."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+        if row is None:
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('params', ?)", (json.dumps(params),))
+            self.conn.commit()
+        elif json.loads(row[0]) != params:
+            raise ValueError(f"Near-dup index was built with {row[0]}; delete it to rebuild with {params}")
+
+    def close(self):
+        self.conn.close()
+
+    def signature(self, record):
+        return self.hasher.signature(job_features(record, self.shingle_size))
+
+    def _band_keys(self, sig):
+        for band in range(self.bands):
+            chunk = sig[band * self.rows:(band + 1) * self.rows].tobytes()
+            yield band, int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), "big", signed=True)
+
+    def query(self, sig, exclude=None):
+        """``[(job_url, cluster, similarity)]`` of indexed jobs at or above ``threshold``, best first."""
+        candidates = set()
+        for band, key in self._band_keys(sig):
+            rows = self.conn.execute("SELECT job_url FROM buckets WHERE band = ? AND key = ?", (band, key))
+            candidates.update(url for (url,) in rows)
+        candidates.discard(exclude)
+        self.stats["candidates"] += len(candidates)
+        matches = []
+        for url in candidates:
+            row = self.conn.execute("SELECT cluster, signature FROM signatures WHERE job_url = ?", (url,)).fetchone()
+            if row is None or row[1] is None:
+                continue
+            score = similarity(sig, np.frombuffer(row[1], dtype=np.uint32))
+            if score >= self.threshold:
+                matches.append((url, row[0], score))
+        return sorted(matches, key=lambda match: (-match[2], match[0]))
+
+    def add(self, job_url, record, commit=True):
+        """Index (or re-index) one record; returns its cluster, or None without a description."""
+        sig = self.signature(record)
+        if sig is None:
+            self.stats["unindexable"] += 1
+            return None
+        self.conn.execute("DELETE FROM buckets WHERE job_url = ?", (job_url,))
+        matches = self.query(sig, exclude=job_url)
+        current = self.cluster_of(job_url)
+        clusters = sorted({cluster for _, cluster, _ in matches} | ({current} if current else set()))
+        if clusters:
+            # The oldest cluster absorbs the others this job bridges.
+            cluster = min(clusters, key=self._cluster_age)
+            others = [c for c in clusters if c != cluster]
+            if others:
+                self.conn.execute(
+                    f"UPDATE signatures SET cluster = ? WHERE cluster IN ({','.join('?' * len(others))})",
+                    (cluster, *others),
+                )
+                self.stats["merges"] += len(others)
+        else:
+            cluster = job_url
+        if matches:
+            self.stats["duplicates"] += 1
+        self.conn.execute(
+            "INSERT OR REPLACE INTO signatures (job_url, cluster, card_key, signature, added_at) VALUES (?, ?, ?, ?, ?)",
+            (job_url, cluster, card_key(record.get("job_title"), record.get("company")), sig.tobytes(), time.time()),
+        )
+        self.conn.executemany(
+            "INSERT INTO buckets (band, key, job_url) VALUES (?, ?, ?)",
+            [(band, key, job_url) for band, key in self._band_keys(sig)],
+        )
+        if commit:
+            self.conn.commit()
+        self.stats["indexed"] += 1
+        return cluster
+
+    def add_many(self, records):
+        """Index ``(job_url, record)`` pairs in one transaction; returns how many got a cluster."""
+        added = sum(self.add(job_url, record, commit=False) is not None for job_url, record in records)
+        self.conn.commit()
+        return added
+
+    def _cluster_age(self, cluster):
+        row = self.conn.execute("SELECT MIN(added_at) FROM signatures WHERE cluster = ?", (cluster,)).fetchone()
+        return (row[0] if row and row[0] is not None else float("inf"), cluster)
+
+    def cluster_of(self, job_url):
+        row = self.conn.execute("SELECT cluster FROM signatures WHERE job_url = ?", (job_url,)).fetchone()
+        return row[0] if row else None
+
+    def is_indexed(self, job_url):
+        return self.conn.execute(
+            "SELECT 1 FROM signatures WHERE job_url = ? AND signature IS NOT NULL", (job_url,)
+        ).fetchone() is not None
+
+    # ---------------- search cards ----------------
+    def match_card(self, title, company):
+        """Cluster of an indexed job with the same title and company, or None."""
+        key = card_key(title, company)
+        if key is None:
+            return None
+        row = self.conn.execute(
+            "SELECT cluster FROM signatures WHERE card_key = ? AND signature IS NOT NULL LIMIT 1", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def add_card_duplicate(self, job_url, cluster, title, company):
+        """Record a job skipped for its card; it joins ``cluster`` without a signature."""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO signatures (job_url, cluster, card_key, signature, added_at) VALUES (?, ?, ?, NULL, ?)",
+            (job_url, cluster, card_key(title, company), time.time()),
+        )
+        self.conn.commit()
+        self.stats["card_skips"] += 1
+
+    # ---------------- reporting ----------------
+    def clusters(self, min_size=2):
+        """``{cluster: [job_url, ...]}`` for clusters with at least ``min_size`` jobs."""
+        rows = self.conn.execute(
+            "SELECT cluster, job_url FROM signatures WHERE cluster IN"
+            " (SELECT cluster FROM signatures GROUP BY cluster HAVING COUNT(*) >= ?) ORDER BY cluster, added_at",
+            (min_size,),
+        )
+        result = {}
+        for cluster, job_url in rows:
+            result.setdefault(cluster, []).append(job_url)
+        return result
+
+    def summary(self):
+        jobs, clusters = self.conn.execute("SELECT COUNT(*), COUNT(DISTINCT cluster) FROM signatures").fetchone()
+        return {**self.stats, "jobs": jobs, "clusters": clusters}
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+
+def main(argv=None):
+    from web_Crawler.crawl_website.result_sink import iter_sink_records
+
+    parser = argparse.ArgumentParser(description="Index stored job records and report near-duplicate clusters")
+    parser.add_argument("--config", default="web_Crawler/config/hiring_caffe_config.yaml")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    save_root = str(config.get("SAVE_ROOT_DIR", "."))
+    res_dir = os.path.join(save_root, "result_it_vn")
+    index = NearDupIndex.from_config({**config, "NEAR_DUP": True}, save_root)
+    started = time.perf_counter()
+    latest = {record["job_url"]: record for record in iter_sink_records(config, res_dir)}
+    index.add_many(latest.items())
+    clusters = index.clusters()
+    out_path = os.path.join(res_dir, "near_duplicates.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(clusters, f, ensure_ascii=False, indent=2)
+    print(f"🧬 Indexed {len(latest)} jobs in {time.perf_counter() - started:.1f}s: {index.summary()}")
+    print(f"💾 {len(clusters)} near-duplicate clusters → {out_path}")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+class InlineParser:
+    """Runs extraction functions right in the coroutine (PARSE_WORKERS: 0)."""
+
+    def __init__(self):
+        self.stats = {"parsed": 0, "parse_seconds": 0.0}
+
+    async def run(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.stats["parsed"] += 1
+            self.stats["parse_seconds"] += time.perf_counter() - started
+
+    def summary(self):
+        return {"mode": "inline", **self.stats, "parse_seconds": round(self.stats["parse_seconds"], 3)}
+
+    def close(self):
+        pass
+
+
+class ParsePool:
+    """CPU-bound HTML extraction in worker processes, so the event loop keeps serving pages.
+
+    ``run(fn, *args)`` ships picklable arguments (HTML strings) to the pool
+    and awaits the result. At most ``max_pending`` parses are queued or
+    running; further callers wait for a slot, which slows the browser
+    workers down instead of piling up snapshots in memory.
+    """
+
+    def __init__(self, workers=2, max_pending=None):
+        self.workers = max(1, int(workers))
+        self.max_pending = max(1, int(max_pending or self.workers * 2))
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._in_flight = 0
+        self.stats = {"parsed": 0, "max_in_flight": 0, "backpressure_waits": 0,
+                      "backpressure_seconds": 0.0, "parse_seconds": 0.0}
+
+    async def run(self, fn, *args):
+        waited = time.perf_counter()
+        if self._slots.locked():
+            self.stats["backpressure_waits"] += 1
+        async with self._slots:
+            started = time.perf_counter()
+            self.stats["backpressure_seconds"] += started - waited
+            self._in_flight += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self._in_flight)
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+            finally:
+                self._in_flight -= 1
+                self.stats["parsed"] += 1
+                self.stats["parse_seconds"] += time.perf_counter() - started
+
+    def summary(self):
+        return {
+            "mode": "processes",
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            **self.stats,
+            "backpressure_seconds": round(self.stats["backpressure_seconds"], 3),
+            "parse_seconds": round(self.stats["parse_seconds"], 3),
+        }
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def make_parser(config):
+    """ParsePool with PARSE_WORKERS processes, or an InlineParser when it is 0."""
+    workers = config.get("PARSE_WORKERS", 0)
+    if not workers:
+        return InlineParser()
+    return ParsePool(workers, config.get("PARSE_MAX_PENDING"))
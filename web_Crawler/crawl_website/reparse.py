@@ -0,0 +1,109 @@
+"""Rebuild job records from the HTML snapshot store, without a browser.
+
+Usage (from the repository root):
+
+    python -m web_Crawler.crawl_website.reparse --config web_Crawler/config/hiring_caffe_config.yaml
+
+The newest snapshot of every job URL is re-parsed with the current
+extractors in a process pool, and the records go to the configured
+RESULT_SINK under ``result_it_vn/reparsed_<timestamp>/``.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from web_Crawler.crawl_website.crawl_utils import build_job_record
+from web_Crawler.crawl_website.result_sink import make_result_sink
+from web_Crawler.crawl_website.snapshot_store import SnapshotStore, load_object
+from web_Crawler.utils.utils import load_config, prepare_log
+
+
+def snapshot_dir(config):
+    return os.path.join(str(config.get("SAVE_ROOT_DIR", ".")), config.get("SNAPSHOT_DIR", "snapshots"))
+
+
+def reparse_one(store_root, job_url, crawled_at, digests, extras):
+    """Parse one stored crawl; returns ``(job_url, record)`` or ``(job_url, error)``.
+
+    Relative posted dates resolve against ``crawled_at``, so the record
+    matches what the crawl wrote rather than shifting with the reparse time.
+    """
+    try:
+        tabs = {tab: load_object(store_root, digest) for tab, digest in digests.items()}
+        return job_url, build_job_record(
+            job_url, tabs, extras.get("clicked_website"), extras.get("cached_company_info"),
+            now=datetime.fromtimestamp(crawled_at),
+        )
+    except Exception as e:
+        return job_url, e
+
+
+def _reparse_chunk(store_root, items):
+    return [reparse_one(store_root, *item) for item in items]
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def reparse_store(store_root, sink, workers=None, chunk_size=50, logger=None):
+    """Re-parse every URL's newest snapshot into ``sink``; returns ``(parsed, failed)``."""
+    store = SnapshotStore(store_root)
+    try:
+        items = list(store.latest())
+    finally:
+        store.close()
+
+    parsed = failed = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_reparse_chunk, store_root, chunk) for chunk in _chunks(items, chunk_size)]
+        for future in futures:
+            for job_url, record in future.result():
+                if isinstance(record, Exception):
+                    failed += 1
+                    if logger:
+                        logger.warning(f"⚠️ Re-parse failed for {job_url}: {record}")
+                    continue
+                sink.write(job_url, record)
+                parsed += 1
+    sink.close()
+
+    if logger:
+        elapsed = time.perf_counter() - started
+        logger.info(f"🔁 Re-parsed {parsed} jobs ({failed} failed) in {elapsed:.1f}s")
+    return parsed, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default="web_Crawler/config/hiring_caffe_config.yaml")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    parser.add_argument("--out", default=None, help="output directory (default: result_it_vn/reparsed_<timestamp>)")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    save_root = str(config.get("SAVE_ROOT_DIR", "."))
+    out_dir = args.out or os.path.join(save_root, "result_it_vn", f"reparsed_{datetime.now():%Y%m%d_%H%M%S}")
+    logger = prepare_log(__name__, log_dir=os.path.join(save_root, "logs_it_vn"))
+
+    store_root = snapshot_dir(config)
+    if not os.path.exists(os.path.join(store_root, "index.sqlite3")):
+        raise SystemExit(f"No snapshot store at {store_root}; crawl with SAVE_SNAPSHOTS: True first")
+
+    sink = make_result_sink(config, out_dir, logger=logger)
+    reparse_store(store_root, sink, workers=args.workers, logger=logger)
+    logger.info(f"💾 Re-parsed records → {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import re
+from collections import Counter
+
+
+DEFAULT_BLOCK_RESOURCE_TYPES = ("image", "font", "media")
+DEFAULT_BLOCK_URL_PATTERNS = (
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+    r"connect\.facebook\.net",
+    r"facebook\.com/tr",
+    r"hotjar\.com",
+    r"clarity\.ms",
+    r"segment\.(io|com)",
+    r"mixpanel\.com",
+    r"/(pixel|beacon|collect)(\?|/|$)",
+)
+# The React app loads its job data through these; never block them.
+DEFAULT_ALLOW_URL_PATTERNS = (r"hiring\.cafe/api/",)
+# Requests the page needs to build the DOM are only blocked by an explicit URL rule.
+NEVER_BLOCK_BY_TYPE = ("document", "xhr", "fetch", "script", "stylesheet")
+
+
+def _compile(patterns):
+    patterns = [p for p in (patterns or []) if p]
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.I)
+
+
+class RequestFilter:
+    """Playwright routing layer that aborts heavy or tracking requests.
+
+    Decision order: allow patterns win, then blocked resource types, then
+    deny URL patterns. One instance is shared by all contexts of a run so
+    the counters in ``stats`` cover the whole crawl.
+    """
+
+    def __init__(self, block_resource_types=DEFAULT_BLOCK_RESOURCE_TYPES,
+                 block_url_patterns=DEFAULT_BLOCK_URL_PATTERNS,
+                 allow_url_patterns=DEFAULT_ALLOW_URL_PATTERNS):
+        self.block_resource_types = {t for t in block_resource_types if t not in NEVER_BLOCK_BY_TYPE}
+        self._deny = _compile(block_url_patterns)
+        self._allow = _compile(allow_url_patterns)
+        self.blocked_by_type = Counter()
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+
+    @classmethod
+    def from_config(cls, config):
+        """Return a filter built from the YAML config, or None when BLOCK_RESOURCES is off."""
+        if not config.get("BLOCK_RESOURCES", True):
+            return None
+        return cls(
+            block_resource_types=config.get("BLOCK_RESOURCE_TYPES", DEFAULT_BLOCK_RESOURCE_TYPES),
+            block_url_patterns=config.get("BLOCK_URL_PATTERNS", DEFAULT_BLOCK_URL_PATTERNS),
+            allow_url_patterns=config.get("ALLOW_URL_PATTERNS", DEFAULT_ALLOW_URL_PATTERNS),
+        )
+
+    def should_block(self, resource_type, url):
+        """Return True when a request of this type/URL should be aborted."""
+        if self._allow and self._allow.search(url):
+            return False
+        if resource_type in self.block_resource_types:
+            return True
+        return bool(self._deny and self._deny.search(url))
+
+    async def attach(self, context):
+        """Install the route handler and byte counter on a browser context."""
+        await context.route("**/*", self._handle_route)
+        context.on("response", self._count_response)
+
+    async def _handle_route(self, route):
+        request = route.request
+        try:
+            if self.should_block(request.resource_type, request.url):
+                self.blocked_by_type[request.resource_type] += 1
+                await route.abort("blockedbyclient")
+            else:
+                await route.fallback()
+        except Exception:
+            # The page was closed while the request was in flight.
+            pass
+
+    def _count_response(self, response):
+        self.allowed_requests += 1
+        try:
+            self.allowed_bytes += int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            pass
+
+    @property
+    def stats(self):
+        """Per-run counters; aborted bodies are never fetched so only their count is known."""
+        return {
+            "blocked_requests": sum(self.blocked_by_type.values()),
+            "blocked_by_type": dict(self.blocked_by_type),
+            "allowed_requests": self.allowed_requests,
+            "allowed_bytes": self.allowed_bytes,
+        }
@@ -0,0 +1,427 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+import zlib
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = None
+    pq = None
+
+
+INPROGRESS_SUFFIX = ".inprogress"
+MANIFEST_NAME = "manifest.json"
+
+# Columns of the Parquet sink; other keys of a job record land in `extra` as JSON.
+JOB_COLUMNS = [
+    "job_url",
+    "job_title",
+    "company",
+    "location",
+    "salary",
+    "work_mode",
+    "employment_type",
+    "posted_date",
+    "responsibilities",
+    "requirements",
+    "job_description",
+    "company_website",
+]
+
+
+def _write_json_atomic(path, payload):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class ResultSink:
+    """Where crawled job records go.
+
+    ``write`` hands a record over; ``on_commit`` is called with the job URLs
+    whose records are durable on disk, which is when the crawler marks them
+    done in the frontier. ``close`` commits whatever is still buffered.
+    """
+
+    def __init__(self, on_commit=None, logger=None):
+        self.on_commit = on_commit
+        self.logger = logger
+        self.stats = {"records": 0, "committed": 0, "flushes": 0, "segments": 0}
+
+    def write(self, job_url, data):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def _committed(self, urls):
+        self.stats["committed"] += len(urls)
+        if urls and self.on_commit:
+            self.on_commit(urls)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonFileSink(ResultSink):
+    """The original layout: one pretty-printed ``md5(job_url).json`` per job."""
+
+    def __init__(self, out_dir, on_commit=None, logger=None):
+        super().__init__(on_commit, logger)
+        self.out_dir = out_dir
+
+    def write(self, job_url, data):
+        os.makedirs(self.out_dir, exist_ok=True)
+        url_hash = hashlib.md5(job_url.encode("utf-8")).hexdigest()
+        filepath = os.path.join(self.out_dir, f"{url_hash}.json")
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        self.stats["records"] += 1
+        if self.logger:
+            self.logger.debug(f"💾 Saved job data for {job_url}")
+        self._committed([job_url])
+
+
+class SegmentSink(ResultSink):
+    """Batched, append-only segments partitioned by crawl date.
+
+    Records are buffered and written ``batch_size`` at a time (or after
+    ``flush_seconds``) into ``crawl_date=YYYY-MM-DD/part-*<suffix>.inprogress``.
+    A segment is rotated when it reaches ``segment_records`` or the date
+    changes: it is closed, renamed to its final name and added to
+    ``manifest.json``, which is itself replaced atomically. Readers only
+    ever need the manifest's segments.
+    """
+
+    suffix = ""
+    format_name = ""
+    durable_on_flush = False  # True when a flushed batch survives a crash
+
+    def __init__(self, out_dir, batch_size=200, flush_seconds=60, segment_records=50000,
+                 on_commit=None, logger=None):
+        super().__init__(on_commit, logger)
+        self.out_dir = out_dir
+        self.batch_size = max(1, int(batch_size))
+        self.flush_seconds = flush_seconds
+        self.segment_records = max(1, int(segment_records))
+        self.manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+        os.makedirs(out_dir, exist_ok=True)
+        self.manifest = self._load_manifest()
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._segment = None
+        self._recover()
+
+    # ---------------- public API ----------------
+    def write(self, job_url, data):
+        crawled_at = datetime.now()
+        self._buffer.append((job_url, data, crawled_at))
+        self.stats["records"] += 1
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        while batch:
+            crawl_date = batch[0][2].strftime("%Y-%m-%d")
+            if self._segment is not None and self._segment["crawl_date"] != crawl_date:
+                self._rotate()
+            if self._segment is None:
+                self._open_segment(crawl_date)
+            room = self.segment_records - self._segment["records"]
+            take = 0
+            while take < min(room, len(batch)) and batch[take][2].strftime("%Y-%m-%d") == crawl_date:
+                take += 1
+            chunk, batch = batch[:take], batch[take:]
+            self._write_chunk(chunk)
+            self._segment["records"] += len(chunk)
+            self._segment["first_crawled_at"] = self._segment["first_crawled_at"] or chunk[0][2].isoformat()
+            self._segment["last_crawled_at"] = chunk[-1][2].isoformat()
+            self.stats["flushes"] += 1
+            if self.durable_on_flush:
+                self._committed([job_url for job_url, _, _ in chunk])
+            else:
+                self._segment["urls"].extend(job_url for job_url, _, _ in chunk)
+            if self._segment["records"] >= self.segment_records:
+                self._rotate()
+
+    def close(self):
+        self.flush()
+        if self._segment is not None:
+            self._rotate()
+
+    # ---------------- segments ----------------
+    def _open_segment(self, crawl_date):
+        partition = f"crawl_date={crawl_date}"
+        os.makedirs(os.path.join(self.out_dir, partition), exist_ok=True)
+        seq = self.manifest["next_segment"]
+        self.manifest["next_segment"] += 1
+        name = f"part-{datetime.now():%Y%m%d%H%M%S}-{seq:05d}{self.suffix}"
+        self._segment = {
+            "path": f"{partition}/{name}",
+            "crawl_date": crawl_date,
+            "records": 0,
+            "first_crawled_at": None,
+            "last_crawled_at": None,
+            "urls": [],
+        }
+        self._open_file(os.path.join(self.out_dir, self._segment["path"] + INPROGRESS_SUFFIX))
+
+    def _rotate(self):
+        segment, self._segment = self._segment, None
+        self._close_file()
+        inprogress = os.path.join(self.out_dir, segment["path"] + INPROGRESS_SUFFIX)
+        final = os.path.join(self.out_dir, segment["path"])
+        os.replace(inprogress, final)
+        self._add_to_manifest(segment, final)
+        if not self.durable_on_flush:
+            self._committed(segment["urls"])
+
+    def _add_to_manifest(self, segment, final):
+        entry = {key: segment[key] for key in ("path", "crawl_date", "records", "first_crawled_at", "last_crawled_at")}
+        entry["bytes"] = os.path.getsize(final)
+        self.manifest["segments"].append(entry)
+        self.manifest["records"] += entry["records"]
+        self.manifest["updated_at"] = datetime.now().isoformat()
+        _write_json_atomic(self.manifest_path, self.manifest)
+        self.stats["segments"] += 1
+        if self.logger:
+            self.logger.info(f"📦 Sealed segment {entry['path']} ({entry['records']} records)")
+
+    def _load_manifest(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {"format": self.format_name, "records": 0, "next_segment": 1, "segments": []}
+
+    def _recover(self):
+        """Seal or drop segments a crashed run left ``.inprogress``."""
+        for root, _, files in os.walk(self.out_dir):
+            for name in sorted(files):
+                if not name.endswith(INPROGRESS_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                records = self._salvage(path)
+                if records:
+                    final = path[: -len(INPROGRESS_SUFFIX)]
+                    os.replace(path, final)
+                    rel = os.path.relpath(final, self.out_dir).replace(os.sep, "/")
+                    crawl_date = rel.split("/", 1)[0].split("=", 1)[-1]
+                    segment = {"path": rel, "crawl_date": crawl_date, "records": records,
+                               "first_crawled_at": None, "last_crawled_at": None}
+                    self._add_to_manifest(segment, final)
+                else:
+                    os.remove(path)
+                if self.logger:
+                    self.logger.warning(f"♻️ Recovered {records} records from unfinished segment {name}")
+
+    def _salvage(self, path):
+        """Make an unfinished segment readable; returns how many records it keeps (0 = drop it)."""
+        return 0
+
+    # Subclasses implement the file format.
+    def _open_file(self, path):
+        raise NotImplementedError
+
+    def _write_chunk(self, chunk):
+        raise NotImplementedError
+
+    def _close_file(self):
+        raise NotImplementedError
+
+
+class JsonlGzSink(SegmentSink):
+    """Gzipped JSON Lines segments, one record per line.
+
+    Each flush appends one complete gzip member and fsyncs it, so a record
+    is durable (and committed) as soon as its batch is flushed; a crash can
+    only lose the unfinished member at the end of the segment.
+    """
+
+    suffix = ".jsonl.gz"
+    format_name = "jsonl.gz"
+    durable_on_flush = True
+
+    def _open_file(self, path):
+        self._file = open(path, "ab")
+
+    def _write_chunk(self, chunk):
+        lines = []
+        for job_url, data, crawled_at in chunk:
+            record = {**data, "job_url": job_url, "crawled_at": crawled_at.isoformat()}
+            lines.append(json.dumps(record, ensure_ascii=False))
+        self._file.write(gzip.compress(("\n".join(lines) + "\n").encode("utf-8")))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close_file(self):
+        self._file.close()
+        self._file = None
+
+    def _salvage(self, path):
+        with open(path, "rb") as f:
+            raw = f.read()
+        text, complete = _decompress_members(raw)
+        records = text.count(b"\n")
+        if records:
+            with open(path, "wb") as f:
+                f.write(raw[:complete])
+        return records
+
+
+def _decompress_members(raw):
+    """Decompress concatenated gzip members, stopping at the first truncated one.
+
+    Returns the decompressed bytes and the offset where the complete members end.
+    """
+    out = []
+    offset = 0
+    while offset < len(raw):
+        decomp = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        try:
+            data = decomp.decompress(raw[offset:])
+        except zlib.error:
+            break
+        if not decomp.eof:
+            break
+        out.append(data)
+        offset = len(raw) - len(decomp.unused_data)
+    return b"".join(out), offset
+
+
+class ParquetSink(SegmentSink):
+    """Parquet segments with one row group per flush.
+
+    A Parquet file is only readable once its footer is written, so records
+    are committed when their segment is sealed; an unfinished segment is
+    dropped on restart and its jobs are crawled again.
+    """
+
+    suffix = ".parquet"
+    format_name = "parquet"
+
+    def __init__(self, *args, compression="zstd", **kwargs):
+        if pa is None:
+            raise RuntimeError("RESULT_SINK 'parquet' needs pyarrow: pip install pyarrow")
+        self.compression = compression
+        self.schema = pa.schema(
+            [(name, pa.string()) for name in JOB_COLUMNS]
+            + [("company_info", pa.string()), ("extra", pa.string()), ("crawled_at", pa.timestamp("ms"))]
+        )
+        super().__init__(*args, **kwargs)
+
+    def _open_file(self, path):
+        self._writer = pq.ParquetWriter(path, self.schema, compression=self.compression)
+
+    def _write_chunk(self, chunk):
+        columns = {name: [] for name in self.schema.names}
+        for job_url, data, crawled_at in chunk:
+            row = {**data, "job_url": job_url}
+            for name in JOB_COLUMNS:
+                value = row.pop(name, None)
+                columns[name].append(None if value is None else str(value))
+            company_info = row.pop("company_info", None)
+            columns["company_info"].append(
+                None if company_info is None else json.dumps(company_info, ensure_ascii=False)
+            )
+            columns["extra"].append(json.dumps(row, ensure_ascii=False) if row else None)
+            columns["crawled_at"].append(crawled_at)
+        self._writer.write_table(pa.table(columns, schema=self.schema))
+
+    def _close_file(self):
+        self._writer.close()
+        self._writer = None
+
+
+SINKS = {
+    "files": JsonFileSink,
+    "jsonl": JsonlGzSink,
+    "parquet": ParquetSink,
+}
+
+
+def make_result_sink(config, res_dir, on_commit=None, logger=None):
+    """Build the sink named by RESULT_SINK ("files", "jsonl" or "parquet")."""
+    kind = config.get("RESULT_SINK", "files")
+    if kind not in SINKS:
+        raise ValueError(f"Unknown RESULT_SINK {kind!r}; expected one of {sorted(SINKS)}")
+    if kind == "files":
+        return JsonFileSink(res_dir, on_commit=on_commit, logger=logger)
+    return SINKS[kind](
+        os.path.join(res_dir, kind),
+        batch_size=config.get("SINK_BATCH_SIZE", 200),
+        flush_seconds=config.get("SINK_FLUSH_SECONDS", 60),
+        segment_records=config.get("SINK_SEGMENT_RECORDS", 50000),
+        on_commit=on_commit,
+        logger=logger,
+    )
+
+
+def iter_records(sink_dir):
+    """Yield the records of every sealed JSONL segment listed in the manifest."""
+    with open(os.path.join(sink_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != JsonlGzSink.format_name:
+        raise ValueError(f"iter_records reads jsonl.gz sinks, not {manifest.get('format')!r}")
+    for segment in manifest["segments"]:
+        with gzip.open(os.path.join(sink_dir, segment["path"]), "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def iter_sink_records(config, res_dir):
+    """Yield every stored record of the configured RESULT_SINK, oldest first.
+
+    A job crawled more than once appears once per crawl; callers that want
+    the latest version keep the last record per ``job_url``.
+    """
+    kind = config.get("RESULT_SINK", "files")
+    if kind == "files":
+        names = sorted(os.listdir(res_dir), key=lambda name: os.path.getmtime(os.path.join(res_dir, name)))
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(res_dir, name), "r", encoding="utf-8") as f:
+                    record = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if isinstance(record, dict) and record.get("job_url"):
+                yield record
+        return
+    sink_dir = os.path.join(res_dir, kind)
+    if not os.path.exists(os.path.join(sink_dir, MANIFEST_NAME)):
+        return
+    if kind == "jsonl":
+        yield from iter_records(sink_dir)
+        return
+    if pq is None:
+        raise RuntimeError("Reading a parquet sink needs pyarrow: pip install pyarrow")
+    with open(os.path.join(sink_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    for segment in manifest["segments"]:
+        for row in pq.read_table(os.path.join(sink_dir, segment["path"])).to_pylist():
+            extra = row.pop("extra", None)
+            if row.get("company_info") is not None:
+                row["company_info"] = json.loads(row["company_info"])
+            if row.get("crawled_at") is not None:
+                row["crawled_at"] = row["crawled_at"].isoformat()
+            yield {**row, **(json.loads(extra) if extra else {})}
@@ -0,0 +1,378 @@
+"""Full-text and faceted search over crawled jobs, in one SQLite file.
+
+Usage (from the repository root):
+
+    python -m web_Crawler.crawl_website.search_index build --config web_Crawler/config/hiring_caffe_config.yaml
+    python -m web_Crawler.crawl_website.search_index update
+    python -m web_Crawler.crawl_website.search_index query "python backend" --location "Ho Chi Minh" --work-mode Remote
+
+``build`` loads every stored record of RESULT_SINK. ``update`` applies the
+change tracker's sealed delta feeds that were not applied yet, so only the
+churn is re-indexed. The job service also upserts every job it crawls and
+answers ``GET /search``.
+
+Text goes into an FTS5 table (title, description, responsibilities,
+requirements, company; BM25-ranked, accent-insensitive). ``work_mode``,
+``employment_type`` and every location and location part are facet rows;
+salaries are parsed into numbers, a currency, a period and a yearly range.
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+
+from web_Crawler.crawl_website.api_discovery import VIEWJOB_RE
+from web_Crawler.crawl_website.job_fields import annualize, fold, location_values, parse_salary, split_work_modes
+from web_Crawler.utils.utils import load_config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_url TEXT NOT NULL UNIQUE,
+    job_id TEXT,
+    job_title TEXT,
+    company TEXT,
+    location TEXT,
+    work_mode TEXT,
+    employment_type TEXT,
+    salary TEXT,
+    salary_min REAL,
+    salary_max REAL,
+    salary_currency TEXT,
+    salary_period TEXT,
+    salary_year_min REAL,
+    salary_year_max REAL,
+    posted_date TEXT,
+    record TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs(salary_currency, salary_year_max);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs(posted_date);
+CREATE TABLE IF NOT EXISTS facets (
+    job INTEGER NOT NULL,
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    value_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_facets_value ON facets(facet, value_key, job);
+CREATE INDEX IF NOT EXISTS idx_facets_job ON facets(job, facet, value_key, value);
+CREATE TABLE IF NOT EXISTS facet_counts (
+    facet TEXT NOT NULL,
+    value_key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    jobs INTEGER NOT NULL,
+    PRIMARY KEY (facet, value_key)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_text USING fts5(
+    job_title, job_description, responsibilities, requirements, company,
+    tokenize = "unicode61 remove_diacritics 2"
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+FACETS = ("work_mode", "employment_type", "location")
+# BM25 weights of jobs_text's columns: a hit in the title counts most.
+TEXT_WEIGHTS = (5.0, 1.0, 2.0, 2.0, 3.0)
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+RESULT_COLUMNS = ("job_url", "job_id", "job_title", "company", "location", "work_mode", "employment_type",
+                  "salary", "salary_min", "salary_max", "salary_currency", "salary_period", "posted_date")
+
+
+def _text(value):
+    if value is None or value == "N/A":
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def like_pattern(text):
+    """``LIKE ... ESCAPE '\\'`` pattern matching ``text`` anywhere, with its own ``%`` / ``_`` taken literally."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def match_query(text):
+    """FTS5 query that ANDs every word of ``text`` as a prefix; None when it has no words."""
+    words = TOKEN_RE.findall(fold(text or ""))
+    return " ".join(f'"{word}"*' for word in words) or None
+
+
+class SearchIndex:
+    """On-disk job index with BM25 full-text search, facet filters/counts and incremental upserts."""
+
+    def __init__(self, db_path):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self.stats = {"upserts": 0, "removals": 0, "queries": 0, "query_ms": 0.0}
+
+    @classmethod
+    def from_config(cls, config, save_root=None):
+        """The index configured by SEARCH_INDEX / SEARCH_INDEX_DB, or None when it is disabled."""
+        if not config.get("SEARCH_INDEX", True):
+            return None
+        save_root = save_root or str(config.get("SAVE_ROOT_DIR", "."))
+        return cls(os.path.join(save_root, config.get("SEARCH_INDEX_DB", "search_index.sqlite3")))
+
+    def close(self):
+        self.conn.close()
+
+    # ---------------- writes ----------------
+    def upsert(self, record, commit=True):
+        """Index (or re-index) one record by its ``job_url``."""
+        job_url = record["job_url"]
+        self._delete(job_url)
+        salary = parse_salary(record.get("salary")) or {}
+        match = VIEWJOB_RE.search(job_url)
+        cursor = self.conn.execute(
+            "INSERT INTO jobs (job_url, job_id, job_title, company, location, work_mode, employment_type, salary,"
+            " salary_min, salary_max, salary_currency, salary_period, salary_year_min, salary_year_max,"
+            " posted_date, record, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                job_url,
+                match.group(1) if match else None,
+                record.get("job_title"),
+                record.get("company"),
+                record.get("location"),
+                record.get("work_mode"),
+                record.get("employment_type"),
+                record.get("salary"),
+                salary.get("min"),
+                salary.get("max"),
+                salary.get("currency"),
+                salary.get("period"),
+                annualize(salary.get("min"), salary.get("period")),
+                annualize(salary.get("max"), salary.get("period")),
+                record.get("posted_date"),
+                json.dumps(record, ensure_ascii=False),
+                time.time(),
+            ),
+        )
+        job = cursor.lastrowid
+        self.conn.execute(
+            "INSERT INTO jobs_text (rowid, job_title, job_description, responsibilities, requirements, company)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (job, *(_text(record.get(field)) for field in
+                    ("job_title", "job_description", "responsibilities", "requirements", "company"))),
+        )
+        facet_values = {
+            "work_mode": split_work_modes(record.get("work_mode")),
+            "employment_type": split_work_modes(record.get("employment_type")),
+            "location": location_values(record),
+        }
+        rows = {(facet, fold(value)): value for facet, values in facet_values.items() for value in values}
+        self.conn.executemany(
+            "INSERT INTO facets (job, facet, value_key, value) VALUES (?, ?, ?, ?)",
+            [(job, facet, key, value) for (facet, key), value in rows.items()],
+        )
+        self.conn.executemany(
+            "INSERT INTO facet_counts (facet, value_key, value, jobs) VALUES (?, ?, ?, 1)"
+            " ON CONFLICT (facet, value_key) DO UPDATE SET jobs = jobs + 1, value = MIN(value, excluded.value)",
+            [(facet, key, value) for (facet, key), value in rows.items()],
+        )
+        if commit:
+            self.conn.commit()
+        self.stats["upserts"] += 1
+
+    def upsert_many(self, records):
+        """Index many records in one transaction; the last record per ``job_url`` wins."""
+        count = 0
+        for record in records:
+            if record.get("job_url"):
+                self.upsert(record, commit=False)
+                count += 1
+        self.conn.commit()
+        return count
+
+    def _delete(self, job_url):
+        row = self.conn.execute("SELECT id FROM jobs WHERE job_url = ?", (job_url,)).fetchone()
+        if row is None:
+            return False
+        self.conn.execute("DELETE FROM jobs_text WHERE rowid = ?", row)
+        self.conn.execute(
+            "UPDATE facet_counts SET jobs = jobs - 1"
+            " WHERE (facet, value_key) IN (SELECT facet, value_key FROM facets WHERE job = ?)",
+            row,
+        )
+        self.conn.execute("DELETE FROM facets WHERE job = ?", row)
+        self.conn.execute("DELETE FROM jobs WHERE id = ?", row)
+        return True
+
+    def remove(self, job_url, commit=True):
+        removed = self._delete(job_url)
+        if commit:
+            self.conn.commit()
+        self.stats["removals"] += removed
+        return removed
+
+    def apply_deltas(self, delta_dir):
+        """Apply every sealed ``delta_*.jsonl.gz`` not applied before, oldest first; returns ``(files, lines)``."""
+        from web_Crawler.crawl_website.change_tracker import REMOVED, iter_deltas
+
+        if not os.path.isdir(delta_dir):
+            return 0, 0
+        applied = set(json.loads(self.get_meta("applied_deltas", "[]")))
+        files = lines = 0
+        for name in sorted(os.listdir(delta_dir)):
+            if not name.endswith(".jsonl.gz") or name in applied:
+                continue
+            for delta in iter_deltas(os.path.join(delta_dir, name)):
+                if delta["op"] == REMOVED:
+                    self.remove(delta["job_url"], commit=False)
+                elif "record" in delta:
+                    self.upsert({**delta["record"], "job_url": delta["job_url"]}, commit=False)
+                lines += 1
+            applied.add(name)
+            files += 1
+        self.set_meta("applied_deltas", json.dumps(sorted(applied)))
+        return files, lines
+
+    def get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+        self.conn.commit()
+
+    # ---------------- queries ----------------
+    def search(self, text=None, work_mode=None, employment_type=None, location=None, salary_min=None,
+               currency=None, limit=20, offset=0, facets=True):
+        """Jobs matching every given filter, best first, with facet counts over all matches.
+
+        ``text`` is matched word by word (as prefixes) against the text
+        columns; ``work_mode`` / ``employment_type`` are exact facet values;
+        ``location`` matches any location or part containing it;
+        ``salary_min`` keeps jobs whose yearly maximum reaches it in
+        ``currency``, which it therefore requires (yearly amounts in
+        different currencies are not comparable). Accents and case never
+        matter.
+        """
+        if salary_min is not None and not currency:
+            raise ValueError("salary_min needs a currency")
+        started = time.perf_counter()
+        joins, where, params = [], [], []
+        query = match_query(text)
+        if query:
+            joins.append("JOIN jobs_text ON jobs_text.rowid = jobs.id")
+            where.append("jobs_text MATCH ?")
+            params.append(query)
+        for facet, value in (("work_mode", work_mode), ("employment_type", employment_type)):
+            if value:
+                where.append("jobs.id IN (SELECT job FROM facets WHERE facet = ? AND value_key = ?)")
+                params += [facet, fold(value)]
+        if location:
+            where.append(
+                "jobs.id IN (SELECT job FROM facets WHERE facet = 'location' AND value_key LIKE ? ESCAPE '\\')"
+            )
+            params.append(like_pattern(fold(location)))
+        if salary_min is not None:
+            where.append("jobs.salary_year_max >= ?")
+            params.append(float(salary_min))
+        if currency:
+            where.append("jobs.salary_currency = ?")
+            params.append(currency.upper())
+        matched = f"SELECT jobs.id FROM jobs {' '.join(joins)}" + (f" WHERE {' AND '.join(where)}" if where else "")
+
+        if query:
+            score = f"bm25(jobs_text, {', '.join(map(str, TEXT_WEIGHTS))})"
+            select = (f"SELECT {', '.join('jobs.' + c for c in RESULT_COLUMNS)}, {score} AS score,"
+                      " snippet(jobs_text, -1, '[', ']', '…', 12) AS snippet")
+            order = "score"
+        else:
+            select = f"SELECT {', '.join('jobs.' + c for c in RESULT_COLUMNS)}, NULL AS score, NULL AS snippet"
+            order = "jobs.posted_date DESC, jobs.id DESC"
+        rows = self.conn.execute(
+            f"{select} FROM jobs {' '.join(joins)}" + (f" WHERE {' AND '.join(where)}" if where else "")
+            + f" ORDER BY {order} LIMIT ? OFFSET ?",
+            (*params, int(limit), int(offset)),
+        ).fetchall()
+        results = [dict(zip((*RESULT_COLUMNS, "score", "snippet"), row)) for row in rows]
+        for result in results:
+            if result["score"] is not None:
+                result["score"] = round(-result["score"], 4)  # bm25() is lower-is-better
+
+        # Unfiltered counts are kept up to date by upserts; otherwise totals and facet
+        # counts run over a temp table of every hit, so the match runs once more, not twice.
+        counts = {}
+        if not where:
+            total = len(self)
+            rows = self.conn.execute(
+                "SELECT facet, value, jobs FROM facet_counts WHERE jobs > 0 ORDER BY facet, jobs DESC, value"
+            ) if facets else ()
+        else:
+            facet_sql = ("SELECT facet, MIN(value), COUNT(*) AS n FROM {} GROUP BY facet, value_key"
+                         " ORDER BY facet, n DESC, MIN(value)")
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS hits (id INTEGER PRIMARY KEY)")
+            self.conn.execute("DELETE FROM temp.hits")
+            total = self.conn.execute(f"INSERT INTO temp.hits {matched}", params).rowcount
+            # CROSS JOIN keeps hits as the outer loop: a few facet rows per hit instead of a scan of all facets.
+            rows = self.conn.execute(
+                facet_sql.format("temp.hits CROSS JOIN facets ON facets.job = hits.id")) if facets else ()
+        for facet, value, count in rows:
+            counts.setdefault(facet, {})[value] = count
+        took_ms = (time.perf_counter() - started) * 1000
+        self.stats["queries"] += 1
+        self.stats["query_ms"] += took_ms
+        return {"total": total, "results": results, "facets": counts, "took_ms": round(took_ms, 2)}
+
+    def get(self, job_url):
+        row = self.conn.execute("SELECT record FROM jobs WHERE job_url = ?", (job_url,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def summary(self):
+        queries = self.stats["queries"]
+        return {**self.stats, "jobs": len(self), "query_ms": round(self.stats["query_ms"], 2),
+                "avg_query_ms": round(self.stats["query_ms"] / queries, 3) if queries else None}
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+def main(argv=None):
+    from web_Crawler.crawl_website.result_sink import iter_sink_records
+
+    parser = argparse.ArgumentParser(description="Build, update or query the job search index")
+    parser.add_argument("command", choices=("build", "update", "query"))
+    parser.add_argument("text", nargs="?", default=None, help="query: words to search for")
+    parser.add_argument("--config", default="web_Crawler/config/hiring_caffe_config.yaml")
+    parser.add_argument("--work-mode", default=None)
+    parser.add_argument("--employment-type", default=None)
+    parser.add_argument("--location", default=None)
+    parser.add_argument("--salary-min", type=float, default=None, help="yearly amount")
+    parser.add_argument("--currency", default=None)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    save_root = str(config.get("SAVE_ROOT_DIR", "."))
+    index = SearchIndex.from_config(config, save_root)
+    if index is None:
+        parser.error("SEARCH_INDEX is disabled in this config")
+    started = time.perf_counter()
+    if args.command == "build":
+        count = index.upsert_many(iter_sink_records(config, os.path.join(save_root, "result_it_vn")))
+        print(f"🔎 Indexed {count} records in {time.perf_counter() - started:.1f}s ({len(index)} jobs)")
+    elif args.command == "update":
+        files, lines = index.apply_deltas(os.path.join(save_root, config.get("DELTA_DIR", "deltas")))
+        print(f"🔎 Applied {lines} changes from {files} delta files in {time.perf_counter() - started:.1f}s")
+    else:
+        if args.salary_min is not None and not args.currency:
+            parser.error("--salary-min needs --currency")
+        result = index.search(args.text, args.work_mode, args.employment_type, args.location,
+                              args.salary_min, args.currency, limit=args.limit)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import itertools
+import json
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One partition of the search: ``overrides`` are merged into BASE_URL's searchState."""
+
+    name: str
+    overrides: dict = field(default_factory=dict, hash=False)
+
+    def url(self, base_url):
+        return with_search_state(base_url, self.overrides)
+
+
+def parse_search_state(url):
+    """Return the decoded ``searchState`` JSON of a hiring.cafe URL ({} when absent)."""
+    values = parse_qs(urlsplit(url).query).get("searchState")
+    if not values:
+        return {}
+    try:
+        state = json.loads(values[0])
+    except ValueError:
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def with_search_state(url, overrides):
+    """``url`` with ``overrides`` merged into its searchState; other query params are kept."""
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    state = {**parse_search_state(url), **overrides}
+    query["searchState"] = [json.dumps(state, ensure_ascii=False, separators=(",", ":"))]
+    return urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
+
+
+def _value_label(value):
+    if isinstance(value, (list, tuple)):
+        return "+".join(str(v) for v in value)
+    return str(value)
+
+
+def plan_shards(shards=None, dimensions=None):
+    """Build the shard list from config.
+
+    ``shards`` is an explicit list of ``{"name": ..., "search_state": {...}}``
+    entries. ``dimensions`` maps a searchState key to the values it is split
+    on; every combination across keys becomes one shard, so two keys with 3
+    and 4 values give 12 shards. Both may be given; an empty plan means the
+    search is not sharded.
+    """
+    planned = []
+    for idx, entry in enumerate(shards or []):
+        overrides = dict(entry.get("search_state") or {})
+        planned.append(Shard(entry.get("name") or f"shard_{idx + 1}", overrides))
+
+    if dimensions:
+        keys = list(dimensions)
+        for combo in itertools.product(*(dimensions[key] for key in keys)):
+            overrides = dict(zip(keys, combo))
+            name = ",".join(f"{key}={_value_label(value)}" for key, value in overrides.items())
+            planned.append(Shard(name, overrides))
+
+    names = [shard.name for shard in planned]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate shard names: {sorted(duplicates)}")
+    return planned
+
+
+def plan_shards_from_config(config):
+    return plan_shards(config.get("SHARDS"), config.get("SHARD_DIMENSIONS"))
+
+
+def merge_shard_results(results):
+    """Merge ``{shard_name: links}`` into one deduplicated set plus per-shard counts.
+
+    ``unique`` is how many links only that shard found; a large ``found``
+    with a small ``unique`` means the partitions overlap.
+    """
+    owners = {}
+    for name, links in results.items():
+        for link in set(links):
+            owners[link] = owners.get(link, 0) + 1
+
+    summary = {}
+    for name, links in results.items():
+        links = set(links)
+        summary[name] = {
+            "found": len(links),
+            "unique": sum(1 for link in links if owners[link] == 1),
+        }
+    merged = set(owners)
+    totals = {
+        "shards": len(results),
+        "found": sum(entry["found"] for entry in summary.values()),
+        "merged": len(merged),
+    }
+    totals["duplicates"] = totals["found"] - totals["merged"]
+    return merged, {"totals": totals, "shards": summary}
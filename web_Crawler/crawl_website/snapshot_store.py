@@ -0,0 +1,114 @@
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+SNAPSHOT_TABS = ("job_info", "company_info", "job_description")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawls (
+    job_url TEXT NOT NULL,
+    crawled_at REAL NOT NULL,
+    extras TEXT,
+    PRIMARY KEY (job_url, crawled_at)
+);
+CREATE TABLE IF NOT EXISTS tabs (
+    job_url TEXT NOT NULL,
+    crawled_at REAL NOT NULL,
+    tab TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (job_url, crawled_at, tab)
+);
+"""
+
+
+def object_path(root, digest):
+    return os.path.join(root, "objects", digest[:2], f"{digest}.html.gz")
+
+
+def load_object(root, digest):
+    """Read one stored HTML document without opening the index (safe in worker processes)."""
+    with gzip.open(object_path(root, digest), "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+class SnapshotStore:
+    """Content-addressed store of the raw HTML behind every crawled job.
+
+    Each tab's HTML is gzipped into ``objects/<sha256[:2]>/<sha256>.html.gz``,
+    so identical snapshots are stored once. ``index.sqlite3`` maps
+    ``(job_url, crawled_at)`` to the digest of each tab plus ``extras`` that
+    only the live browser knows, such as the website a click resolved to.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, "index.sqlite3"))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self.stats = {"snapshots": 0, "objects_written": 0, "objects_reused": 0}
+
+    def close(self):
+        self.conn.close()
+
+    def put_object(self, html):
+        """Store one HTML document; returns its digest."""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = object_path(self.root, digest)
+        if os.path.exists(path):
+            self.stats["objects_reused"] += 1
+            return digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(data, compresslevel=6))
+        os.replace(tmp_path, path)
+        self.stats["objects_written"] += 1
+        return digest
+
+    def get_object(self, digest):
+        return load_object(self.root, digest)
+
+    def put(self, job_url, tabs, extras=None, crawled_at=None):
+        """Record one crawl of ``job_url``; ``tabs`` maps tab name to HTML (None = not captured)."""
+        crawled_at = crawled_at or time.time()
+        digests = {tab: self.put_object(html) for tab, html in tabs.items() if html}
+        self.conn.execute(
+            "INSERT OR REPLACE INTO crawls (job_url, crawled_at, extras) VALUES (?, ?, ?)",
+            (job_url, crawled_at, json.dumps(extras or {}, ensure_ascii=False)),
+        )
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO tabs (job_url, crawled_at, tab, digest) VALUES (?, ?, ?, ?)",
+            ((job_url, crawled_at, tab, digest) for tab, digest in digests.items()),
+        )
+        self.conn.commit()
+        self.stats["snapshots"] += 1
+        return digests
+
+    def latest(self):
+        """Yield ``(job_url, crawled_at, {tab: digest}, extras)`` for the newest crawl of every URL."""
+        rows = self.conn.execute(
+            """
+            SELECT c.job_url, c.crawled_at, c.extras
+            FROM crawls c
+            JOIN (SELECT job_url, MAX(crawled_at) AS crawled_at FROM crawls GROUP BY job_url) newest
+              ON newest.job_url = c.job_url AND newest.crawled_at = c.crawled_at
+            ORDER BY c.job_url
+            """
+        ).fetchall()
+        for job_url, crawled_at, extras in rows:
+            digests = dict(
+                self.conn.execute(
+                    "SELECT tab, digest FROM tabs WHERE job_url = ? AND crawled_at = ?",
+                    (job_url, crawled_at),
+                ).fetchall()
+            )
+            yield job_url, crawled_at, digests, json.loads(extras or "{}")
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(DISTINCT job_url) FROM crawls").fetchone()[0]
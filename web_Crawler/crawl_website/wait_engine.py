@@ -0,0 +1,145 @@
+import time
+from collections import defaultdict
+
+
+# Resolves true once `root` has seen no mutations for `quietMs`, false when `timeoutMs` hits first.
+DOM_QUIET_JS = """
+([selector, quietMs, timeoutMs]) => new Promise((resolve) => {
+    const root = (selector && document.querySelector(selector)) || document.body || document.documentElement;
+    let done = false;
+    let quietTimer = null;
+    const finish = (settled) => {
+        if (done) return;
+        done = true;
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        resolve(settled);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+    quietTimer = setTimeout(() => finish(true), quietMs);
+    const capTimer = setTimeout(() => finish(false), timeoutMs);
+})
+"""
+
+ELEMENT_CHANGED_JS = "([el, before]) => !el.isConnected || el.innerHTML !== before"
+
+
+class WaitEngine:
+    """Signal-based waits with a timeout fallback that replace fixed sleeps.
+
+    Every wait returns instead of raising when its timeout hits, so callers
+    keep the old "sleep then carry on" behaviour in the worst case, and each
+    wait records how long it actually took under its ``name`` in ``stats``.
+    """
+
+    def __init__(self, quiet_ms: int = 400, timeout_ms: int = 5000):
+        self.quiet_ms = quiet_ms
+        self.timeout_ms = timeout_ms
+        self.stats = defaultdict(lambda: {"count": 0, "timeouts": 0, "total_ms": 0.0, "max_ms": 0.0})
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            quiet_ms=config.get("WAIT_QUIET_MS", 400),
+            timeout_ms=config.get("WAIT_TIMEOUT_MS", 5000),
+        )
+
+    def _record(self, name, started, settled):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        entry = self.stats[name]
+        entry["count"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        if not settled:
+            entry["timeouts"] += 1
+        return elapsed_ms
+
+    async def dom_quiet(self, page, selector=None, quiet_ms=None, timeout_ms=None, name="dom_quiet"):
+        """Wait until the DOM under ``selector`` (default body) stops mutating."""
+        quiet_ms = self.quiet_ms if quiet_ms is None else quiet_ms
+        timeout_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+        started = time.perf_counter()
+        try:
+            settled = bool(await page.evaluate(DOM_QUIET_JS, [selector, quiet_ms, timeout_ms]))
+        except Exception:
+            # Navigation destroyed the context; nothing left to wait for.
+            settled = False
+        self._record(name, started, settled)
+        return settled
+
+    async def selector(self, page, selector, timeout_ms=None, state="visible", name=None):
+        """Wait for ``selector`` to reach ``state``; returns False on timeout."""
+        timeout_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+        started = time.perf_counter()
+        try:
+            await page.wait_for_selector(selector, state=state, timeout=timeout_ms)
+            settled = True
+        except Exception:
+            settled = False
+        self._record(name or f"selector:{selector}", started, settled)
+        return settled
+
+    async def condition(self, page, expression, arg=None, timeout_ms=None, name="condition"):
+        """Wait until the in-page ``expression`` returns truthy for ``arg``."""
+        timeout_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+        started = time.perf_counter()
+        try:
+            await page.wait_for_function(expression, arg=arg, timeout=timeout_ms)
+            settled = True
+        except Exception:
+            settled = False
+        self._record(name, started, settled)
+        return settled
+
+    async def element_changed(self, page, handle, before_html, timeout_ms=None, name="element_changed"):
+        """Wait until ``handle``'s innerHTML differs from ``before_html``."""
+        return await self.condition(page, ELEMENT_CHANGED_JS, [handle, before_html], timeout_ms, name)
+
+    async def url_change(self, page, original_url, timeout_ms=None, name="url_change"):
+        """Wait until ``page.url`` moves away from ``original_url``."""
+        timeout_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+        started = time.perf_counter()
+        try:
+            await page.wait_for_url(lambda url: url != original_url, timeout=timeout_ms)
+            settled = True
+        except Exception:
+            settled = False
+        self._record(name, started, settled)
+        return settled
+
+    async def response(self, page, predicate, action=None, timeout_ms=None, name="response"):
+        """Run ``action`` (a coroutine factory) and wait for a response matching ``predicate``.
+
+        Returns the Playwright response, or None when nothing matched in time.
+        """
+        timeout_ms = self.timeout_ms if timeout_ms is None else timeout_ms
+        started = time.perf_counter()
+        result = None
+        try:
+            async with page.expect_response(predicate, timeout=timeout_ms) as info:
+                if action is not None:
+                    await action()
+            result = await info.value
+        except Exception:
+            result = None
+        self._record(name, started, result is not None)
+        return result
+
+    def summary(self):
+        """Per-wait counts, timeouts and average/max milliseconds."""
+        out = {}
+        for name, entry in self.stats.items():
+            count = entry["count"] or 1
+            out[name] = {
+                "count": entry["count"],
+                "timeouts": entry["timeouts"],
+                "avg_ms": round(entry["total_ms"] / count, 1),
+                "max_ms": round(entry["max_ms"], 1),
+                "total_ms": round(entry["total_ms"], 1),
+            }
+        return out
@@ -0,0 +1,40 @@
+from web_Crawler.crawl_website.api_discovery import extract_job_cards, extract_job_ids, job_url_from_id
+
+
+def test_extract_job_ids_from_results():
+    payload = {
+        "results": [
+            {"id": "abc123", "job_information": {"title": "Backend Engineer"}},
+            {"id": "def456"},
+            {"id": "abc123"},
+            {"title": "no id here"},
+        ],
+        "total": 3,
+    }
+    assert extract_job_ids(payload) == ["abc123", "def456"]
+
+
+def test_extract_job_ids_nested_key_and_embedded_links():
+    payload = {
+        "data": {"hits": [{"job": {"requisition_id": "r-1"}}]},
+        "related": ["https://hiring.cafe/viewjob/x9y8z7"],
+    }
+    ids = extract_job_ids(payload, results_key="data.hits", id_key="job.requisition_id")
+    assert ids == ["r-1", "x9y8z7"]
+
+
+def test_job_url_from_id():
+    base = "https://hiring.cafe/?searchState=%7B%7D"
+    assert job_url_from_id(base, "abc123") == "https://hiring.cafe/viewjob/abc123"
+
+
+def test_extract_job_cards_tries_each_key():
+    payload = {"results": [
+        {"id": "a1", "title": "SRE", "company": "Acme"},
+        {"id": "b2", "job_information": {"title": "QA"}, "enriched_company_data": {"name": "Beta"}},
+        {"id": "c3", "title": "No company"},
+    ]}
+    cards = extract_job_cards(payload, title_keys=["title", "job_information.title"],
+                              company_keys=["company", "enriched_company_data.name"])
+    assert cards == {"a1": ("SRE", "Acme"), "b2": ("QA", "Beta")}
+    assert extract_job_cards(payload) == {}
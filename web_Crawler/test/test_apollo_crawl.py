@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from web_Crawler.apolo_Crawl.apollo_crawl import (
+    ApolloDownloader,
+    DownloadCheckpoint,
+    page_url,
+    plan_pages,
+    read_gzip_html,
+    write_gzip_html,
+)
+
+QUERIES = [
+    {"NAME": "vietnam", "PARAMS": {"organizationLocations[]": ["Vietnam"], "sortAscending": "false"}, "PAGES": [1, 3]},
+    {"NAME": "germany", "PARAMS": {"organizationLocations[]": ["Germany"]}, "PAGES": [2, 2]},
+]
+
+
+def test_page_url_keeps_apollo_hash_query_style():
+    url = page_url("https://app.apollo.io/#/companies", QUERIES[0]["PARAMS"], 4)
+    assert url == (
+        "https://app.apollo.io/#/companies?organizationLocations[]=Vietnam&sortAscending=false&page=4"
+    )
+
+
+def test_plan_pages_expands_inclusive_ranges():
+    units = plan_pages(QUERIES)
+    assert [(name, page) for name, _, page in units] == [
+        ("vietnam", 1), ("vietnam", 2), ("vietnam", 3), ("germany", 2),
+    ]
+    with pytest.raises(ValueError):
+        plan_pages([QUERIES[0], QUERIES[0]])
+
+
+def test_gzip_html_round_trip(tmp_path):
+    path = str(tmp_path / "q" / "page_0001.html.gz")
+    html = "<html>" + "<tr><td>Acme</td></tr>" * 500 + "</html>"
+    size = write_gzip_html(path, html)
+    assert size == os.path.getsize(path) < len(html)
+    assert read_gzip_html(path) == html
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_checkpoint_resumes_missing_pages(tmp_path):
+    out_dir = str(tmp_path)
+    downloader = ApolloDownloader(QUERIES, cookies_path="cookies.json", out_dir=out_dir)
+    for page_num in (1, 2):
+        file = downloader.file_for("vietnam", page_num)
+        write_gzip_html(os.path.join(out_dir, file), "<html></html>")
+        downloader.checkpoint.mark("vietnam", page_num, file, bytes=1, rows=25)
+    os.remove(os.path.join(out_dir, downloader.file_for("vietnam", 1)))
+
+    reopened = ApolloDownloader(QUERIES, cookies_path="cookies.json", out_dir=out_dir)
+    assert reopened.checkpoint.last_page("vietnam") == 2
+    assert [(name, page) for name, _, page in reopened.pending_units()] == [
+        ("vietnam", 1), ("vietnam", 3), ("germany", 2),
+    ]
+    assert reopened.stats["skipped"] == 1
+    assert DownloadCheckpoint(os.path.join(out_dir, "checkpoint.json")).is_done("vietnam", 2, out_dir)
+
+
+def test_from_config_resolves_paths_under_save_root(tmp_path):
+    config = {"SAVE_ROOT_DIR": str(tmp_path), "APOLLO_QUERIES": QUERIES, "APOLLO_CONTEXTS": 3}
+    downloader = ApolloDownloader.from_config(config)
+    assert downloader.cookies_path == os.path.join(str(tmp_path), "apollo_cookies.json")
+    assert downloader.out_dir == os.path.join(str(tmp_path), "apollo_html")
+    assert downloader.contexts == 3
+    assert downloader.stats["planned"] == 4
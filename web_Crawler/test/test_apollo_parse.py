@@ -0,0 +1,114 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from web_Crawler.apolo_Crawl.apollo_crawl import write_gzip_html
+from web_Crawler.apolo_Crawl.apollo_parse import (
+    JsonlGzCompanyWriter,
+    ParquetCompanyWriter,
+    list_pages,
+    pa,
+    parse_apollo_page,
+    parse_employee_count,
+    parse_pages,
+)
+from web_Crawler.crawl_website.company_cache import normalize_company, normalize_domain
+
+
+def company_row(org_id, name, website, employees, industry, location):
+    return f"""
+    <div role="row">
+      <div role="cell"><input type="checkbox"></div>
+      <div role="cell"><a href="#/organizations/{org_id}">{name}</a>
+        <a href="https://www.linkedin.com/company/{org_id}">in</a>
+        <a href="{website}">site</a></div>
+      <div role="cell">{employees}</div>
+      <div role="cell"><span>{industry}</span></div>
+      <div role="cell">{location}</div>
+      <div role="cell">saas, b2b</div>
+    </div>"""
+
+
+def apollo_page(*rows):
+    header = "".join(
+        f'<div role="columnheader">{text}</div>'
+        for text in ("", "Company", "# Employees", "Industry", "Company Location", "Company Keywords")
+    )
+    return (
+        "<html><head><script>window.__STATE__ = {\"rows\": []};</script></head><body>"
+        f'<div role="table"><div role="row">{header}</div>{"".join(rows)}</div></body></html>'
+    )
+
+
+ACME = ("5f1a2b3c4d5e6f7a8b9c0d1e", "Acme Software JSC", "https://www.acme.vn/", "1,200", "Software", "Hanoi, Vietnam")
+BETA = ("6a1a2b3c4d5e6f7a8b9c0d1f", "Beta Labs", "http://betalabs.io", "51", "Fintech", "Ho Chi Minh City, Vietnam")
+
+
+def test_parse_apollo_page_maps_columns_by_header():
+    records = parse_apollo_page(apollo_page(company_row(*ACME), company_row(*BETA)), "vietnam/page_0001.html.gz")
+    assert [r["name"] for r in records] == ["Acme Software JSC", "Beta Labs"]
+    acme = records[0]
+    assert acme["apollo_id"] == ACME[0]
+    assert acme["website"] == "https://www.acme.vn/"
+    assert acme["domain"] == "acme.vn"
+    assert acme["linkedin_url"] == f"https://www.linkedin.com/company/{ACME[0]}"
+    assert acme["employee_count"] == 1200
+    assert acme["industry"] == "Software"
+    assert acme["location"] == "Hanoi, Vietnam"
+    assert acme["keywords"] == "saas, b2b"
+    assert acme["company_key"] == normalize_company("Acme Software JSC")
+    assert acme["source_page"] == "vietnam/page_0001.html.gz"
+
+
+def test_parse_apollo_page_without_table_is_empty():
+    assert parse_apollo_page("<html><body>Log in to Apollo</body></html>") == []
+
+
+def test_parse_employee_count():
+    assert parse_employee_count("1,200") == 1200
+    assert parse_employee_count("51-200") == 200
+    assert parse_employee_count("") is None
+
+
+def test_list_pages_orders_by_page_number(tmp_path):
+    for rel in ("q/page_0010.html.gz", "q/page_0002.html.gz", "apollo_page_3.html"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    assert list_pages(str(tmp_path)) == ["apollo_page_3.html", "q/page_0002.html.gz", "q/page_0010.html.gz"]
+
+
+def test_parse_pages_dedupes_across_pages_and_joins_with_hiring_cafe(tmp_path):
+    pages_dir = tmp_path / "apollo_html"
+    write_gzip_html(str(pages_dir / "vietnam" / "page_0001.html.gz"), apollo_page(company_row(*ACME)))
+    write_gzip_html(str(pages_dir / "vietnam" / "page_0002.html.gz"), apollo_page(company_row(*ACME), company_row(*BETA)))
+    (pages_dir / "vietnam" / "page_0003.html.gz").write_bytes(b"not gzip")
+
+    stats = parse_pages(str(pages_dir), JsonlGzCompanyWriter(str(tmp_path / "companies")), workers=2, chunk_size=1)
+    assert stats["pages"] == 3 and stats["failed_pages"] == 1
+    assert stats["rows"] == 3 and stats["companies"] == 2 and stats["duplicates"] == 1
+
+    with gzip.open(tmp_path / "companies.jsonl.gz", "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["source_page"] for r in records] == ["vietnam/page_0001.html.gz", "vietnam/page_0002.html.gz"]
+
+    # A HiringCafe job of the same company matches on either join key.
+    job = {"company": "@ ACME Software JSC", "company_website": "https://acme.vn/careers"}
+    assert records[0]["company_key"] == normalize_company(job["company"])
+    assert records[0]["domain"] == normalize_domain(job["company_website"])
+
+
+@pytest.mark.skipif(pa is None, reason="pyarrow not installed")
+def test_parquet_writer(tmp_path):
+    import pyarrow.parquet as pq
+
+    records = parse_apollo_page(apollo_page(company_row(*ACME), company_row(*BETA)))
+    with ParquetCompanyWriter(str(tmp_path / "companies"), batch_size=1) as writer:
+        for record in records:
+            writer.write(record)
+    table = pq.read_table(tmp_path / "companies.parquet")
+    assert table.column("employee_count").to_pylist() == [1200, 51]
+    assert table.num_rows == 2
+    assert not os.path.exists(tmp_path / "companies.parquet.inprogress")
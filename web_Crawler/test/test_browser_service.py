@@ -0,0 +1,152 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from web_Crawler.crawl_website import browser_service
+from web_Crawler.crawl_website.browser_pool import BrowserPool
+from web_Crawler.utils.utils import load_config
+
+
+class _VersionHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/json/version":
+            self.send_error(404)
+            return
+        body = json.dumps({"Browser": "Chrome/1.0", "webSocketDebuggerUrl": "ws://127.0.0.1/devtools/browser/x"})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cdp_endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _VersionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_launch_profile_falls_back_to_headless():
+    assert browser_service.launch_profile({"HEADLESS": True}) == {
+        "name": None, "headless": True, "args": [], "viewport": None
+    }
+    config = {
+        "BROWSER_PROFILE": "ci",
+        "VIEWPORT": {"width": 800, "height": 600},
+        "BROWSER_PROFILES": {"ci": {"headless": True, "args": ["--no-sandbox"]}},
+    }
+    profile = browser_service.launch_profile(config)
+    assert (profile["headless"], profile["args"], profile["viewport"]["width"]) == (True, ["--no-sandbox"], 800)
+    assert browser_service.launch_profile({}, "debug")["headless"] is False
+    with pytest.raises(ValueError):
+        browser_service.launch_profile({"BROWSER_PROFILE": "nope"})
+
+
+def test_chromium_command_serves_cdp_with_profile_flags():
+    profile = browser_service.launch_profile({}, "server")
+    command = browser_service.chromium_command("/opt/chrome", profile, 9333, "/tmp/udd")
+    assert command[:4] == [
+        "/opt/chrome", "--remote-debugging-port=9333", "--remote-debugging-address=127.0.0.1", "--user-data-dir=/tmp/udd"
+    ]
+    assert "--disable-dev-shm-usage" in command and "--headless=new" in command
+    debug = browser_service.chromium_command("/opt/chrome", browser_service.launch_profile({}, "debug"), 9333, "/u")
+    assert "--headless=new" not in debug
+
+
+def test_service_version_detects_endpoint(cdp_endpoint):
+    assert browser_service.service_version(cdp_endpoint)["Browser"] == "Chrome/1.0"
+    assert browser_service.service_version(None) is None
+    # Nothing listens on the discard port.
+    assert browser_service.service_version("http://127.0.0.1:9", timeout=0.2) is None
+
+
+def test_stop_service_cleans_stale_state(tmp_path):
+    config = {"SAVE_ROOT_DIR": str(tmp_path)}
+    path = browser_service.state_path(config)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"pid": 2 ** 22 + 1, "url": "http://127.0.0.1:9", "user_data_dir": str(tmp_path / "udd")}, f)
+    (tmp_path / "udd").mkdir()
+    assert browser_service.stop_service(config) is False
+    assert not (tmp_path / "udd").exists() and browser_service.read_state(path) is None
+
+
+def test_pool_from_config_uses_profile_and_service():
+    config = {
+        "HEADLESS": False,
+        "BROWSER_PROFILE": "server",
+        "BROWSER_SERVICE_URL": "http://127.0.0.1:9222",
+    }
+    pool = BrowserPool.from_config(config)
+    assert pool.headless is True and "--disable-gpu" in pool.launch_args
+    assert pool.service_url == "http://127.0.0.1:9222"
+    assert pool.stats["startup_mode"] is None
+
+
+def test_shipped_configs_leave_service_opt_in():
+    root = Path(__file__).resolve().parents[1]  # web_Crawler
+    for name in ("hiring_caffe_config.yaml", "apollo_config.yaml"):
+        assert load_config(str(root / "config" / name)).get("BROWSER_SERVICE_URL") is None
+
+
+def test_single_job_crawl_launches_with_config_profile(monkeypatch):
+    from web_Crawler.crawl_website import crawl_utils
+
+    seen = []
+
+    class FakeContext:
+        async def new_page(self):
+            return "page"
+
+        async def close(self):
+            pass
+
+    class FakeBrowser:
+        async def new_context(self, **options):
+            seen.append(("context", options))
+            return FakeContext()
+
+        async def close(self):
+            pass
+
+    class FakePlaywright:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    async def fake_acquire(playwright, service_url, profile):
+        seen.append(("acquire", service_url, profile["name"], profile["headless"]))
+        return FakeBrowser(), "launch"
+
+    async def fake_crawl(page, job_url, *args):
+        return {"url": job_url}
+
+    monkeypatch.setattr(crawl_utils, "async_playwright", FakePlaywright)
+    monkeypatch.setattr(crawl_utils, "acquire_browser", fake_acquire)
+    monkeypatch.setattr(crawl_utils, "_crawl_job_page", fake_crawl)
+
+    async def run():
+        await crawl_utils.crawl_full_job_with_tabs("u", config={"HEADLESS": True, "VIEWPORT": {"width": 800, "height": 600}})
+        await crawl_utils.crawl_full_job_with_tabs("u", config={"BROWSER_PROFILE": "server", "BROWSER_SERVICE_URL": "http://x"})
+        await crawl_utils.crawl_full_job_with_tabs("u")
+
+    asyncio.run(run())
+    assert seen == [
+        ("acquire", None, None, True),
+        ("context", {"viewport": {"width": 800, "height": 600}}),
+        ("acquire", "http://x", "server", True),
+        ("context", {}),
+        ("acquire", None, "server", True),
+        ("context", {}),
+    ]
@@ -0,0 +1,73 @@
+import os
+
+from web_Crawler.crawl_website.change_tracker import (
+    ADDED,
+    CHANGED,
+    UNCHANGED,
+    ChangeTracker,
+    field_fingerprints,
+    iter_deltas,
+)
+
+JOB_A = "https://hiring.cafe/viewjob/a"
+JOB_B = "https://hiring.cafe/viewjob/b"
+
+
+def record(url, **overrides):
+    base = {
+        "job_url": url,
+        "job_title": "Backend Engineer",
+        "company": "Acme",
+        "posted_date": "2025-10-01",
+        "requirements": ["Python", "SQL"],
+        "company_info": {"size": "51-200"},
+    }
+    base.update(overrides)
+    return base
+
+
+def test_fingerprints_ignore_volatile_fields_and_whitespace():
+    a = field_fingerprints(record(JOB_A))
+    b = field_fingerprints(record(JOB_B, posted_date="2025-10-04", job_title="  Backend\n Engineer "))
+    assert "posted_date" not in a and "job_url" not in a
+    assert a == b
+    assert field_fingerprints(record(JOB_A, requirements=["SQL", "Python"])) != a
+
+
+def test_stage_commit_and_delta_feed(tmp_path):
+    db = str(tmp_path / "fp.sqlite3")
+    first = ChangeTracker(db, str(tmp_path / "deltas"))
+    assert first.stage(JOB_A, record(JOB_A)) == ADDED
+    assert first.stage(JOB_B, record(JOB_B)) == ADDED
+    # Only what the sink committed counts; JOB_B's record never made it to disk.
+    assert first.commit([JOB_A]) == 1
+    first.close()
+    assert [d["op"] for d in iter_deltas(first.delta_path)] == [ADDED]
+
+    second = ChangeTracker(db, str(tmp_path / "deltas2"))
+    assert second.stage(JOB_A, record(JOB_A, posted_date="2025-10-09")) == UNCHANGED
+    assert second.stage(JOB_B, record(JOB_B)) == ADDED
+    assert second.stage(JOB_A, record(JOB_A, company_info={"size": "201-500"})) == CHANGED
+    second.commit([JOB_A, JOB_B])
+    second.close()
+    deltas = {d["job_url"]: d for d in iter_deltas(second.delta_path)}
+    assert deltas[JOB_A]["op"] == CHANGED and deltas[JOB_A]["changed_fields"] == ["company_info"]
+    assert deltas[JOB_A]["record"]["company_info"] == {"size": "201-500"}
+    assert deltas[JOB_B]["op"] == ADDED
+    assert second.summary()["unchanged"] == 1
+
+
+def test_mark_removed_and_readd(tmp_path):
+    tracker = ChangeTracker(str(tmp_path / "fp.sqlite3"), str(tmp_path / "deltas"), include_records=False)
+    for url in (JOB_A, JOB_B):
+        tracker.stage(url, record(url))
+    tracker.commit([JOB_A, JOB_B])
+    assert tracker.mark_removed([]) == []
+    assert tracker.mark_removed([JOB_A]) == [JOB_B]
+    assert len(tracker) == 1
+    assert tracker.stage(JOB_B, record(JOB_B)) == ADDED
+    tracker.commit([JOB_B])
+    tracker.close()
+    ops = [(d["op"], d["job_url"]) for d in iter_deltas(tracker.delta_path)]
+    assert ops == [(ADDED, JOB_A), (ADDED, JOB_B), ("removed", JOB_B), (ADDED, JOB_B)]
+    assert not os.path.exists(tracker.delta_path + ".inprogress")
@@ -0,0 +1,76 @@
+from web_Crawler.crawl_website import crawl_utils
+from web_Crawler.crawl_website.company_cache import CompanyCache, normalize_company
+
+INFO = {"Industry": "Software", "Size": "51-200"}
+
+
+def test_normalize_company_ignores_case_punctuation_and_at():
+    assert normalize_company("@ Acme, Inc.") == normalize_company("acme inc") == "acme inc"
+    assert normalize_company("  FPT   Software ") == "fpt software"
+    assert normalize_company("N/A") is None
+    assert normalize_company("") is None
+    assert normalize_company(None) is None
+
+
+def test_cache_round_trip_survives_reopen(tmp_path):
+    db = str(tmp_path / "companies.sqlite3")
+    cache = CompanyCache(db)
+    assert cache.get("Acme Inc", now=100.0) is None
+    assert cache.put("Acme Inc", INFO, "https://acme.example", now=100.0)
+    cache.close()
+
+    cache = CompanyCache(db)
+    entry = cache.get("@ ACME, inc.", now=200.0)
+    assert entry["company_info"] == INFO
+    assert entry["company_website"] == "https://acme.example"
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = CompanyCache(str(tmp_path / "c.sqlite3"), ttl_seconds=60)
+    cache.put("Acme", INFO, None, now=1000.0)
+    assert cache.get("Acme", now=1059.0) is not None
+    assert cache.get("Acme", now=1060.0) is None
+    assert cache.stats["expired"] == 1
+    cache.close()
+
+
+def test_memory_lru_is_bounded_and_falls_back_to_sqlite(tmp_path):
+    cache = CompanyCache(str(tmp_path / "c.sqlite3"), max_memory=2)
+    for name in ("A corp", "B corp", "C corp"):
+        cache.put(name, INFO, None, now=10.0)
+    assert list(cache._memory) == ["b corp", "c corp"]
+    assert cache.get("A corp", now=11.0) is not None
+    assert cache.stats["memory_hits"] == 0
+    assert cache.get("A corp", now=12.0) is not None
+    assert cache.stats["memory_hits"] == 1
+    cache.close()
+
+
+def test_failures_are_not_cached_and_hit_rate(tmp_path):
+    cache = CompanyCache(str(tmp_path / "c.sqlite3"))
+    assert not cache.put("Acme", "N/A", None)
+    assert not cache.put("Acme", {}, None)
+    assert not cache.put("Acme", {"company_info": "N/A"}, None)
+    assert not cache.put("N/A", INFO, None)
+    assert cache.get("Acme") is None
+
+    cache.put("Acme", INFO, None)
+    cache.get("Acme")
+    cache.get("Acme")
+    assert cache.summary()["hit_rate"] == round(2 / 3, 3)
+    cache.close()
+
+
+def test_from_config(tmp_path):
+    assert CompanyCache.from_config({"COMPANY_CACHE": False}, str(tmp_path)) is None
+    cache = CompanyCache.from_config({"COMPANY_CACHE_TTL_HOURS": 2}, str(tmp_path))
+    assert cache.ttl_seconds == 7200
+    assert (tmp_path / "company_cache.sqlite3").is_file()
+    cache.close()
+
+
+def test_build_job_record_uses_cached_company_info():
+    record = crawl_utils.build_job_record("https://hiring.cafe/viewjob/x", {}, cached_company_info=INFO)
+    assert record["company_info"] == INFO
@@ -0,0 +1,65 @@
+from web_Crawler.crawl_website.frontier import CrawlFrontier, DONE, FAILED, IN_FLIGHT
+
+URLS = [f"https://hiring.cafe/viewjob/job{i}" for i in range(4)]
+
+
+def test_discovery_is_idempotent(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.sqlite3"))
+    assert frontier.add_discovered(URLS[:3], now=100) == 3
+    assert frontier.add_discovered(URLS, now=200) == 1
+    assert len(frontier) == 4
+    assert frontier.pending() == URLS[:3] + URLS[3:]
+
+
+def test_states_survive_restart_and_in_flight_is_recovered(tmp_path):
+    db = str(tmp_path / "frontier.sqlite3")
+    frontier = CrawlFrontier(db)
+    frontier.add_discovered(URLS, now=100)
+    frontier.mark_in_flight(URLS[0])
+    frontier.mark_done(URLS[0], now=1_000)
+    frontier.mark_in_flight(URLS[1])
+    frontier.mark_failed(URLS[1], RuntimeError("timeout"))
+    frontier.mark_in_flight(URLS[2])  # the "crash" happens here
+    frontier.close()
+
+    frontier = CrawlFrontier(db)
+    assert frontier.counts() == {DONE: 1, FAILED: 1, IN_FLIGHT: 1, "discovered": 1}
+    assert frontier.recover_in_flight() == 1
+    assert frontier.pending(stale_after=3600, max_attempts=3, now=2_000) == URLS[1:]
+
+
+def test_failed_and_stale_rules(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.sqlite3"))
+    frontier.add_discovered(URLS[:2], now=100)
+    for _ in range(3):
+        frontier.mark_in_flight(URLS[0])
+        frontier.mark_failed(URLS[0], "boom")
+    frontier.mark_in_flight(URLS[1])
+    frontier.mark_done(URLS[1], now=1_000)
+
+    # out of attempts, and the done job is still fresh
+    assert frontier.pending(stale_after=3600, max_attempts=3, now=2_000) == []
+    # the done job became stale
+    assert frontier.pending(stale_after=3600, max_attempts=3, now=5_000) == [URLS[1]]
+
+
+def test_successful_recrawls_do_not_use_up_attempts(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.sqlite3"))
+    frontier.add_discovered(URLS[:1], now=100)
+    for crawl in range(5):  # five stale recrawls that all succeed
+        frontier.mark_in_flight(URLS[0])
+        frontier.mark_done_many([URLS[0]], now=1_000 + crawl * 10_000)
+    frontier.mark_in_flight(URLS[0])
+    frontier.mark_failed(URLS[0], "transient")
+    # One failure after many successes still leaves retries.
+    assert frontier.pending(stale_after=3600, max_attempts=3, now=60_000) == URLS[:1]
+
+
+def test_seed_done_and_meta(tmp_path):
+    frontier = CrawlFrontier(str(tmp_path / "frontier.sqlite3"))
+    frontier.seed_done(URLS[0], crawled_at=1_000)
+    frontier.add_discovered([URLS[0]])
+    assert frontier.counts() == {DONE: 1}
+    frontier.set_meta("discovery_completed_at", 123.5)
+    assert frontier.get_meta("discovery_completed_at") == "123.5"
+    assert frontier.get_meta("missing", "x") == "x"
@@ -1,67 +1,194 @@
-from pathlib import Path
+import asyncio
+import json
 import os
+import time
+import urllib.request
+from pathlib import Path
+
 import pytest
-from ._crawler_base import CrawlerBase
-from ..utils.utils import prepare_folder
-from ..utils.prepare_log import prepare_log
 
+from web_Crawler.benchmarks.fixture_server import FixtureSite, serve_fixture_site
+from web_Crawler.crawl_website.browser_service import service_version
+from web_Crawler.crawl_website._hiring_caffe_IT_crawl import HiringCaffeITCrawler
+from web_Crawler.crawl_website.change_tracker import iter_deltas
+from web_Crawler.crawl_website.frontier import DONE
+from web_Crawler.crawl_website.result_sink import iter_records
 
-def make_config(tmp_path: Path):
-    return {
-        "SITEMAP_URL": "http://example.com/sitemap.xml",
+
+def make_config(tmp_path: Path, **overrides):
+    config = {
+        "BASE_URL": "http://127.0.0.1:9/?searchState=%7B%7D",
         "HEADERS": {},
-        "TIMEOUT": 10,
+        "TIMEOUT": 10000,
         "SAVE_ROOT_DIR": str(tmp_path),
+        "RESULT_SINK": "jsonl",
+        "BLOCK_RESOURCES": False,
+        "HOST_LIMITS": {"default": {"rate": 0, "concurrency": 4, "max_concurrency": 4}},
+        # Reuse a running browser service (browser_service start) instead of launching per test.
+        "BROWSER_SERVICE_URL": os.environ.get("AAIR_BROWSER_SERVICE_URL"),
     }
+    config.update(overrides)
+    return config
+
+
+@pytest.fixture
+def chromium():
+    """Skip browser tests where Playwright's Chromium is not installed and no browser service runs."""
+    from playwright.sync_api import sync_playwright
+
+    if service_version(os.environ.get("AAIR_BROWSER_SERVICE_URL")) is not None:
+        return
+
+    try:
+        with sync_playwright() as p:
+            p.chromium.launch(headless=True).close()
+    except Exception as e:
+        pytest.skip(f"Chromium not available: {e}")
 
-SAMPLE_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-  <url><loc>https://hiring.cafe/job/1</loc></url>
-  <url><loc>https://hiring.cafe/job/2</loc></url>
-  <url><loc>https://hiring.cafe/job/3</loc></url>
-</urlset>
-"""
 
 def test_init_creates_dirs(tmp_path):
-    cfg = make_config(tmp_path)
-    crawler = HiringCafeCrawler(cfg)
-    # expected folder paths
-    assert os.path.isdir(os.path.join(cfg["SAVE_ROOT_DIR"], "result"))
-    assert os.path.isdir(os.path.join(cfg["SAVE_ROOT_DIR"], "logs"))
-    # attributes exist
-    assert hasattr(crawler, "res_dir")
-    assert hasattr(crawler, "log_dir")
-    assert hasattr(crawler, "job_titles_urls")
-
-def test_extract_url_sitemap_from_string(tmp_path):
-    cfg = make_config(tmp_path)
-    crawler = HiringCafeCrawler(cfg)
-    urls = crawler.extract_url_sitemap(xml_text=SAMPLE_SITEMAP)
-    assert isinstance(urls, list)
-    assert len(urls) == 3
-    assert "https://hiring.cafe/job/1" in urls
-    assert "https://hiring.cafe/job/3" in urls
-
-def test_extract_url_sitemap_fetch_monkeypatch(tmp_path, monkeypatch):
-    cfg = make_config(tmp_path)
-    crawler = HiringCafeCrawler(cfg)
-
-
-    class DummyResp:
-        def __init__(self, text):
-            self.text = text
-        def raise_for_status(self):
-            return None
-
-    def fake_get(url, headers=None, timeout=None):
-        assert url == cfg["SITEMAP_URL"]
-        return DummyResp(SAMPLE_SITEMAP)
-
-    monkeypatch.setattr(
-        "web_Crawler.crawl_website._hiring_caffe_crawl.requests.get",
-        fake_get,
-    )
-
-    urls = crawler.extract_url_sitemap()  # will use patched requests.get
-    assert isinstance(urls, list)
-    assert len(urls) == 3
\ No newline at end of file
+    crawler = HiringCaffeITCrawler(make_config(tmp_path))
+    assert os.path.isdir(os.path.join(tmp_path, "result_it_vn"))
+    assert os.path.isdir(os.path.join(tmp_path, "logs_it_vn"))
+    assert os.path.isfile(os.path.join(tmp_path, "frontier.sqlite3"))
+    assert crawler.res_dir == os.path.join(str(tmp_path), "result_it_vn")
+    assert crawler.snapshots is None
+    crawler.frontier.close()
+
+
+def test_prepare_frontier_seeds_existing_result_files(tmp_path):
+    crawler = HiringCaffeITCrawler(make_config(tmp_path))
+    with open(os.path.join(crawler.res_dir, "abc.json"), "w", encoding="utf-8") as f:
+        json.dump({"job_url": "https://hiring.cafe/viewjob/abc"}, f)
+    with open(os.path.join(crawler.res_dir, "job_links_zigzag_full.json"), "w", encoding="utf-8") as f:
+        json.dump(["https://hiring.cafe/viewjob/abc"], f)
+
+    crawler._prepare_frontier()
+    assert crawler.frontier.counts() == {DONE: 1}
+    crawler.frontier.close()
+
+
+def test_discovery_freshness(tmp_path):
+    crawler = HiringCaffeITCrawler(make_config(tmp_path, DISCOVERY_STALE_HOURS=1))
+    assert not crawler._discovery_is_fresh()
+    crawler.frontier.set_meta("discovery_completed_at", time.time() - 60)
+    assert crawler._discovery_is_fresh()
+    crawler.frontier.set_meta("discovery_completed_at", time.time() - 7200)
+    assert not crawler._discovery_is_fresh()
+    crawler.frontier.close()
+
+
+def test_failed_shard_emits_no_removals(tmp_path):
+    crawler = HiringCaffeITCrawler(make_config(
+        tmp_path, SHARD_DIMENSIONS={"workplaceTypes": [["Remote"], ["Onsite"]]}, SHARD_CONCURRENCY=2,
+    ))
+    job_a, job_b = "https://hiring.cafe/viewjob/a", "https://hiring.cafe/viewjob/b"
+    for url in (job_a, job_b):
+        crawler.changes.stage(url, {"job_url": url, "job_title": url})
+    crawler.changes.commit([job_a, job_b])
+
+    async def discover_job_links(pool, search_url=None, save_links=True):
+        if "Onsite" in search_url:
+            raise TimeoutError("shard page never loaded")
+        return [job_a], True
+
+    class FakePool:
+        concurrency = 2
+
+    crawler.discover_job_links = discover_job_links
+    links, complete = asyncio.run(crawler.discover_sharded(FakePool()))
+    assert links == [job_a] and not complete
+    assert crawler._track_removals(links, complete) == []
+    assert crawler._track_removals(links, True) == [job_b]
+    crawler.changes.close()
+    removed = [d["job_url"] for d in iter_deltas(crawler.changes.delta_path) if d["op"] == "removed"]
+    assert removed == [job_b]  # only from the complete discovery
+    crawler.frontier.close()
+
+
+def test_failed_dom_discovery_releases_carousel_slots(tmp_path):
+    from contextlib import asynccontextmanager
+
+    crawler = HiringCaffeITCrawler(make_config(tmp_path, CAROUSEL_WORKERS=2))
+
+    class FakePage:
+        def __init__(self, fail):
+            self.fail = fail
+
+        async def goto(self, url, **kwargs):
+            # Let the carousel workers borrow their tabs first.
+            for _ in range(5):
+                await asyncio.sleep(0)
+            if self.fail:
+                raise TimeoutError("search page never loaded")
+
+        async def wait_for_selector(self, selector, **kwargs):
+            pass
+
+        async def evaluate(self, script, arg=None):
+            return True
+
+    class FakePool:
+        concurrency = 3
+
+        def __init__(self):
+            self.in_use = 0
+            self.borrowed = 0
+
+        @asynccontextmanager
+        async def page(self):
+            self.in_use += 1
+            self.borrowed += 1
+            try:
+                yield FakePage(fail=self.borrowed == 1)  # the discovery tab is borrowed first
+            finally:
+                self.in_use -= 1
+
+    async def run(pool):
+        with pytest.raises(TimeoutError):
+            await crawler.extract_all_job_links_safely(pool, save_links=False)
+        await asyncio.sleep(0)
+        return pool.borrowed, pool.in_use
+
+    assert asyncio.run(run(FakePool())) == (3, 0)
+    crawler.frontier.close()
+
+
+def test_fixture_server_serves_search_api_and_jobs():
+    site = FixtureSite(jobs=7, jobs_per_company=2, companies_per_page=2)
+    with serve_fixture_site(site) as root_url:
+        first = json.load(urllib.request.urlopen(f"{root_url}/api/search-jobs?page=1"))
+        last = json.load(urllib.request.urlopen(f"{root_url}/api/search-jobs?page=2"))
+        job_page = urllib.request.urlopen(f"{root_url}/viewjob/{site.job_ids[0]}").read().decode("utf-8")
+
+    assert [job["id"] for job in first["results"] + last["results"]] == site.job_ids
+    assert first["has_more"] and not last["has_more"]
+    assert "font-extrabold" in job_page and "Company Info" in job_page
+    assert site.requests["api"] == 2 and site.requests["viewjob"] == 1
+
+
+@pytest.mark.parametrize("mode", ["api", "dom"])
+def test_crawl_website_end_to_end(tmp_path, chromium, mode):
+    site = FixtureSite(jobs=12, jobs_per_company=3, companies_per_page=2, render_ms=20)
+    with serve_fixture_site(site) as root_url:
+        config = make_config(
+            tmp_path,
+            BASE_URL=f"{root_url}/?searchState=%7B%7D",
+            HEADLESS=True,
+            DISCOVERY_MODE=mode,
+            API_RESPONSE_PATTERN=r"/api/search-jobs",
+            DETAIL_CONCURRENCY=3,
+            CAROUSEL_WORKERS=2,
+            PARSE_WORKERS=2,
+        )
+        crawler = HiringCaffeITCrawler(config)
+        asyncio.run(crawler.crawl_website())
+
+    assert crawler.total_crawled == len(site.jobs)
+    records = list(iter_records(os.path.join(crawler.res_dir, "jsonl")))
+    assert sorted(r["job_url"].rsplit("/", 1)[-1] for r in records) == sorted(site.job_ids)
+    sample = records[0]
+    assert sample["job_title"] != "N/A"
+    assert isinstance(sample["company_info"], dict)
+    assert "/company-site/" in sample["company_website"]
+    crawler.frontier.close()
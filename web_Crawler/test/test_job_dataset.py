@@ -0,0 +1,108 @@
+import json
+
+import pandas as pd
+import pytest
+
+from web_Crawler.crawl_website.job_dataset import (
+    LOAD_COLUMNS,
+    load_records,
+    normalize_jobs,
+    normalize_posted,
+    normalize_salary,
+)
+from web_Crawler.crawl_website.job_fields import annualize, parse_salary
+from web_Crawler.crawl_website.result_sink import make_result_sink
+
+SALARIES = ["$18-$29/hr", "$80-120k/yr", "€60k a year", "VND 20,000,000 - 30,000,000 per month",
+            " $2,500-$4,000/mo ", "Est 80k-100k/yr", "$100k+ a year", "Pay 50k", "Competitive", "N/A", None]
+
+
+def job(idx, **overrides):
+    base = {
+        "job_url": f"https://hiring.cafe/viewjob/job{idx}",
+        "job_title": "Patient Access Rep ",
+        "company": "Southcoast",
+        "location": "Fall River, Massachusetts, United States",
+        "salary": "$18-$29/hr",
+        "work_mode": "Remote · Hybrid",
+        "employment_type": "Part Time",
+        "posted_date": "2025-10-26 ",
+        "company_info": {"Year Founded": "1996", "Num Employees": "3580", "Headquarters Country": "United States"},
+        "company_website": "https://www.southcoast.org/",
+    }
+    base.update(overrides)
+    return base
+
+
+def test_salary_columns_match_parse_salary():
+    columns = normalize_salary(pd.Series(SALARIES, dtype=object))
+    for text, row in zip(SALARIES, columns.itertuples()):
+        expected = parse_salary(text.strip() if text else text)
+        if expected is None:
+            assert pd.isna(row.salary_min) and pd.isna(row.salary_currency)
+            continue
+        currency = None if pd.isna(row.salary_currency) else row.salary_currency
+        period = None if pd.isna(row.salary_period) else row.salary_period
+        assert (row.salary_min, row.salary_max, currency, period) == (
+            expected["min"], expected["max"], expected["currency"], expected["period"])
+        if expected["period"]:
+            assert row.salary_year_max == annualize(expected["max"], expected["period"])
+
+
+def test_posted_dates_absolute_and_relative():
+    posted = normalize_posted(pd.Series(["2025-10-26 ", "Posted 3d ago", "Oct 5, 2025", "yesterday", "soon", None]))
+    assert list(posted["posted_at"][:3].dt.strftime("%Y-%m-%d").fillna("-")) == ["2025-10-26", "-", "2025-10-05"]
+    assert list(posted["posted_ago"]) == [pd.NaT, pd.Timedelta(days=3), pd.NaT, pd.Timedelta(days=1), pd.NaT, pd.NaT]
+
+
+def test_normalize_jobs_types_and_values():
+    records = [
+        job(1),
+        job(2, salary="N/A", work_mode="N/A", posted_date="Posted 2 hours ago", crawled_at="2025-10-30T09:00:00",
+            company_info={"Employees": "10,001+"}),
+        job(3, company=" Southcoast", work_mode="Onsite", company_info="N/A"),
+    ]
+    out = normalize_jobs(pd.DataFrame.from_records(records, columns=LOAD_COLUMNS), now="2025-10-31")
+    assert list(out["job_id"]) == ["job1", "job2", "job3"]
+    assert out["job_title"][0] == "Patient Access Rep"
+    assert list(out["company"].cat.categories) == ["Southcoast"]  # cleaned before it became a category
+    assert list(out["salary_year_min"].fillna(0)) == [37440.0, 0, 37440.0]
+    assert list(out["work_mode_remote"]) == [True, False, False]
+    assert list(out["work_mode_onsite"]) == [False, False, True]
+    assert out["posted_at"][1] == pd.Timestamp("2025-10-30 07:00:00")  # counted back from the crawl time
+    assert list(out["company_employees_min"].fillna(-1)) == [3580, 10001, -1]
+    assert list(out["company_employees_max"].fillna(-1)) == [3580, -1, -1]  # "10,001+" has no upper bound
+    assert out["company_year_founded"].dtype == "Int16" and out["company_country"].dtype == "category"
+
+
+def test_words_before_a_salary_are_not_currencies():
+    records = [job(1, salary="Est 80k-100k/yr"), job(2, salary="Pay 50k"), job(3, salary="GBP 40k a year")]
+    out = normalize_jobs(pd.DataFrame.from_records(records, columns=LOAD_COLUMNS))
+    assert list(out["salary_currency"].astype(object).where(out["salary_currency"].notna(), None)) == [
+        None, None, "GBP"]
+    assert list(out["salary_year_max"].fillna(0)) == [100000.0, 0, 40000.0]
+
+
+def test_normalize_jobs_without_pyarrow_says_so(monkeypatch):
+    from web_Crawler.crawl_website import job_dataset
+
+    monkeypatch.setattr(job_dataset, "pa", None)
+    with pytest.raises(RuntimeError, match="needs pyarrow"):
+        normalize_jobs(pd.DataFrame.from_records([job(1)], columns=LOAD_COLUMNS))
+
+
+@pytest.mark.parametrize("kind", ["jsonl", "parquet"])
+def test_load_records_keeps_the_latest_crawl(tmp_path, kind):
+    config = {"RESULT_SINK": kind}
+    with make_result_sink(config, str(tmp_path)) as sink:
+        for record in (job(1), job(2), job(1, salary="$20-$30/hr")):
+            sink.write(record["job_url"], record)
+    frame = load_records(config, str(tmp_path))
+    assert list(frame["job_url"]) == ["https://hiring.cafe/viewjob/job2", "https://hiring.cafe/viewjob/job1"]
+    assert "job_description" not in frame
+    out = normalize_jobs(frame)
+    assert list(out["salary_min"]) == [18.0, 20.0]
+    assert list(out["company_employees_min"]) == [3580, 3580]
+    assert out["crawled_at"].notna().all()
+    if kind == "parquet":
+        assert json.loads(frame["company_info"][0])["Year Founded"] == "1996"
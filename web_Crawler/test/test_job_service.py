@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from web_Crawler.crawl_website.job_service import (
+    BackgroundLoop,
+    JobService,
+    ResultCache,
+    ServiceBusy,
+    create_app,
+    is_job_url,
+    job_id_of,
+)
+from web_Crawler.crawl_website.search_index import SearchIndex
+
+JOB_A = "https://hiring.cafe/viewjob/abc123"
+JOB_B = "https://hiring.cafe/viewjob/def456"
+
+
+class FakeCrawler:
+    """Counts crawls per URL; each takes ``delay`` seconds, URLs in ``fail`` raise."""
+
+    def __init__(self, delay=0.02, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = {}
+
+    async def crawl(self, job_url):
+        self.calls[job_url] = self.calls.get(job_url, 0) + 1
+        await asyncio.sleep(self.delay)
+        if job_url in self.fail:
+            raise RuntimeError("page never loaded")
+        return {"job_url": job_url, "job_title": "Backend Engineer", "run": self.calls[job_url]}
+
+    async def discover(self):
+        return [JOB_A, JOB_B]
+
+
+def test_job_id_of():
+    assert job_id_of(JOB_A) == "abc123"
+    assert job_id_of("https://hiring.cafe/?searchState=%7B%7D") is None
+
+
+def test_is_job_url():
+    assert is_job_url(JOB_A, "hiring.cafe") and is_job_url("http://www.hiring.cafe/viewjob/x1/", "hiring.cafe")
+    assert not is_job_url("https://evil.example/viewjob/abc123", "hiring.cafe")
+    assert not is_job_url("https://hiring.cafe.evil.example/viewjob/abc123", "hiring.cafe")
+    assert not is_job_url("https://hiring.cafe/jobs/it", "hiring.cafe")
+    assert not is_job_url("file:///etc/passwd", "hiring.cafe")
+
+
+def test_duplicate_requests_share_one_crawl_and_then_hit_the_cache():
+    crawler = FakeCrawler()
+
+    async def run():
+        service = JobService(crawler.crawl, cache=ResultCache(":memory:", ttl_seconds=60), workers=2)
+        await service.start()
+        try:
+            first, second = await asyncio.gather(
+                service.submit([JOB_A, JOB_B], wait=True, timeout=5),
+                service.submit([JOB_A], wait=True, timeout=5),
+            )
+            cached = await service.submit([JOB_A], wait=True)
+            return first, second, cached, service.summary()
+        finally:
+            await service.stop()
+
+    first, second, cached, summary = asyncio.run(run())
+    assert crawler.calls == {JOB_A: 1, JOB_B: 1}
+    assert [item["status"] for item in first] == ["done", "done"]
+    assert second[0]["status"] == "done" and second[0]["record"] == first[0]["record"]
+    assert cached[0]["status"] == "cached" and cached[0]["fresh"]
+    assert (summary["collapsed"], summary["cache_hits"], summary["crawled"]) == (1, 1, 2)
+
+
+def test_stale_or_forced_results_are_recrawled():
+    crawler = FakeCrawler(delay=0)
+
+    async def run():
+        cache = ResultCache(":memory:", ttl_seconds=60)
+        cache.put(JOB_A, {"job_url": JOB_A, "run": 0}, now=1.0)
+        service = JobService(crawler.crawl, cache=cache, workers=1)
+        await service.start()
+        try:
+            stale = await service.submit([JOB_A], wait=True, timeout=5)
+            forced = await service.submit([JOB_A], force=True, wait=True, timeout=5)
+            return stale, forced, service.lookup(job_id="abc123")
+        finally:
+            await service.stop()
+
+    stale, forced, by_id = asyncio.run(run())
+    assert stale[0]["record"]["run"] == 1 and forced[0]["record"]["run"] == 2
+    assert by_id["status"] == "cached" and by_id["record"]["run"] == 2
+
+
+def test_full_queue_rejects_and_failures_are_reported():
+    crawler = FakeCrawler(delay=0.05, fail={JOB_B})
+
+    async def run():
+        service = JobService(crawler.crawl, cache=ResultCache(":memory:"), workers=1, queue_size=1)
+        await service.start()
+        try:
+            service.request(JOB_A)
+            with pytest.raises(ServiceBusy):
+                service.request(JOB_B)
+            await asyncio.sleep(0.01)  # the worker took JOB_A, so the queue has room again
+            failed = await service.submit([JOB_B], wait=True, timeout=5)
+            return failed, service.summary()
+        finally:
+            await service.stop()
+
+    failed, summary = asyncio.run(run())
+    assert failed[0]["status"] == "failed" and "page never loaded" in failed[0]["error"]
+    assert (summary["rejected"], summary["failed"], summary["in_flight"]) == (1, 1, 0)
+
+
+def test_http_endpoints():
+    crawler = FakeCrawler()
+    runner = BackgroundLoop()
+
+    async def build():
+        service = JobService(crawler.crawl, crawler.discover, ResultCache(":memory:"), workers=2,
+                             search=SearchIndex(":memory:"))
+        await service.start()
+        return service
+
+    service = runner.call(build())
+    client = create_app(service, runner, wait_seconds=5).test_client()
+    try:
+        assert client.get("/jobs/abc123").status_code == 404
+        response = client.post("/jobs", json={"url": JOB_A, "wait": True})
+        assert response.status_code == 200
+        assert response.get_json()["results"][0]["record"]["job_title"] == "Backend Engineer"
+        assert client.get("/jobs/abc123").get_json()["status"] == "cached"
+        assert client.get("/jobs", query_string={"url": JOB_A}).status_code == 200
+        assert client.post("/jobs", json={}).status_code == 400
+        bad = client.post("/jobs", json={"urls": [JOB_B, "http://169.254.169.254/viewjob/x"]})
+        assert bad.status_code == 400 and bad.get_json()["invalid"] == ["http://169.254.169.254/viewjob/x"]
+        for timeout in ("soon", -1, None, [1]):
+            response = client.post("/jobs", json={"url": JOB_A, "wait": True, "timeout": timeout})
+            assert response.status_code == 400, timeout
+        found = client.get("/search", query_string={"q": "backend"}).get_json()
+        assert [hit["job_id"] for hit in found["results"]] == ["abc123"]
+        assert client.get("/search", query_string={"limit": "many"}).status_code == 400
+        assert client.get("/search", query_string={"salary_min": "50000"}).status_code == 400
+
+        run = client.post("/discoveries", json={"crawl": True}).get_json()
+        for _ in range(100):
+            run = client.get(f"/discoveries/{run['id']}").get_json()
+            if run["status"] != "running":
+                break
+            runner.call(asyncio.sleep(0.01))
+        assert (run["status"], run["links"], run["cached"], run["queued"]) == ("done", 2, 1, 1)
+        assert client.get("/health").get_json()["requests"] >= 3
+    finally:
+        runner.call(service.stop())
+        runner.stop()
@@ -0,0 +1,44 @@
+import json
+
+from web_Crawler.utils.metrics import Metrics
+
+
+def test_timers_counters_and_summary(tmp_path):
+    metrics = Metrics()
+    for _ in range(3):
+        with metrics.timer("navigate"):
+            pass
+    metrics.observe("links_per_scroll_step", 4)
+    metrics.observe("links_per_scroll_step", 10)
+    metrics.incr("company_info_retries")
+    metrics.incr("company_info_retries", 2)
+    metrics.error("detail", TimeoutError("slow"))
+
+    summary = metrics.summary()
+    assert summary["distributions"]["stage_seconds"]["stage=navigate"]["count"] == 3
+    steps = summary["distributions"]["links_per_scroll_step"]["all"]
+    assert (steps["count"], steps["sum"], steps["min"], steps["max"]) == (2, 14, 4, 10)
+    assert summary["counters"]["company_info_retries"] == {"total": 3}
+    assert summary["counters"]["errors"] == {"stage=detail,type=TimeoutError": 1}
+    assert metrics.counter("errors", stage="detail", type="TimeoutError") == 1
+
+    path = metrics.write_json(str(tmp_path / "run.json"), {"jobs_crawled": 5})
+    assert json.loads(open(path, encoding="utf-8").read())["jobs_crawled"] == 5
+
+
+def test_prometheus_text_format(tmp_path):
+    metrics = Metrics(prefix="aair")
+    metrics.incr("jobs", outcome="done")
+    metrics.incr("jobs", outcome="failed")
+    metrics.observe("stage_seconds", 0.5, stage="navigate")
+    metrics.incr("errors", stage="x", type='Bad"Quote')
+
+    text = open(metrics.write_prometheus(str(tmp_path / "m.prom")), encoding="utf-8").read()
+    lines = text.splitlines()
+    assert lines.count("# TYPE aair_jobs_total counter") == 1
+    assert 'aair_jobs_total{outcome="done"} 1' in lines
+    assert 'aair_jobs_total{outcome="failed"} 1' in lines
+    assert "# TYPE aair_stage_seconds summary" in lines
+    assert 'aair_stage_seconds{stage="navigate",quantile="0.5"} 0.5' in lines
+    assert 'aair_stage_seconds_count{stage="navigate"} 1' in lines
+    assert 'aair_errors_total{stage="x",type="Bad\\"Quote"} 1' in lines
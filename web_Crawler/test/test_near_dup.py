@@ -0,0 +1,80 @@
+import random
+
+import numpy as np
+import pytest
+
+from web_Crawler.crawl_website.near_dup import MinHasher, NearDupIndex, card_key, job_features, similarity
+
+VOCAB = [f"w{i}" for i in range(2000)]
+
+
+def description(seed, words=200):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCAB) for _ in range(words))
+
+
+def job(seed, title="Backend Engineer", company="Acme", edit=None):
+    text = description(seed)
+    if edit:
+        text = text.replace(text.split()[10], edit, 1)
+    return {"job_title": title, "company": company, "job_description": text, "posted_date": "2025-10-01"}
+
+
+def test_minhash_estimates_jaccard():
+    hasher = MinHasher(num_perm=256)
+    a = job_features(job(1))
+    b = job_features(job(1, edit="reposted"))
+    exact = len(np.intersect1d(a, b)) / len(np.union1d(a, b))
+    assert abs(similarity(hasher.signature(a), hasher.signature(b)) - exact) < 0.1
+    assert similarity(hasher.signature(a), hasher.signature(job_features(job(2)))) < 0.2
+    assert hasher.signature(job_features({"job_description": "N/A"})) is None
+
+
+def test_reposts_and_agency_copies_share_a_cluster(tmp_path):
+    index = NearDupIndex(str(tmp_path / "nd.sqlite3"))
+    jobs = {
+        "/viewjob/1": job(1),
+        "/viewjob/2": job(1, edit="hanoi"),  # the same role posted for another location
+        "/viewjob/3": job(1, company="Talent Agency"),  # an agency copy
+        "/viewjob/4": job(2),
+        "/viewjob/5": {"job_title": "QA", "company": "Acme", "job_description": "N/A"},
+    }
+    assert index.add_many(jobs.items()) == 4
+    assert index.clusters() == {"/viewjob/1": ["/viewjob/1", "/viewjob/2", "/viewjob/3"]}
+    assert index.cluster_of("/viewjob/4") == "/viewjob/4"
+    assert index.cluster_of("/viewjob/5") is None
+    summary = index.summary()
+    assert (summary["duplicates"], summary["unindexable"], summary["clusters"]) == (2, 1, 2)
+    index.close()
+
+    # Reopened, the index keeps checking new crawls against what it already holds.
+    reopened = NearDupIndex(str(tmp_path / "nd.sqlite3"))
+    assert reopened.add("/viewjob/6", job(1, edit="repost")) == "/viewjob/1"
+    assert reopened.match_card("backend  engineer", "ACME") == "/viewjob/1"
+    assert reopened.match_card("Data Engineer", "Acme") is None
+    reopened.close()
+    with pytest.raises(ValueError):
+        NearDupIndex(str(tmp_path / "nd.sqlite3"), num_perm=64, bands=16)
+
+
+def test_bridging_job_merges_clusters(tmp_path):
+    # Wider bands so a 0.66 overlap reliably becomes a candidate.
+    index = NearDupIndex(str(tmp_path / "nd.sqlite3"), bands=32, threshold=0.5)
+    base = description(7, words=120).split()
+    first = {"job_title": "SRE", "company": "Acme", "job_description": " ".join(base[:80])}
+    second = {"job_title": "SRE", "company": "Acme", "job_description": " ".join(base[40:])}
+    bridge = {"job_title": "SRE", "company": "Acme", "job_description": " ".join(base)}
+    assert index.add("/a", first) == "/a"
+    assert index.add("/b", second) == "/b"
+    assert index.add("/c", bridge) == "/a"
+    assert index.clusters() == {"/a": ["/a", "/b", "/c"]}
+    assert index.stats["merges"] == 1
+
+
+def test_card_duplicates_join_without_signature(tmp_path):
+    index = NearDupIndex(str(tmp_path / "nd.sqlite3"))
+    index.add("/viewjob/1", job(1))
+    assert card_key("Backend Engineer", "Acme") == "acme|backend engineer"
+    index.add_card_duplicate("/viewjob/9", "/viewjob/1", "Backend Engineer", "Acme")
+    assert index.cluster_of("/viewjob/9") == "/viewjob/1" and not index.is_indexed("/viewjob/9")
+    assert index.clusters()["/viewjob/1"] == ["/viewjob/1", "/viewjob/9"]
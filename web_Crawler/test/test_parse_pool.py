@@ -0,0 +1,60 @@
+import asyncio
+import time
+from pathlib import Path
+
+from web_Crawler.crawl_website import crawl_utils
+from web_Crawler.crawl_website.parse_pool import InlineParser, ParsePool, make_parser
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "viewjob_backend_engineer.html"
+
+
+def _slow_square(x):
+    time.sleep(0.05)
+    return x * x
+
+
+def test_pool_parses_like_inline():
+    html = FIXTURE.read_text(encoding="utf-8")
+    pool = ParsePool(workers=2)
+
+    async def run():
+        return await asyncio.gather(
+            pool.run(crawl_utils.parse_job_sections, html),
+            pool.run(crawl_utils.parse_description_and_website, html),
+            InlineParser().run(crawl_utils.parse_job_sections, html),
+        )
+
+    try:
+        pooled, (description, website), inline = asyncio.run(run())
+    finally:
+        pool.close()
+    assert pooled == inline
+    assert description == crawl_utils.parse_job_description(html)
+    assert website == crawl_utils.parse_website_fallback(html)
+    assert pool.stats["parsed"] == 2
+
+
+def test_pool_applies_backpressure():
+    pool = ParsePool(workers=1, max_pending=1)
+
+    async def run():
+        return await asyncio.gather(*(pool.run(_slow_square, x) for x in range(4)))
+
+    try:
+        assert asyncio.run(run()) == [0, 1, 4, 9]
+    finally:
+        pool.close()
+    summary = pool.summary()
+    assert summary["max_in_flight"] == 1
+    assert summary["backpressure_waits"] >= 1
+    assert summary["backpressure_seconds"] > 0
+
+
+def test_make_parser():
+    assert isinstance(make_parser({}), InlineParser)
+    pool = make_parser({"PARSE_WORKERS": 3})
+    try:
+        assert isinstance(pool, ParsePool)
+        assert (pool.workers, pool.max_pending) == (3, 6)
+    finally:
+        pool.close()
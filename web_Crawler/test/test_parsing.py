@@ -0,0 +1,66 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from web_Crawler.benchmarks import legacy_parsers
+from web_Crawler.crawl_website import crawl_utils
+
+FIXTURES = sorted((Path(__file__).resolve().parent / "fixtures").glob("viewjob_*.html"))
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 10, 27, 9, 30, 0)
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    monkeypatch.setattr(crawl_utils, "datetime", FrozenDatetime)
+
+
+def legacy_extract(html):
+    return (
+        legacy_parsers.legacy_parse_job_sections(html),
+        legacy_parsers.legacy_parse_company_info_table(html),
+        legacy_parsers.legacy_parse_job_description(html),
+        legacy_parsers.legacy_parse_website_fallback(html),
+    )
+
+
+def engine_extract(html, parser):
+    soup = crawl_utils.make_soup(html, parser)
+    return (
+        crawl_utils.parse_job_sections(soup),
+        crawl_utils.parse_company_info_table(soup),
+        crawl_utils.parse_job_description(soup),
+        crawl_utils.parse_website_fallback(soup),
+    )
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda p: p.stem)
+def test_single_parse_engine_matches_legacy_output(fixture, parser):
+    if parser == "lxml":
+        pytest.importorskip("lxml")
+    html = fixture.read_text(encoding="utf-8")
+    assert engine_extract(html, parser) == legacy_extract(html)
+
+
+def test_parse_job_sections_fields():
+    html = (FIXTURES[0].parent / "viewjob_patient_access.html").read_text(encoding="utf-8")
+    data = crawl_utils.parse_job_sections(html)
+    assert data["job_title"] == "Patient Access Rep-Imaging-SHG"
+    assert data["location"] == "Fall River, Massachusetts, United States"
+    assert data["salary"] == "$18-$29/hr"
+    assert data["employment_type"] == "Part Time"
+
+
+def test_parse_posted_date_text():
+    now = datetime(2025, 10, 27, 9, 30, 0)
+    assert crawl_utils.parse_posted_date_text("Posted 3d ago", now) == "2025-10-24 09:30:00"
+    assert crawl_utils.parse_posted_date_text("Posted 2 hours ago", now) == "2025-10-27 07:30:00"
+    assert crawl_utils.parse_posted_date_text("Posted yesterday", now) == "2025-10-26 09:30:00"
+    assert crawl_utils.parse_posted_date_text("Oct 26, 2025", now) == "2025-10-26 00:00:00"
+    assert crawl_utils.parse_posted_date_text("Posted sometime", now) == "sometime"
@@ -0,0 +1,143 @@
+import asyncio
+
+from web_Crawler.utils.rate_limit import AimdLimiter, HostScheduler, HostThrottle, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_reserve_spends_burst_then_reports_wait():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == 0.5
+    clock.now = 0.5
+    assert bucket.reserve() == 0.0
+
+
+def test_refill_is_capped_at_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now = 100.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 1.0
+
+
+def test_zero_rate_is_unlimited():
+    bucket = TokenBucket.per_minute(0)
+    assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+
+def test_acquire_spaces_concurrent_callers():
+    bucket = TokenBucket(rate=50, burst=1)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+        return loop.time() - started
+
+    elapsed = asyncio.run(run())
+    # One token up front, then three more at 20 ms intervals.
+    assert elapsed >= 0.055
+    assert bucket.stats["acquired"] == 4
+    assert bucket.stats["waits"] == 3
+
+
+def test_aimd_limiter_grows_per_window_and_halves_with_cooldown():
+    clock = FakeClock()
+    limiter = AimdLimiter(initial=2, minimum=1, maximum=4, cooldown=5, clock=clock)
+    assert [limiter.on_success() for _ in range(2)] == [False, True]
+    assert limiter.limit == 3
+    for _ in range(3):
+        limiter.on_success()
+    assert limiter.limit == 4
+
+    assert limiter.on_overload() and limiter.limit == 2
+    clock.now = 1.0
+    assert not limiter.on_overload() and limiter.limit == 2
+    clock.now = 6.0
+    assert limiter.on_overload() and limiter.limit == 1
+    assert limiter.stats == {"increases": 2, "decreases": 2, "max_limit": 4, "min_limit": 1}
+
+
+def test_aimd_limiter_caps_concurrent_holders():
+    limiter = AimdLimiter(initial=2, maximum=2)
+    peak = 0
+
+    async def work():
+        nonlocal peak
+        await limiter.acquire()
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.01)
+        await limiter.release()
+
+    async def run():
+        await asyncio.gather(*(work() for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2 and limiter.in_flight == 0
+
+
+def test_host_throttle_backs_off_on_429_and_timeouts():
+    clock = FakeClock()
+    # Enough burst for three requests, since the fake clock never refills the bucket.
+    throttle = HostThrottle("hiring.cafe", rate=2.0, burst=3, max_rate=4.0, concurrency=4, max_concurrency=8,
+                            cooldown=0, clock=clock)
+
+    async def run():
+        async with throttle.request() as ticket:
+            ticket.status = 429
+        try:
+            async with throttle.request():
+                raise asyncio.TimeoutError()
+        except asyncio.TimeoutError:
+            pass
+        backed_off = (throttle.limiter.limit, throttle.bucket.rate)
+        async with throttle.request():
+            pass
+        return backed_off
+
+    assert asyncio.run(run()) == (1, 0.5)
+    summary = throttle.summary()
+    assert (summary["throttled"], summary["timeouts"], summary["ok"]) == (1, 1, 1)
+    # One success at limit 1 completes a window: +1 slot and +10% of the initial rate.
+    assert (summary["concurrency"], summary["rate"]) == (2, 0.7)
+
+
+def test_host_throttle_speeds_up_to_max_rate_and_flags_slow_responses():
+    throttle = HostThrottle("x.io", rate=1.0, max_rate=1.2, rate_step=0.1, concurrency=1, latency_target=5)
+    for _ in range(5):
+        throttle.record(status=200, latency=0.1)
+    assert throttle.bucket.rate == 1.2
+    throttle.record(status=200, latency=9.0)
+    assert throttle.stats["slow"] == 1
+    assert throttle.limiter.stats["decreases"] == 1
+
+
+def test_scheduler_profiles_by_host_suffix_and_caps():
+    config = {"HOST_LIMITS": {
+        "hiring.cafe": {"rate": 3, "max_concurrency": 8},
+        "default": {"rate": 0.5, "concurrency": 1, "max_concurrency": 2},
+    }}
+    scheduler = HostScheduler.from_config(config, caps={"hiring.cafe": 4})
+    cafe = scheduler.throttle("https://www.hiring.cafe/viewjob/abc")
+    assert cafe is scheduler.throttle("https://hiring.cafe/viewjob/def")
+    assert (cafe.host, cafe.bucket.rate, cafe.limiter.maximum) == ("hiring.cafe", 3, 4)
+    assert scheduler.throttle("https://api.hiring.cafe/x").bucket.rate == 3
+
+    site = scheduler.throttle("https://acme.vn/about")
+    assert (site.bucket.rate, site.limiter.maximum) == (0.5, 2)
+    assert scheduler.throttle("https://beta.io") is not site
+
+    scheduler.observe("https://acme.vn/api", 503)
+    scheduler.observe("https://acme.vn/api", 404)
+    assert scheduler.summary()["acme.vn"]["server_errors"] == 1
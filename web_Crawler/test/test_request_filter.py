@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import pytest
+
+from web_Crawler.crawl_website.request_filter import RequestFilter
+from web_Crawler.utils.utils import load_config
+
+
+@pytest.fixture
+def config():
+    root = Path(__file__).resolve().parents[1]  # web_Crawler
+    return load_config(str(root / "config" / "hiring_caffe_config.yaml"))
+
+
+def test_blocks_heavy_resource_types(config):
+    rf = RequestFilter.from_config(config)
+    assert rf.should_block("image", "https://hiring.cafe/logo.png")
+    assert rf.should_block("font", "https://fonts.gstatic.com/s/inter.woff2")
+    assert rf.should_block("media", "https://cdn.example.com/intro.mp4")
+
+
+def test_blocks_tracking_urls_but_keeps_app_data(config):
+    rf = RequestFilter.from_config(config)
+    assert rf.should_block("script", "https://www.googletagmanager.com/gtag/js?id=G-1")
+    assert rf.should_block("fetch", "https://www.google-analytics.com/g/collect?v=2")
+    assert not rf.should_block("fetch", "https://hiring.cafe/api/search-jobs")
+    assert not rf.should_block("document", "https://hiring.cafe/viewjob/abc")
+    assert not rf.should_block("script", "https://hiring.cafe/_next/static/chunks/main.js")
+
+
+def test_allow_patterns_win_and_document_is_never_blocked_by_type():
+    rf = RequestFilter(
+        block_resource_types=["image", "document"],
+        block_url_patterns=[r"cdn\.example\.com"],
+        allow_url_patterns=[r"cdn\.example\.com/keep/"],
+    )
+    assert not rf.should_block("image", "https://cdn.example.com/keep/a.png")
+    assert rf.should_block("script", "https://cdn.example.com/x.js")
+    assert not rf.should_block("document", "https://hiring.cafe/")
+
+
+def test_disabled_by_config():
+    assert RequestFilter.from_config({"BLOCK_RESOURCES": False}) is None
@@ -0,0 +1,116 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from web_Crawler.crawl_website import result_sink
+from web_Crawler.crawl_website.result_sink import (
+    INPROGRESS_SUFFIX,
+    JsonFileSink,
+    JsonlGzSink,
+    ParquetSink,
+    iter_records,
+    iter_sink_records,
+    make_result_sink,
+)
+
+
+def _job(idx):
+    return {
+        "job_url": f"https://hiring.cafe/viewjob/job{idx}",
+        "job_title": f"Engineer {idx}",
+        "company_info": {"Year Founded": "1996"},
+    }
+
+
+def test_json_file_sink_commits_each_write(tmp_path):
+    committed = []
+    sink = JsonFileSink(str(tmp_path), on_commit=committed.extend)
+    sink.write("https://hiring.cafe/viewjob/job1", _job(1))
+    assert committed == ["https://hiring.cafe/viewjob/job1"]
+    files = os.listdir(tmp_path)
+    assert len(files) == 1 and files[0].endswith(".json")
+
+
+def test_jsonl_sink_batches_rotates_and_writes_manifest(tmp_path):
+    committed = []
+    sink = JsonlGzSink(str(tmp_path), batch_size=2, segment_records=3, on_commit=committed.extend)
+    for idx in range(5):
+        sink.write(_job(idx)["job_url"], _job(idx))
+    # Two full batches flushed, the fifth record is still buffered.
+    assert len(committed) == 4
+    sink.close()
+    assert len(committed) == 5
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["records"] == 5
+    assert [segment["records"] for segment in manifest["segments"]] == [3, 2]
+    assert all(segment["path"].startswith("crawl_date=") for segment in manifest["segments"])
+
+    records = list(iter_records(str(tmp_path)))
+    assert [record["job_title"] for record in records] == [f"Engineer {idx}" for idx in range(5)]
+    assert all("crawled_at" in record for record in records)
+
+
+def test_jsonl_sink_recovers_unfinished_segment(tmp_path):
+    sink = JsonlGzSink(str(tmp_path), batch_size=1)
+    sink.write(_job(1)["job_url"], _job(1))
+    sink.write(_job(2)["job_url"], _job(2))
+    # Simulate a crash: the segment is never sealed and its last member is torn.
+    inprogress = [
+        os.path.join(root, name)
+        for root, _, files in os.walk(tmp_path)
+        for name in files
+        if name.endswith(INPROGRESS_SUFFIX)
+    ]
+    assert len(inprogress) == 1
+    with open(inprogress[0], "ab") as f:
+        f.write(gzip.compress(b'{"job_url": "torn"}\n')[:10])
+
+    JsonlGzSink(str(tmp_path))
+    records = list(iter_records(str(tmp_path)))
+    assert [record["job_title"] for record in records] == ["Engineer 1", "Engineer 2"]
+
+
+@pytest.mark.skipif(result_sink.pa is None, reason="pyarrow not installed")
+def test_parquet_sink_commits_on_seal(tmp_path):
+    import pyarrow.parquet as pq
+
+    committed = []
+    sink = ParquetSink(str(tmp_path), batch_size=2, on_commit=committed.extend)
+    for idx in range(3):
+        sink.write(_job(idx)["job_url"], {**_job(idx), "tags": ["a"]})
+    assert committed == []
+    sink.close()
+    assert len(committed) == 3
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    table = pq.read_table(tmp_path / manifest["segments"][0]["path"])
+    assert table.num_rows == 3
+    row = table.to_pylist()[0]
+    assert row["job_title"] == "Engineer 0"
+    assert json.loads(row["company_info"]) == {"Year Founded": "1996"}
+    assert json.loads(row["extra"]) == {"tags": ["a"]}
+
+
+def test_make_result_sink(tmp_path):
+    assert isinstance(make_result_sink({}, str(tmp_path)), JsonFileSink)
+    sink = make_result_sink({"RESULT_SINK": "jsonl"}, str(tmp_path))
+    assert isinstance(sink, JsonlGzSink)
+    assert sink.out_dir == os.path.join(str(tmp_path), "jsonl")
+    with pytest.raises(ValueError):
+        make_result_sink({"RESULT_SINK": "csv"}, str(tmp_path))
+
+
+@pytest.mark.parametrize("kind", ["files", "jsonl", "parquet"])
+def test_iter_sink_records_reads_every_sink(tmp_path, kind):
+    config = {"RESULT_SINK": kind}
+    with make_result_sink(config, str(tmp_path)) as sink:
+        for idx in range(3):
+            sink.write(_job(idx)["job_url"], {**_job(idx), "tags": ["a"]})
+    (tmp_path / "job_links_zigzag_full.json").write_text("[]", encoding="utf-8")
+    records = sorted(iter_sink_records(config, str(tmp_path)), key=lambda r: r["job_url"])
+    assert [r["job_title"] for r in records] == ["Engineer 0", "Engineer 1", "Engineer 2"]
+    assert records[0]["company_info"] == {"Year Founded": "1996"}
+    assert records[0]["tags"] == ["a"]
@@ -0,0 +1,133 @@
+import gzip
+import json
+
+import pytest
+
+from web_Crawler.crawl_website.job_fields import annualize, fold, location_values, parse_salary, split_work_modes
+from web_Crawler.crawl_website.search_index import SearchIndex, match_query
+
+JOBS = [
+    {
+        "job_url": "https://hiring.cafe/viewjob/a1",
+        "job_title": "Senior Python Backend Engineer",
+        "company": "Acme",
+        "location": "Hồ Chí Minh, Vietnam",
+        "work_mode": "Remote · Hybrid",
+        "employment_type": "Full Time",
+        "salary": "$2,500-$4,000/mo",
+        "job_description": "Build payment APIs with Django and PostgreSQL.",
+        "requirements": ["Python", "SQL"],
+        "posted_date": "2025-10-02",
+    },
+    {
+        "job_url": "https://hiring.cafe/viewjob/b2",
+        "job_title": "Frontend Engineer",
+        "company": "Beta",
+        "location": "Hà Nội, Vietnam",
+        "work_mode": "Onsite",
+        "employment_type": "Full Time",
+        "salary": "$18-$29/hr",
+        "job_description": "React dashboards for the payments team.",
+        "posted_date": "2025-10-01",
+    },
+    {
+        "job_url": "https://hiring.cafe/viewjob/c3",
+        "job_title": "Data Engineer",
+        "company": "Gamma",
+        "location": "Đà Nẵng, Vietnam",
+        "work_mode": "Remote",
+        "employment_type": "Contract",
+        "salary": "N/A",
+        "job_description": "Spark pipelines; Python a plus.",
+        "posted_date": "2025-09-28",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("$2,500-$4,000/mo", {"min": 2500, "max": 4000, "currency": "USD", "period": "month"}),
+        ("$80-120k/yr", {"min": 80000, "max": 120000, "currency": "USD", "period": "year"}),
+        ("€60k a year", {"min": 60000, "max": 60000, "currency": "EUR", "period": "year"}),
+        ("VND 20,000,000 - 30,000,000 per month", {"min": 2e7, "max": 3e7, "currency": "VND", "period": "month"}),
+        ("Est 80k-100k/yr", {"min": 80000, "max": 100000, "currency": None, "period": "year"}),
+        ("Pay 50k", {"min": 50000, "max": 50000, "currency": None, "period": None}),
+        ("$100k+ a year", {"min": 100000, "max": 100000, "currency": "USD", "period": "year"}),
+        ("usd 50k", {"min": 50000, "max": 50000, "currency": None, "period": None}),
+        ("Competitive", None),
+        ("N/A", None),
+    ],
+)
+def test_parse_salary(text, expected):
+    assert parse_salary(text) == expected
+
+
+def test_field_helpers():
+    assert annualize(20, "hour") == 41600 and annualize(20, None) is None
+    assert split_work_modes("Remote · Hybrid") == ["Remote", "Hybrid"] and split_work_modes("N/A") == []
+    assert fold("  Đà  Nẵng ") == "da nang"
+    assert location_values(JOBS[0]) == ["Hồ Chí Minh, Vietnam", "Hồ Chí Minh", "Vietnam"]
+    assert match_query("C++ / back-end") == '"c"* "back"* "end"*' and match_query("  ") is None
+
+
+def test_search_ranks_filters_and_counts_facets(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.sqlite3"))
+    assert index.upsert_many(JOBS) == 3
+
+    found = index.search("python")
+    assert [hit["job_id"] for hit in found["results"]] == ["a1", "c3"]  # the title match ranks first
+    assert found["facets"]["work_mode"] == {"Remote": 2, "Hybrid": 1}
+    assert index.search("pay")["total"] == 2  # words match as prefixes
+
+    assert index.search(location="ha noi")["total"] == 1  # accents and case never matter
+    assert index.search(location="vietnam", work_mode="remote")["total"] == 2
+    assert index.search("python", employment_type="contract")["results"][0]["job_id"] == "c3"
+    # $18-29/hr is ~60k a year, $2.5-4k/mo is 48k; Gamma has no salary at all.
+    assert [hit["job_id"] for hit in index.search(salary_min=50000, currency="usd")["results"]] == ["b2"]
+    with pytest.raises(ValueError):
+        index.search(salary_min=50000)  # yearly amounts in different currencies don't compare
+    assert index.search(limit=1, offset=1)["results"][0]["job_id"] == "b2"  # newest first without text
+    assert index.summary()["queries"] == 7
+
+
+def test_salary_and_location_filters_are_literal(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.sqlite3"))
+    index.upsert_many([
+        {**JOBS[0], "salary": "VND 30,000,000 per month"},  # 360M VND a year
+        {**JOBS[1], "location": "Floor_3, 100% Tower"},
+    ])
+    assert index.search(salary_min=100000, currency="USD")["total"] == 0
+    assert index.search(salary_min=100000, currency="VND")["total"] == 1
+    assert index.search(location="100%")["total"] == 1
+    assert index.search(location="%")["total"] == 1  # a literal percent sign, not "anything"
+    assert index.search(location="r_3")["total"] == 1
+    assert index.search(location="h_ chi")["total"] == 0
+
+
+def test_upsert_replaces_and_deltas_apply_once(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.sqlite3"))
+    index.upsert_many(JOBS)
+    index.upsert({**JOBS[0], "job_title": "Go Engineer", "requirements": ["Go"], "work_mode": "Onsite"})
+    assert len(index) == 3
+    assert index.search("django")["results"][0]["job_title"] == "Go Engineer"
+    assert index.search(work_mode="hybrid")["total"] == 0
+
+    deltas = tmp_path / "deltas"
+    deltas.mkdir()
+    lines = [
+        {"op": "removed", "job_url": JOBS[1]["job_url"]},
+        {"op": "added", "job_url": "https://hiring.cafe/viewjob/d4",
+         "record": {"job_title": "Rust Engineer", "location": "Vietnam", "work_mode": "Remote"}},
+        {"op": "changed", "job_url": JOBS[2]["job_url"], "changed_fields": ["salary"]},  # no record: skipped
+    ]
+    with gzip.open(deltas / "delta_20251003_000000.jsonl.gz", "wt", encoding="utf-8") as f:
+        f.writelines(json.dumps(line) + "\n" for line in lines)
+    (deltas / "delta_20251004_000000.jsonl.gz.inprogress").write_text("")
+
+    assert index.apply_deltas(str(deltas)) == (1, 3)
+    assert index.apply_deltas(str(deltas)) == (0, 0)
+    assert index.get(JOBS[1]["job_url"]) is None
+    assert index.search("rust")["results"][0]["job_id"] == "d4"
+    assert index.search(work_mode="remote")["total"] == 2
+    assert index.search()["facets"]["work_mode"] == {"Remote": 2, "Onsite": 1}  # kept up to date by upserts
@@ -0,0 +1,61 @@
+import pytest
+
+from web_Crawler.crawl_website.shard_planner import (
+    merge_shard_results,
+    parse_search_state,
+    plan_shards,
+    with_search_state,
+)
+
+BASE_URL = "https://hiring.cafe/?searchState=%7B%22dateFetchedPastNDays%22%3A-1%7D"
+
+
+def test_with_search_state_merges_into_base_state():
+    url = with_search_state(BASE_URL, {"workplaceTypes": ["Remote"]})
+    assert url.startswith("https://hiring.cafe/?searchState=")
+    assert parse_search_state(url) == {"dateFetchedPastNDays": -1, "workplaceTypes": ["Remote"]}
+
+
+def test_parse_search_state_without_state():
+    assert parse_search_state("https://hiring.cafe/") == {}
+
+
+def test_plan_shards_from_dimensions_and_explicit_entries():
+    shards = plan_shards(
+        shards=[{"name": "recent", "search_state": {"dateFetchedPastNDays": 1}}],
+        dimensions={
+            "workplaceTypes": [["Remote"], ["Onsite"]],
+            "commitmentTypes": [["Full Time"], ["Contract"]],
+        },
+    )
+    assert [shard.name for shard in shards] == [
+        "recent",
+        "workplaceTypes=Remote,commitmentTypes=Full Time",
+        "workplaceTypes=Remote,commitmentTypes=Contract",
+        "workplaceTypes=Onsite,commitmentTypes=Full Time",
+        "workplaceTypes=Onsite,commitmentTypes=Contract",
+    ]
+    assert parse_search_state(shards[4].url(BASE_URL)) == {
+        "dateFetchedPastNDays": -1,
+        "workplaceTypes": ["Onsite"],
+        "commitmentTypes": ["Contract"],
+    }
+
+
+def test_plan_shards_empty_and_duplicate_names():
+    assert plan_shards() == []
+    with pytest.raises(ValueError):
+        plan_shards(shards=[{"name": "a"}, {"name": "a"}])
+
+
+def test_merge_shard_results_counts_overlap():
+    merged, summary = merge_shard_results({
+        "remote": ["j/1", "j/2", "j/3"],
+        "onsite": ["j/3", "j/4"],
+        "empty": [],
+    })
+    assert merged == {"j/1", "j/2", "j/3", "j/4"}
+    assert summary["totals"] == {"shards": 3, "found": 5, "merged": 4, "duplicates": 1}
+    assert summary["shards"]["remote"] == {"found": 3, "unique": 2}
+    assert summary["shards"]["onsite"] == {"found": 2, "unique": 1}
+    assert summary["shards"]["empty"] == {"found": 0, "unique": 0}
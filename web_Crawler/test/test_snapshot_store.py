@@ -0,0 +1,73 @@
+from datetime import datetime
+from pathlib import Path
+
+from web_Crawler.crawl_website import crawl_utils
+from web_Crawler.crawl_website.reparse import reparse_store
+from web_Crawler.crawl_website.result_sink import JsonlGzSink, iter_records
+from web_Crawler.crawl_website.snapshot_store import SnapshotStore
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "viewjob_backend_engineer.html"
+JOB_URL = "https://hiring.cafe/viewjob/backend1"
+
+
+def test_store_dedupes_objects_and_returns_latest_crawl(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    store.put(JOB_URL, {"job_info": "<p>v1</p>", "company_info": None}, crawled_at=100.0)
+    store.put(JOB_URL, {"job_info": "<p>v1</p>", "job_description": "<p>d</p>"},
+              extras={"clicked_website": "https://example.com"}, crawled_at=200.0)
+    assert store.stats == {"snapshots": 2, "objects_written": 2, "objects_reused": 1}
+
+    latest = list(store.latest())
+    assert len(latest) == 1
+    job_url, crawled_at, digests, extras = latest[0]
+    assert (job_url, crawled_at) == (JOB_URL, 200.0)
+    assert set(digests) == {"job_info", "job_description"}
+    assert store.get_object(digests["job_info"]) == "<p>v1</p>"
+    assert extras == {"clicked_website": "https://example.com"}
+    store.close()
+
+
+def test_build_job_record_matches_live_parsers():
+    html = FIXTURE.read_text(encoding="utf-8")
+    soup = crawl_utils.make_soup(html)
+    record = crawl_utils.build_job_record(JOB_URL, {"job_info": html, "company_info": html, "job_description": html})
+    assert record["job_url"] == JOB_URL
+    assert record["job_title"] == crawl_utils.parse_job_sections(soup)["job_title"]
+    assert record["company_info"] == crawl_utils.parse_company_info_table(soup)
+    assert record["job_description"] == crawl_utils.parse_job_description(soup)
+    assert record["company_website"] == (crawl_utils.parse_website_fallback(soup) or "N/A")
+
+    clicked = crawl_utils.build_job_record(JOB_URL, {"job_info": html}, clicked_website="https://acme.example")
+    assert clicked["company_info"] == "N/A"
+    assert clicked["job_description"] == "N/A"
+    assert clicked["company_website"] == "https://acme.example"
+
+
+def test_reparse_store_rebuilds_records(tmp_path):
+    html = FIXTURE.read_text(encoding="utf-8")
+    store_root = str(tmp_path / "snapshots")
+    store = SnapshotStore(store_root)
+    for idx in range(3):
+        store.put(f"{JOB_URL}{idx}", {"job_info": html, "job_description": html})
+    store.close()
+
+    sink = JsonlGzSink(str(tmp_path / "out"))
+    parsed, failed = reparse_store(store_root, sink, workers=2, chunk_size=2)
+    assert (parsed, failed) == (3, 0)
+    records = sorted(iter_records(str(tmp_path / "out")), key=lambda r: r["job_url"])
+    assert [r["job_url"] for r in records] == [f"{JOB_URL}{idx}" for idx in range(3)]
+    assert all(r["job_title"] not in (None, "N/A") for r in records)
+
+
+def test_reparse_resolves_posted_date_against_crawl_time(tmp_path):
+    html = FIXTURE.read_text(encoding="utf-8")  # "Posted 3d ago"
+    crawled_at = datetime(2024, 1, 10, 12, 0, 0).timestamp()
+    store_root = str(tmp_path / "snapshots")
+    store = SnapshotStore(store_root)
+    store.put(JOB_URL, {"job_info": html}, crawled_at=crawled_at)
+    store.close()
+
+    sink = JsonlGzSink(str(tmp_path / "out"))
+    assert reparse_store(store_root, sink, workers=1) == (1, 0)
+    (record,) = iter_records(str(tmp_path / "out"))
+    assert record["posted_date"] == "2024-01-07 12:00:00"
@@ -17,3 +17,51 @@ def test_config(config_path):
     assertpy.assert_that(config).is_not_empty()
     assertpy.assert_that(config).contains_key('BASE_URL')
     print(config['BASE_URL'])
+
+
+def test_queued_logger_writes_through_listener(tmp_path):
+    import json
+    import logging
+    from web_Crawler.utils.utils import prepare_log
+
+    logger = prepare_log("test_queued_json_logger", log_dir=str(tmp_path), json_format=True)
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers)
+    logger.info("hello", extra={"fields": {"links": 3}})
+    # stop() drains the queue; start() again so the atexit stop still has a thread to join
+    (handler,) = logger.handlers
+    handler.listener.stop()
+    handler.listener.start()
+
+    (log_file,) = tmp_path.iterdir()
+    record = json.loads(log_file.read_text(encoding="utf-8").splitlines()[-1])
+    assert record["msg"] == "hello"
+    assert record["links"] == 3
+    assert record["level"] == "INFO"
+
+
+def test_progress_logger_is_rate_limited():
+    import logging
+    from web_Crawler.utils.utils import ProgressLogger
+
+    class Collect(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.records = []
+
+        def emit(self, record):
+            self.records.append(record)
+
+    logger = logging.getLogger("test_progress_logger")
+    logger.setLevel(logging.INFO)
+    handler = Collect()
+    logger.addHandler(handler)
+
+    progress = ProgressLogger(logger, "Discovered links", every=100, interval=3600, unit="links")
+    for _ in range(250):
+        progress.add(1)
+    assert len(handler.records) == 2
+    assert handler.records[-1].fields["total"] == 200
+    progress.close()
+    assert handler.records[-1].fields["total"] == 250
+    assert "250 links" in handler.records[-1].getMessage()
+    logger.removeHandler(handler)
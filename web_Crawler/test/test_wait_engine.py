@@ -0,0 +1,73 @@
+import asyncio
+
+from web_Crawler.crawl_website.wait_engine import WaitEngine
+
+
+class FakePage:
+    """Minimal page stub: selectors in ``present`` resolve, everything else times out."""
+
+    def __init__(self, present=(), quiet=True):
+        self.present = set(present)
+        self.quiet = quiet
+
+    async def wait_for_selector(self, selector, state="visible", timeout=None):
+        if selector not in self.present:
+            raise TimeoutError(f"{selector} not found in {timeout} ms")
+
+    async def evaluate(self, script, arg=None):
+        return self.quiet
+
+
+def test_selector_records_hits_and_timeouts():
+    waits = WaitEngine()
+    page = FakePage(present={"h2.font-extrabold"})
+
+    assert asyncio.run(waits.selector(page, "h2.font-extrabold", name="title")) is True
+    assert asyncio.run(waits.selector(page, "table.table-auto", timeout_ms=10, name="table")) is False
+
+    summary = waits.summary()
+    assert summary["title"]["count"] == 1 and summary["title"]["timeouts"] == 0
+    assert summary["table"]["count"] == 1 and summary["table"]["timeouts"] == 1
+
+
+def test_dom_quiet_falls_back_instead_of_raising():
+    waits = WaitEngine.from_config({"WAIT_QUIET_MS": 100, "WAIT_TIMEOUT_MS": 200})
+    assert waits.quiet_ms == 100 and waits.timeout_ms == 200
+
+    assert asyncio.run(waits.dom_quiet(FakePage(quiet=True))) is True
+    assert asyncio.run(waits.dom_quiet(FakePage(quiet=False))) is False
+    stats = waits.summary()["dom_quiet"]
+    assert stats["count"] == 2
+    assert stats["timeouts"] == 1
+
+
+def test_company_info_retries_go_to_the_crawler_logger(capsys):
+    import logging
+
+    from web_Crawler.crawl_website import crawl_utils
+    from web_Crawler.crawl_website.parse_pool import InlineParser
+    from web_Crawler.utils.metrics import Metrics
+
+    class NoTabPage(FakePage):
+        async def click(self, selector, timeout=None):
+            raise TimeoutError(f"{selector} not clickable")
+
+    class Collect(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+
+    logger = logging.getLogger("test_crawl_utils_logger")
+    logger.propagate = False
+    handler = Collect()
+    logger.addHandler(handler)
+
+    info = asyncio.run(
+        crawl_utils._company_info_tab(NoTabPage(), WaitEngine(), {}, Metrics(), InlineParser(), logger)
+    )
+    assert info == "N/A"
+    assert len(handler.messages) == 4 and "All attempts" in handler.messages[-1]
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,163 @@
+import json
+import math
+import os
+import random
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+RESERVOIR_SIZE = 2048
+
+
+def _key(name, labels):
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _quantile(ordered, q):
+    if not ordered:
+        return None
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prom_labels(labels, **extra):
+    pairs = list(labels) + [(k, str(v)) for k, v in extra.items()]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class _Distribution:
+    """Count/sum/min/max plus a bounded reservoir sample for quantiles."""
+
+    __slots__ = ("count", "total", "min", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.samples = []
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self.samples) < RESERVOIR_SIZE:
+            self.samples.append(value)
+        else:
+            slot = random.randrange(self.count)
+            if slot < RESERVOIR_SIZE:
+                self.samples[slot] = value
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "avg": round(self.total / self.count, 4) if self.count else None,
+            "min": round(self.min, 4) if self.count else None,
+            "p50": round(_quantile(ordered, 0.5), 4) if ordered else None,
+            "p95": round(_quantile(ordered, 0.95), 4) if ordered else None,
+            "max": round(self.max, 4) if self.count else None,
+        }
+
+
+class Metrics:
+    """Timers, counters and value distributions for one crawl run.
+
+    ``timer("navigate")`` records wall seconds under ``stage_seconds{stage="navigate"}``;
+    ``incr`` bumps a labelled counter; ``observe`` adds a value (e.g. links
+    per scroll step) to a distribution. ``write_json`` dumps a run summary
+    and ``write_prometheus`` a text-format file for a textfile collector.
+    """
+
+    def __init__(self, prefix="aair"):
+        self.prefix = prefix
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self.counters = defaultdict(float)
+        self.distributions = defaultdict(_Distribution)
+
+    @contextmanager
+    def timer(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("stage_seconds", time.perf_counter() - started, stage=stage)
+
+    def observe(self, name, value, **labels):
+        self.distributions[_key(name, labels)].add(value)
+
+    def incr(self, name, value=1, **labels):
+        self.counters[_key(name, labels)] += value
+
+    def error(self, stage, exc):
+        """Count an exception by stage and class name."""
+        self.incr("errors", stage=stage, type=type(exc).__name__)
+
+    def counter(self, name, **labels):
+        return self.counters.get(_key(name, labels), 0)
+
+    def summary(self):
+        counters = defaultdict(dict)
+        for (name, labels), value in sorted(self.counters.items()):
+            label_text = ",".join(f"{k}={v}" for k, v in labels) or "total"
+            counters[name][label_text] = int(value) if float(value).is_integer() else value
+        distributions = defaultdict(dict)
+        for (name, labels), dist in sorted(self.distributions.items()):
+            label_text = ",".join(f"{k}={v}" for k, v in labels) or "all"
+            distributions[name][label_text] = dist.summary()
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "elapsed_seconds": round(time.perf_counter() - self._started, 2),
+            "counters": dict(counters),
+            "distributions": dict(distributions),
+        }
+
+    def write_json(self, path, extra=None):
+        """Write the run summary (plus ``extra`` sections such as pool or wait stats)."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        payload = self.summary()
+        payload.update(extra or {})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2, default=str)
+        return path
+
+    def prometheus_text(self):
+        lines = []
+        typed = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            metric = f"{self.prefix}_{name}_total"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_prom_labels(labels)} {value:g}")
+        for (name, labels), dist in sorted(self.distributions.items()):
+            metric = f"{self.prefix}_{name}"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} summary")
+            ordered = sorted(dist.samples)
+            for q in (0.5, 0.95):
+                value = _quantile(ordered, q)
+                if value is not None:
+                    lines.append(f"{metric}{_prom_labels(labels, quantile=q)} {value:g}")
+            lines.append(f"{metric}_sum{_prom_labels(labels)} {dist.total:g}")
+            lines.append(f"{metric}_count{_prom_labels(labels)} {dist.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Write the text exposition format atomically (safe for node_exporter's textfile collector)."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+        return path
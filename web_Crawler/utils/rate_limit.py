@@ -0,0 +1,306 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, at most ``burst`` banked.
+
+    Every request spends one token through ``acquire``, so any number of
+    concurrent workers sharing one bucket stay within the same budget.
+    A ``rate`` of 0 or less disables limiting.
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+        self._lock = asyncio.Lock()
+        self.stats = {"acquired": 0, "waits": 0, "waited_seconds": 0.0}
+
+    @classmethod
+    def per_minute(cls, requests_per_minute, burst=1, clock=time.monotonic):
+        return cls((requests_per_minute or 0) / 60.0, burst, clock)
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, tokens=1):
+        """Take ``tokens`` if available and return 0, else return the seconds until they will be."""
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    async def acquire(self, tokens=1):
+        """Wait until ``tokens`` can be spent; returns the seconds waited."""
+        waited = 0.0
+        # The lock makes waiters queue up in order instead of racing for each refill.
+        async with self._lock:
+            while True:
+                delay = self.reserve(tokens)
+                if not delay:
+                    break
+                await asyncio.sleep(delay)
+                waited += delay
+        self.stats["acquired"] += 1
+        if waited:
+            self.stats["waits"] += 1
+            self.stats["waited_seconds"] = round(self.stats["waited_seconds"] + waited, 3)
+        return waited
+
+
+class AimdLimiter:
+    """Concurrency limit tuned by additive increase / multiplicative decrease.
+
+    Every ``limit`` successes in a row raise the limit by ``increase`` (about
+    +1 per round trip of all slots); an overload signal (429, 5xx, timeout
+    or a latency above ``latency_target``) multiplies it by ``decrease``, at
+    most once per ``cooldown`` seconds so one burst of errors counts once.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=16, increase=1.0, decrease=0.5,
+                 latency_target=None, cooldown=2.0, clock=time.monotonic):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self.clock = clock
+        self.in_flight = 0
+        self._successes = 0
+        self._last_decrease = None
+        self._changed = asyncio.Condition()
+        self.stats = {"increases": 0, "decreases": 0, "max_limit": int(self.limit), "min_limit": int(self.limit)}
+
+    async def acquire(self):
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self):
+        async with self._changed:
+            self.in_flight -= 1
+            self._changed.notify_all()
+
+    def on_success(self, latency=None):
+        """A request finished fine; True when it completed a window of ``limit`` successes."""
+        if self.latency_target and latency is not None and latency > self.latency_target:
+            self.on_overload()
+            return False
+        self._successes += 1
+        if self._successes < int(self.limit):
+            return False
+        self._successes = 0
+        if self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + self.increase)
+            self.stats["increases"] += 1
+            self.stats["max_limit"] = max(self.stats["max_limit"], int(self.limit))
+        return True
+
+    def on_overload(self):
+        """The host pushed back; True when the limit was cut (False inside the cooldown)."""
+        self._successes = 0
+        now = self.clock()
+        if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+            return False
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        self.stats["decreases"] += 1
+        self.stats["min_limit"] = min(self.stats["min_limit"], int(self.limit))
+        return True
+
+
+def is_overload_status(status):
+    return status is not None and (status == 429 or status >= 500)
+
+
+def is_timeout(exc):
+    return isinstance(exc, (asyncio.TimeoutError, TimeoutError)) or type(exc).__name__ == "TimeoutError"
+
+
+class _Ticket:
+    """What the caller learned about one request; ``status`` is optional."""
+
+    __slots__ = ("status",)
+
+    def __init__(self):
+        self.status = None
+
+
+class HostThrottle:
+    """Token bucket plus AIMD concurrency limit for one host.
+
+    ``async with throttle.request() as ticket`` waits for a concurrency slot
+    and a token, times the block, and on exit feeds the outcome back:
+    ``ticket.status`` 429/5xx or a timeout shrink both the concurrency limit
+    and the request rate; successes grow them back towards their maxima.
+    """
+
+    def __init__(self, host, rate=1.0, burst=1, max_rate=None, rate_step=None, concurrency=2,
+                 min_concurrency=1, max_concurrency=8, latency_target=None, decrease=0.5, cooldown=2.0,
+                 clock=time.monotonic):
+        self.host = host
+        self.bucket = TokenBucket(rate, burst, clock)
+        self.min_rate = rate * 0.1 if rate > 0 else 0
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.rate_step = rate_step if rate_step is not None else rate * 0.1
+        self.limiter = AimdLimiter(concurrency, min_concurrency, max_concurrency, decrease=decrease,
+                                   latency_target=latency_target, cooldown=cooldown, clock=clock)
+        self.clock = clock
+        self._created = clock()
+        self.stats = {"requests": 0, "ok": 0, "throttled": 0, "server_errors": 0, "timeouts": 0,
+                      "slow": 0, "errors": 0, "latency_seconds": 0.0}
+
+    def _set_rate(self, rate):
+        self.bucket._refill()  # bank the tokens earned at the old rate first
+        self.bucket.rate = rate
+
+    def _slow_down(self):
+        # The rate follows the limiter, so it shares its cooldown.
+        if self.limiter.on_overload() and self.bucket.rate > 0:
+            self._set_rate(max(self.min_rate, self.bucket.rate * self.limiter.decrease))
+
+    def observe_status(self, status):
+        """Count a response seen outside ``request`` (e.g. a page's XHR); only pushback matters."""
+        if status == 429:
+            self.stats["throttled"] += 1
+            self._slow_down()
+        elif is_overload_status(status):
+            self.stats["server_errors"] += 1
+            self._slow_down()
+
+    def record(self, status=None, latency=None, exc=None):
+        self.stats["requests"] += 1
+        if latency is not None:
+            self.stats["latency_seconds"] += latency
+        if is_overload_status(status):
+            self.observe_status(status)
+        elif exc is not None:
+            if is_timeout(exc):
+                self.stats["timeouts"] += 1
+                self._slow_down()
+            else:
+                self.stats["errors"] += 1
+        else:
+            self.stats["ok"] += 1
+            target = self.limiter.latency_target
+            if target and latency is not None and latency > target:
+                self.stats["slow"] += 1
+                self._slow_down()
+            elif self.limiter.on_success() and 0 < self.bucket.rate < self.max_rate:
+                self._set_rate(min(self.max_rate, self.bucket.rate + self.rate_step))
+
+    @asynccontextmanager
+    async def request(self):
+        await self.limiter.acquire()
+        ticket = _Ticket()
+        started = None
+        try:
+            await self.bucket.acquire()
+            started = self.clock()
+            yield ticket
+        except BaseException as exc:
+            if started is not None and isinstance(exc, Exception):
+                self.record(ticket.status, self.clock() - started, exc)
+            raise
+        else:
+            self.record(ticket.status, self.clock() - started)
+        finally:
+            await self.limiter.release()
+
+    def summary(self):
+        elapsed = max(self.clock() - self._created, 1e-9)
+        done = self.stats["requests"]
+        return {
+            **self.stats,
+            "latency_seconds": round(self.stats["latency_seconds"], 3),
+            "avg_latency": round(self.stats["latency_seconds"] / done, 3) if done else None,
+            "effective_rps": round(self.stats["ok"] / elapsed, 3),
+            "rate": round(self.bucket.rate, 4),
+            "concurrency": int(self.limiter.limit),
+            **{f"concurrency_{k}": v for k, v in self.limiter.stats.items()},
+        }
+
+
+# Defaults for hosts without a HOST_LIMITS entry: gentle, and each host gets its own budget.
+DEFAULT_HOST_LIMITS = {"rate": 1.0, "burst": 2, "concurrency": 2, "max_concurrency": 4}
+
+
+def host_of(url):
+    host = urlsplit(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+class HostScheduler:
+    """One ``HostThrottle`` per host, configured by the longest matching HOST_LIMITS suffix.
+
+    ``request(url)`` gates a request to ``url``'s host. ``attach(context)``
+    also watches every browser response, so 429s and 5xx from a page's own
+    XHR traffic slow that host down too. ``summary()`` reports the
+    effective rate, limits and outcomes per host.
+    """
+
+    def __init__(self, limits=None, default=None, clock=time.monotonic):
+        self.limits = {suffix.lower(): dict(profile) for suffix, profile in (limits or {}).items()}
+        self.default = dict(default or DEFAULT_HOST_LIMITS)
+        self.clock = clock
+        self.throttles = {}
+
+    @classmethod
+    def from_config(cls, config, caps=None):
+        """``caps`` maps a host suffix to a ceiling for its max_concurrency (e.g. the pool size)."""
+        limits = {suffix: dict(profile) for suffix, profile in (config.get("HOST_LIMITS") or {}).items()}
+        default = limits.pop("default", None)
+        for suffix, cap in (caps or {}).items():
+            profile = limits.setdefault(suffix, dict(default or DEFAULT_HOST_LIMITS))
+            profile["max_concurrency"] = min(profile.get("max_concurrency", cap), cap)
+        return cls(limits, default)
+
+    def profile_for(self, host):
+        matches = [s for s in self.limits if host == s or host.endswith("." + s)]
+        return self.limits[max(matches, key=len)] if matches else self.default
+
+    def throttle(self, url_or_host):
+        host = host_of(url_or_host) if "/" in url_or_host else url_or_host.lower()
+        if host not in self.throttles:
+            profile = self.profile_for(host)
+            rate = profile.get("rate", 1.0)
+            self.throttles[host] = HostThrottle(
+                host,
+                rate=rate,
+                burst=profile.get("burst", 1),
+                max_rate=profile.get("max_rate", rate),
+                rate_step=profile.get("rate_step"),
+                concurrency=profile.get("concurrency", 2),
+                min_concurrency=profile.get("min_concurrency", 1),
+                max_concurrency=profile.get("max_concurrency", 8),
+                latency_target=profile.get("latency_target"),
+                decrease=profile.get("decrease", 0.5),
+                cooldown=profile.get("cooldown", 2.0),
+                clock=self.clock,
+            )
+        return self.throttles[host]
+
+    def request(self, url):
+        return self.throttle(url).request()
+
+    def observe(self, url, status):
+        if is_overload_status(status):
+            self.throttle(url).observe_status(status)
+
+    async def attach(self, context):
+        context.on("response", lambda response: self.observe(response.url, response.status))
+
+    def summary(self):
+        return {host: throttle.summary() for host, throttle in sorted(self.throttles.items())}
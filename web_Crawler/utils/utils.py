@@ -1,10 +1,39 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import time
 import yaml
 import os 
 import datetime
 from datetime import datetime
-def prepare_log(name, log_dir):
-    """Prepare a logger that logs to both file and console."""
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; ``extra={"fields": {...}}`` adds structured keys."""
+
+    def format(self, record):
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def prepare_log(name, log_dir, level=logging.INFO, queued=True, json_format=False):
+    """Prepare a logger that logs to both file and console.
+
+    With ``queued`` the logger only puts records on a queue and a
+    ``QueueListener`` thread does the file/console I/O, so logging from the
+    asyncio loop never blocks on disk or terminal writes. ``json_format``
+    writes JSON lines instead of text.
+    """
     os.makedirs(log_dir, exist_ok=True)
 
     # Log filename by date
@@ -13,23 +42,79 @@ def prepare_log(name, log_dir):
     # Configure format
     log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
+    formatter = JsonFormatter() if json_format else logging.Formatter(log_format, date_format)
 
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(level)
 
     # Prevent duplicate handlers
     if not logger.handlers:
         # File handler
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setFormatter(logging.Formatter(log_format, date_format))
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(formatter)
 
         # Console handler
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter(log_format, date_format))
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(formatter)
+
+        if queued:
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(
+                log_queue, file_handler, console_handler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.listener = listener
+            logger.addHandler(queue_handler)
+        else:
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
 
     return logger
+
+
+class ProgressLogger:
+    """Rate-limited progress lines for hot paths.
+
+    ``add(n)`` only counts; one INFO line with the running total and the
+    rate since the previous line is emitted every ``every`` items or
+    ``interval`` seconds, whichever comes first. ``close`` logs the total.
+    """
+
+    def __init__(self, logger, label, every=500, interval=10.0, unit="items"):
+        self.logger = logger
+        self.label = label
+        self.every = max(1, int(every))
+        self.interval = interval
+        self.unit = unit
+        self.total = 0
+        self._started = self._last_time = time.perf_counter()
+        self._last_total = 0
+
+    def add(self, count=1):
+        self.total += count
+        now = time.perf_counter()
+        if self.total - self._last_total >= self.every or (count and now - self._last_time >= self.interval):
+            self._emit(now)
+
+    def _emit(self, now):
+        window = max(now - self._last_time, 1e-9)
+        rate = (self.total - self._last_total) / window
+        self.logger.info(
+            f"📈 {self.label}: {self.total} {self.unit} ({rate:.1f}/s)",
+            extra={"fields": {"progress": self.label, "total": self.total, "rate_per_s": round(rate, 2)}},
+        )
+        self._last_time = now
+        self._last_total = self.total
+
+    def close(self):
+        now = time.perf_counter()
+        elapsed = max(now - self._started, 1e-9)
+        self.logger.info(
+            f"✅ {self.label}: {self.total} {self.unit} in {elapsed:.1f}s ({self.total / elapsed:.1f}/s)",
+            extra={"fields": {"progress": self.label, "total": self.total, "seconds": round(elapsed, 2)}},
+        )
 def load_config(config_path):
     """Load YAML configuration file."""
     with open(config_path, "r", encoding="utf-8") as f: